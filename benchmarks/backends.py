@@ -0,0 +1,82 @@
+# Solved-AF -- Copyright (C) 2020  David Simon Tetruashvili
+
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Benchmark the SAT solver backends of solved-af against each other on
+    random frameworks of increasing size.
+
+    usage: python benchmarks/backends.py [ NUM_OF_ARGUMENTS ... ]
+
+    The external backend is only run if SAT_COMMAND is in the PATH.
+"""
+
+import random
+import shutil
+import sys
+import time
+
+import saf.tasks as tasks
+from saf.framework import ListGraphFramework as Framework
+
+SIZES = [10, 25, 50, 100, 200]
+TASKS = ['SE-CO', 'EE-CO', 'SE-ST', 'EE-ST', 'EE-PR']
+ATTACKS_PER_ARGUMENT = 2
+SEED = 2020
+
+
+def randomFramework(num_of_arguments, seed=SEED):
+    """Generate a random framework in which each argument attacks
+        ATTACKS_PER_ARGUMENT arguments on average.
+    """
+
+    rand = random.Random(seed)
+    arguments = [F'a{i}' for i in range(num_of_arguments)]
+    attacks = {(rand.choice(arguments), rand.choice(arguments))
+               for _ in range(num_of_arguments * ATTACKS_PER_ARGUMENT)}
+    return Framework(arguments, sorted(attacks))
+
+
+def timeTask(task_name, framework, backend):
+    task_method = tasks.getTaskMethod(task_name)
+    tasks.setSolverBackend(backend)
+
+    start = time.perf_counter()
+    solution = task_method(framework)
+    if task_name.startswith('EE'):
+        solution = list(solution)
+
+    return time.perf_counter() - start
+
+
+def main():
+    sizes = [int(size) for size in sys.argv[1:]] or SIZES
+    backends = ['cdcl']
+    if shutil.which(tasks.SAT_COMMAND[0]):
+        backends.append('external')
+    else:
+        print(F'{tasks.SAT_COMMAND[0]} not found, '
+              'benchmarking the cdcl backend only.\n')
+
+    print('TASK,ARGUMENTS,' + ','.join(backends))
+    for task_name in TASKS:
+        for size in sizes:
+            framework = randomFramework(size)
+            timings = [timeTask(task_name, framework, backend)
+                       for backend in backends]
+            print(F'{task_name},{size},' +
+                  ','.join(F'{timing:.4f}' for timing in timings))
+
+
+if __name__ == "__main__":
+    main()
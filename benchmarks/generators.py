@@ -0,0 +1,214 @@
+# Solved-AF -- Copyright (C) 2020  David Simon Tetruashvili
+
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Seeded generators of synthetic argumentation frameworks for the
+    benchmarks of solved-af. Every generator returns the argument names
+    and the attacks (as pairs of names) of a framework with about the
+    given number of arguments, the same for the same seed.
+
+    usage: python benchmarks/generators.py FAMILY NUM_OF_ARGUMENTS [ SEED ]
+
+    which writes the generated framework to stdout in TGF.
+"""
+
+import math
+import random
+import sys
+
+SEED = 2020
+
+
+def _names(num_of_arguments):
+    return [F'a{i}' for i in range(num_of_arguments)]
+
+
+def erdosRenyi(num_of_arguments, seed=SEED, attack_probability=None):
+    """Generate a random (Erdős–Rényi) framework, in which each ordered
+        pair of arguments (including an argument with itself) is an
+        attack independently with the same probability. The pairs are
+        skipped over geometrically, in time linear in the number of
+        attacks (Batagelj and Brandes, 2005).
+
+    Keyword Arguments:
+        attack_probability {float} -- the probability of each attack;
+            None indicates 2 attacks per argument on average
+            (default: {None})
+    """
+
+    rand = random.Random(seed)
+    arguments = _names(num_of_arguments)
+    if attack_probability is None:
+        attack_probability = min(1.0, 2 / max(1, num_of_arguments))
+
+    attacks = []
+    num_of_pairs = num_of_arguments ** 2
+    if attack_probability >= 1:
+        pairs = range(num_of_pairs)
+    else:
+        pairs = []
+        log_complement = math.log(1 - attack_probability)
+        pair = -1
+        while True:
+            pair += 1 + int(math.log(1 - rand.random()) / log_complement)
+            if pair >= num_of_pairs:
+                break
+            pairs.append(pair)
+
+    for pair in pairs:
+        attacker, attacked = divmod(pair, num_of_arguments)
+        attacks.append((arguments[attacker], arguments[attacked]))
+    return arguments, attacks
+
+
+def grid(num_of_arguments, seed=SEED, mutual_probability=0.3):
+    """Generate a grid framework, whose arguments are laid out on a
+        square-ish grid and attack their horizontal and vertical
+        neighbours in a random direction, or in both directions.
+
+    Keyword Arguments:
+        mutual_probability {float} -- the probability of neighbours
+            attacking each other (default: {0.3})
+    """
+
+    rand = random.Random(seed)
+    columns = max(1, int(math.sqrt(num_of_arguments)))
+    arguments = _names(num_of_arguments)
+
+    attacks = []
+    for i in range(num_of_arguments):
+        neighbours = []
+        if (i + 1) % columns and i + 1 < num_of_arguments:
+            neighbours.append(i + 1)
+        if i + columns < num_of_arguments:
+            neighbours.append(i + columns)
+        for j in neighbours:
+            if rand.random() < mutual_probability:
+                attacks.append((arguments[i], arguments[j]))
+                attacks.append((arguments[j], arguments[i]))
+            elif rand.random() < 0.5:
+                attacks.append((arguments[i], arguments[j]))
+            else:
+                attacks.append((arguments[j], arguments[i]))
+    return arguments, attacks
+
+
+def scaleFree(num_of_arguments, seed=SEED, attacks_per_argument=2):
+    """Generate a scale-free framework by preferential attachment
+        (Barabási and Albert, 1999): each new argument is linked to
+        existing arguments picked with probability proportional to
+        their number of links, and each link is an attack in a random
+        direction.
+
+    Keyword Arguments:
+        attacks_per_argument {int} -- the number of links of each new
+            argument (default: {2})
+    """
+
+    rand = random.Random(seed)
+    arguments = _names(num_of_arguments)
+
+    # Every argument appears here once per link it has (plus once), so
+    # that a uniform pick from it is a preferential one
+    endpoints = []
+    attacks = set()
+    for i in range(num_of_arguments):
+        targets = {rand.choice(endpoints)
+                   for _ in range(min(i, attacks_per_argument))}
+        for j in targets:
+            if rand.random() < 0.5:
+                attacks.add((arguments[i], arguments[j]))
+            else:
+                attacks.add((arguments[j], arguments[i]))
+            endpoints.append(j)
+        endpoints.extend([i] * (len(targets) + 1))
+    return arguments, sorted(attacks)
+
+
+def sccChained(num_of_arguments, seed=SEED, scc_size=8,
+               inner_probability=0.3, forward_probability=0.05):
+    """Generate a framework of a chain of strongly connected components:
+        the arguments are split into SCCs (each made strongly connected
+        by a cycle through it, with random attacks added inside it),
+        and the arguments of each SCC attack those of the next SCC at
+        random.
+
+    Keyword Arguments:
+        scc_size {int} -- the number of arguments per SCC
+            (default: {8})
+        inner_probability {float} -- the probability of each further
+            attack inside an SCC (default: {0.3})
+        forward_probability {float} -- the probability of each attack
+            from an SCC to the next (default: {0.05})
+    """
+
+    rand = random.Random(seed)
+    arguments = _names(num_of_arguments)
+    sccs = [arguments[i:i + scc_size]
+            for i in range(0, num_of_arguments, scc_size)]
+
+    attacks = set()
+    for k, scc in enumerate(sccs):
+        if len(scc) > 1:
+            attacks.update(zip(scc, scc[1:] + scc[:1]))
+        attacks.update((attacker, attacked) for attacker in scc
+                       for attacked in scc
+                       if rand.random() < inner_probability)
+        if k + 1 < len(sccs):
+            attacks.update((attacker, attacked) for attacker in scc
+                           for attacked in sccs[k + 1]
+                           if rand.random() < forward_probability)
+    return arguments, sorted(attacks)
+
+
+_families = {
+    # Here list the framework families along with their generators.
+    'erdos-renyi': erdosRenyi,
+    'grid': grid,
+    'scale-free': scaleFree,
+    'scc-chained': sccChained
+}
+
+
+def getFamilies():
+    return list(_families.keys())
+
+
+def generate(family, num_of_arguments, seed=SEED):
+    """Generate a framework of a family.
+
+    Returns:
+        Tuple[List[str], List[Tuple[str, str]]] -- the argument names
+            and the attacks
+    """
+
+    return _families[family](num_of_arguments, seed)
+
+
+def main():
+    if len(sys.argv) < 3 or sys.argv[1] not in _families:
+        sys.stderr.write('usage: python benchmarks/generators.py '
+                         F'{{{", ".join(getFamilies())}}} '
+                         'NUM_OF_ARGUMENTS [ SEED ]\n')
+        sys.exit(1)
+
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else SEED
+    arguments, attacks = generate(sys.argv[1], int(sys.argv[2]), seed)
+    sys.stdout.write(''.join(F'{arg}\n' for arg in arguments) + '#\n' +
+                     ''.join(F'{attacker} {attacked}\n'
+                             for attacker, attacked in attacks))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# Solved-AF -- Copyright (C) 2020  David Simon Tetruashvili
+
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Benchmark the maximal extension filtering of solved-af (by the
+    ExtensionIndex) against pairwise comparison of the extensions on
+    random extensions of increasing number.
+
+    usage: python benchmarks/maximality.py [ NUM_OF_EXTENSIONS ... ]
+
+    The pairwise filtering is quadratic and is only run for up to
+    PAIRWISE_LIMIT extensions.
+"""
+
+import random
+import sys
+import time
+
+from saf.framework import getAllMaximal, isIncluded
+
+SIZES = [1000, 10000, 100000]
+NUM_OF_ARGUMENTS = 60
+MEAN_EXTENSION_SIZE = 12
+PAIRWISE_LIMIT = 10000
+SEED = 2020
+
+
+def randomExtensions(num_of_extensions, seed=SEED):
+    """Generate random extensions whose sizes are spread around
+        MEAN_EXTENSION_SIZE, so that many include one another.
+    """
+
+    rand = random.Random(seed)
+    arguments = range(1, NUM_OF_ARGUMENTS + 1)
+    return [frozenset(rand.sample(arguments, min(NUM_OF_ARGUMENTS,
+                      max(0, int(rand.gauss(MEAN_EXTENSION_SIZE, 4))))))
+            for _ in range(num_of_extensions)]
+
+
+def pairwiseMaximal(extensions):
+    """Filter the maximal extensions by comparing each extension against
+        all currently maximal ones.
+    """
+
+    currently_maximal = set()
+    for ext in extensions:
+        non_maximal = []
+        for other in currently_maximal:
+            if isIncluded(ext, other):
+                break
+            elif isIncluded(other, ext):
+                non_maximal.append(other)
+        else:
+            currently_maximal.difference_update(non_maximal)
+            currently_maximal.add(ext)
+
+    return currently_maximal
+
+
+def timeFilter(filter_function, extensions):
+    start = time.perf_counter()
+    maximal = filter_function(extensions)
+    return time.perf_counter() - start, len(maximal)
+
+
+def main():
+    sizes = [int(size) for size in sys.argv[1:]] or SIZES
+
+    print('EXTENSIONS,MAXIMAL,index,pairwise')
+    for size in sizes:
+        extensions = randomExtensions(size)
+        index_time, num_of_maximal = timeFilter(getAllMaximal, extensions)
+        if size <= PAIRWISE_LIMIT:
+            pairwise_time, _ = timeFilter(pairwiseMaximal, extensions)
+            pairwise = F'{pairwise_time:.4f}'
+        else:
+            pairwise = ''
+        print(F'{size},{num_of_maximal},{index_time:.4f},{pairwise}')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+# Solved-AF -- Copyright (C) 2020  David Simon Tetruashvili
+
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""The benchmark suite of solved-af: time every task on the synthetic
+    frameworks of benchmarks/generators.py across the framework
+    representations and SAT solver backends, and compare the results of
+    two runs for regressions.
+
+    usage: python benchmarks/suite.py run [ -o RESULTS_FILE ]
+                                          [ --families FAMILY ... ]
+                                          [ --sizes N ... ] [ --seeds S ... ]
+                                          [ --tasks TASK ... ]
+                                          [ --representations REP ... ]
+                                          [ --backends BACKEND ... ]
+                                          [ --repeat N ] [ --timeout SECONDS ]
+
+           python benchmarks/suite.py compare BASE_RESULTS NEW_RESULTS
+                                              [ --threshold RATIO ]
+                                              [ --min-time SECONDS ]
+
+    The results are written as JSON: the run's parameters and
+    environment under "meta", and under "results" one entry per
+    benchmark with its solving time (the least of the repeats), its
+    status (see saf.tasks.budgetStatus) and a summary of its solution
+    (the number of extensions, the size of the extension or the
+    decision). The external backend is only run if SAT_COMMAND is in
+    the PATH.
+
+    A comparison lists the benchmarks which got slower by more than the
+    threshold ratio (and the minimum time), those which no longer
+    complete, and those whose solution has changed, and exits with 1 if
+    there is any.
+"""
+
+import argparse
+import json
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import time
+
+import saf.tasks as tasks
+from generators import SEED, generate, getFamilies
+from saf.framework import getRepresentation, getRepresentations
+
+SIZES = [20, 50, 100]
+REPEAT = 3
+TIMEOUT = 10.0
+THRESHOLD = 1.25
+MIN_TIME = 0.005
+
+# The fields identifying a benchmark in the results
+KEY_FIELDS = ('family', 'size', 'seed', 'task', 'representation',
+              'backend')
+
+
+def _summary(solution, task_name):
+    """Summarise a solution for comparing it between runs."""
+
+    if task_name.startswith('EE'):
+        return len(solution)
+    if task_name.startswith('SE'):
+        return None if solution is None else len(solution)
+    return solution
+
+
+def runBenchmark(framework, task_name, argument, repeat, timeout):
+    """Time a task on a framework, releasing the framework's memoized
+        results between the repeats.
+
+    Returns:
+        Dict -- the time, status and solution summary of the benchmark
+    """
+
+    times = []
+    for _ in range(repeat):
+        framework.release()
+        start = time.perf_counter()
+        solution, status = tasks.solveTaskWithinBudget(
+            framework, task_name, argument, time_limit=timeout)
+        times.append(time.perf_counter() - start)
+        if status != tasks.COMPLETE:
+            break
+
+    return {'time': round(min(times), 6), 'status': status,
+            'solution': _summary(solution, task_name)}
+
+
+def runSuite(families, sizes, seeds, task_names, representations,
+             backends, repeat=REPEAT, timeout=TIMEOUT):
+    """Run the benchmarks of every combination of the given families,
+        sizes, seeds, tasks, representations and backends, reporting
+        each as a CSV line to stdout as it finishes.
+
+    Returns:
+        List[Dict] -- the results of the benchmarks
+    """
+
+    results = []
+    print(','.join(KEY_FIELDS + ('time', 'status')))
+    for family in families:
+        for size in sizes:
+            for seed in seeds:
+                arguments, attacks = generate(family, size, seed)
+                # The query argument of the decision tasks
+                argument = random.Random(seed).choice(arguments)
+
+                for representation in representations:
+                    start = time.perf_counter()
+                    framework = getRepresentation(representation)(
+                        arguments, attacks)
+                    build_time = time.perf_counter() - start
+
+                    for backend in backends:
+                        tasks.setSolverBackend(backend)
+                        for task_name in task_names:
+                            is_decision = task_name[0] == 'D'
+                            result = dict(zip(KEY_FIELDS, (
+                                family, size, seed, task_name,
+                                representation, backend)))
+                            result['argument'] = argument \
+                                if is_decision else None
+                            result['build_time'] = round(build_time, 6)
+                            result.update(runBenchmark(
+                                framework, task_name,
+                                argument if is_decision else None,
+                                repeat, timeout))
+                            results.append(result)
+                            print(','.join(str(result[field]) for field
+                                           in KEY_FIELDS + ('time',
+                                                            'status')))
+                            sys.stdout.flush()
+    return results
+
+
+def _gitCommit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'],
+                              capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compareResults(base_results, new_results, threshold=THRESHOLD,
+                   min_time=MIN_TIME):
+    """Compare the results of two runs of the suite.
+
+    Returns:
+        List[Tuple[str, Dict, Dict]] -- the kind of each finding
+            ('slower', 'faster', 'status', 'solution', 'missing') along
+            with the base and new results it concerns
+    """
+
+    def key(result):
+        return tuple(result[field] for field in KEY_FIELDS)
+
+    new_by_key = {key(result): result for result in new_results}
+
+    findings = []
+    for base in base_results:
+        new = new_by_key.get(key(base))
+        if new is None:
+            findings.append(('missing', base, None))
+        elif base['status'] == tasks.COMPLETE != new['status']:
+            findings.append(('status', base, new))
+        elif base['status'] == tasks.COMPLETE == new['status'] and \
+                base['solution'] != new['solution']:
+            findings.append(('solution', base, new))
+        elif new['time'] - base['time'] > min_time and \
+                new['time'] > base['time'] * threshold:
+            findings.append(('slower', base, new))
+        elif base['time'] - new['time'] > min_time and \
+                base['time'] > new['time'] * threshold:
+            findings.append(('faster', base, new))
+    return findings
+
+
+# The kinds of findings which fail a comparison
+REGRESSIONS = ('slower', 'status', 'solution')
+
+
+def _run(args):
+    backends = args.backends
+    if backends is None:
+        backends = ['cdcl']
+        if shutil.which(tasks.SAT_COMMAND[0]):
+            backends.append('external')
+        else:
+            print(F'{tasks.SAT_COMMAND[0]} not found, '
+                  'benchmarking the cdcl backend only.\n')
+
+    results = runSuite(args.families, args.sizes, args.seeds, args.tasks,
+                       args.representations, backends, args.repeat,
+                       args.timeout)
+
+    meta = {'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'commit': _gitCommit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat, 'timeout': args.timeout}
+    with open(args.output, 'w') as file:
+        json.dump({'meta': meta, 'results': results}, file, indent=1)
+
+
+def _compare(args):
+    with open(args.base) as base_file, open(args.new) as new_file:
+        base_results = json.load(base_file)['results']
+        new_results = json.load(new_file)['results']
+
+    findings = compareResults(base_results, new_results, args.threshold,
+                              args.min_time)
+
+    for kind, base, new in findings:
+        benchmark = ' '.join(str(base[field]) for field in KEY_FIELDS)
+        if kind in ('slower', 'faster'):
+            detail = F'{base["time"]:.4f}s -> {new["time"]:.4f}s ' \
+                     F'({new["time"] / max(base["time"], 1e-9):.2f}x)'
+        elif kind == 'status':
+            detail = F'{base["status"]} -> {new["status"]}'
+        elif kind == 'solution':
+            detail = F'{base["solution"]} -> {new["solution"]}'
+        else:
+            detail = 'not in the new results'
+        flag = 'REGRESSION' if kind in REGRESSIONS else 'note'
+        print(F'{flag} {kind}: {benchmark}: {detail}')
+
+    regressions = sum(1 for kind, _, _ in findings if kind in REGRESSIONS)
+    print(F'{len(base_results)} benchmarks compared, '
+          F'{regressions} regression(s).')
+    return 1 if regressions else 0
+
+
+def _initialiseArgumentParser():
+    parser = argparse.ArgumentParser(
+        description='Run or compare the solved-af benchmark suite.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='Run the benchmarks')
+    run.add_argument('-o', '--output', default='benchmark-results.json',
+                     help='Path of the JSON results file to write')
+    run.add_argument('--families', nargs='+', default=getFamilies(),
+                     choices=getFamilies())
+    run.add_argument('--sizes', nargs='+', type=int, default=SIZES,
+                     help='Numbers of arguments of the frameworks')
+    run.add_argument('--seeds', nargs='+', type=int, default=[SEED])
+    run.add_argument('--tasks', nargs='+', default=tasks.getTasks(),
+                     choices=tasks.getTasks())
+    run.add_argument('--representations', nargs='+',
+                     default=getRepresentations(),
+                     choices=getRepresentations())
+    run.add_argument('--backends', nargs='+',
+                     choices=tasks.getSolverBackends())
+    run.add_argument('--repeat', type=int, default=REPEAT,
+                     help='Number of runs of each benchmark, of which the \
+                         fastest is recorded')
+    run.add_argument('--timeout', type=float, default=TIMEOUT,
+                     help='Time budget of each run in seconds')
+
+    compare = commands.add_parser('compare',
+                                  help='Compare two results files')
+    compare.add_argument('base', help='Results file of the baseline')
+    compare.add_argument('new', help='Results file to compare with it')
+    compare.add_argument('--threshold', type=float, default=THRESHOLD,
+                         help='Ratio of the times over which a benchmark \
+                             counts as slower')
+    compare.add_argument('--min-time', type=float, default=MIN_TIME,
+                         help='Difference of the times in seconds under \
+                             which a benchmark never counts as slower')
+    return parser
+
+
+def main():
+    args = _initialiseArgumentParser().parse_args()
+    if args.command == 'run':
+        _run(args)
+    else:
+        sys.exit(_compare(args))
+
+
+if __name__ == "__main__":
+    main()
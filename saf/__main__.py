@@ -1,6 +1,11 @@
 """
-usage: solved-af [ -h ] -p TASK -f INPUTFILE -fo {tgf, apx}
-                        [ -a QUERYARGUMENT ]
+usage: solved-af [ -h ] -p TASK -f INPUTFILE -fo {tgf, apx, bin}
+                        [ -a QUERYARGUMENT | --arguments QUERYARGUMENT ...
+                        | --all-arguments ] [ -r {list, array, bitset} ]
+                        [ -s {external, cdcl} ] [ --scc ] [ --workers N ]
+                        [ --portfolio [ FILE ] ] [ --portfolio-log PATH ]
+                        [ --timeout SECONDS ] [ --memory-limit MB ]
+                        [ --preprocess ] [ --cache ] [ --stats [ FILE ] ]
                         [ --formats][ --problems][ -v ]
 
 required arguments:
@@ -8,15 +13,40 @@ required arguments:
   Argrumentation framework problem task to solve
   -f INPUTFILE, --inputFile INPUTFILE
   Path to file containing an argumentation framework encoding
-  -fo {tgf, apx}, --fileFormat {tgf, apx}
-  Input file format
+  -fo {tgf, apx, bin}, --fileFormat {tgf, apx, bin}
+  Input file format (bin: binary framework, see saf/binary.py)
 
 optional arguments:
   -a QUERYARGUMENT, --argument QUERYARGUMENT
   Argument to check acceptance for
+  --arguments QUERYARGUMENT ...
+  Arguments to check acceptance for, output one per line
+  --all-arguments       Check acceptance for all arguments, one per line
   --formats             List all supported input file formats and exit
   --problems            List all supported problems tasks and exit
   -v, --validate        Validate the input file before parsing
+  -r {list, array, bitset}, --representation {list, array, bitset}
+  Framework representation to solve with (default: list)
+  -s {external, cdcl}, --solver {external, cdcl}
+  SAT solver backend to solve with (default: external)
+  --scc                 Solve SCC by SCC in topological order
+  --workers N           Solve the weakly connected components in N worker
+                        processes in parallel (0: one per CPU core)
+  --portfolio [ FILE ]  Race the solver configurations of a JSON portfolio
+                        file (default: cdcl/external, each with and
+                        without --preprocess) on an SE/DC/DS task
+  --portfolio-log PATH  Append the winner of each race to PATH (JSON lines)
+  --timeout SECONDS     Stop solving after SECONDS of wall-clock time
+  --memory-limit MB     Stop solving once MB of memory are used
+                        (with either, the output found so far is followed
+                        by a status line: complete, partial, timeout or
+                        memout)
+  --preprocess          Leave grounded-decided arguments out of encodings
+  --cache               Load from/save to a binary sidecar cache
+  --stats [ FILE ]      Write the time spent in each phase (parse,
+                        construct, encode, solve, extract, maximal) and
+                        counters (solver calls, clauses, variables,
+                        extensions, cache hits) as JSON to FILE or stderr
 """
 
 # Solved-AF -- Copyright (C) 2020  David Simon Tetruashvili
@@ -37,8 +67,11 @@ optional arguments:
 import sys
 
 import saf.io as io
+import saf.parallel as parallel
+import saf.portfolio as portfolio
+import saf.stats as stats
 import saf.tasks as tasks
-from saf.framework import ListGraphFramework as Framework
+from saf.framework import getRepresentation
 
 NAME = 'Solved-AF'
 VERSION = 0.1
@@ -55,31 +88,119 @@ def main():
 
     args = io.parseArguments()
 
-    arguments, attack_relation = io.parseInput(
-        args.inputFile, format=args.fileFormat, validate=args.validate)
+    tasks.setSolverBackend(args.solver)
+    tasks.setPreprocessing(args.preprocess)
 
-    af = Framework(arguments, attack_relation)
+    budgeted = args.timeout is not None or args.memory_limit is not None
+    if budgeted:
+        tasks.setBudget(tasks.Budget(
+            args.timeout, None if args.memory_limit is None
+            else args.memory_limit * 2 ** 20))
+
+    if args.stats is not None:
+        stats.reset()
+        stats.enable()
 
     task_name = args.problemTask.upper()
-    task_type = task_name[:2]
-
-    parsed_solution = None
-
-    if args.argument is None:
-        # Assuming an enumeration problem
-        taskMethod = tasks.getTaskMethod(task_name, is_enumeration=True)
-        solution = taskMethod(af)
-        if task_type == 'SE' and solution is not None:
-            parsed_solution = af.valuesToArguments(solution)
-        elif task_type == 'EE':
-            parsed_solution = [af.valuesToArguments(ext) for ext in solution]
+    try:
+        if not budgeted:
+            af = _load(args)
+            _run(args, af, task_name)
+            return
+
+        # The part of the solution found within the budget is output,
+        # followed by its status marker
+        try:
+            af = _load(args)
+            _run(args, af, task_name)
+            status = tasks.budgetStatus(task_name)
+        except tasks.BudgetExceeded as e:
+            status = tasks.budgetStatus(task_name, e)
+        sys.stdout.write(status + '\n')
+        sys.stdout.flush()
+    finally:
+        # The framework is still alive here, so are its scoped caches
+        if args.stats is not None:
+            stats.writeStats(args.stats)
+
+
+def _load(args):
+    """Load the framework given on the command line."""
+
+    return io.loadFramework(args.inputFile, format=args.fileFormat,
+                            validate=args.validate,
+                            representation=getRepresentation(
+                                args.representation),
+                            cache=args.cache)
+
+
+def _run(args, af, task_name):
+    """Solve the task given on the command line on the framework."""
+
+    queries = [args.argument] if args.argument is not None else []
+    queries += args.arguments or []
+    for argument in queries:
+        if not af.hasArgument(argument):
+            sys.stderr.write(F'Argument "{argument}" is not in the '
+                             'framework!')
+            sys.stderr.flush()
+            sys.exit(1)
+
+    if args.argument is not None and (args.arguments is not None or
+                                      args.all_arguments):
+        sys.stderr.write('The \'-a\' option cannot be combined with '
+                         'the \'--arguments\' or \'--all-arguments\' '
+                         'options!')
+        sys.stderr.flush()
+        sys.exit(1)
+
+    if args.portfolio is not None and (args.arguments is not None or
+                                       args.all_arguments):
+        sys.stderr.write('The \'--portfolio\' option cannot be combined '
+                         'with the \'--arguments\' or '
+                         '\'--all-arguments\' options!')
+        sys.stderr.flush()
+        sys.exit(1)
+
+    tasks.checkBudget()
+    _solve(args, af, task_name)
+
+
+def _solve(args, af, task_name):
+    """Solve the task given on the command line and output its
+        solution.
+    """
+
+    if args.arguments is not None or args.all_arguments:
+        arguments = None if args.all_arguments else args.arguments
+        if args.workers is None:
+            decisions = tasks.solveDecisions(af, task_name, arguments,
+                                             decompose=args.scc)
+        else:
+            decisions = parallel.solveDecisions(af, task_name, arguments,
+                                                workers=args.workers,
+                                                decompose=args.scc)
+        # The solution is only output if it is found within the budget
+        tasks.checkBudget()
+        io.outputDecisions(decisions)
+        return
+
+    if args.portfolio is not None:
+        configurations = portfolio.loadPortfolio(args.portfolio) \
+            if args.portfolio else None
+        parsed_solution = portfolio.solveTask(
+            af, task_name, args.argument, configurations=configurations,
+            log_path=args.portfolio_log, instance=args.inputFile)
+    elif args.workers is None:
+        parsed_solution = tasks.solveTask(af, task_name, args.argument,
+                                          decompose=args.scc)
     else:
-        # Assuming a decision problem
-        taskMethod = tasks.getTaskMethod(task_name, is_enumeration=False)
-        argument_value = af.argumentToValue(args.argument)
-        parsed_solution = taskMethod(af, argument_value)
+        parsed_solution = parallel.solveTask(af, task_name, args.argument,
+                                             workers=args.workers,
+                                             decompose=args.scc)
 
-    io.outputSolution(parsed_solution, task_type)
+    tasks.checkBudget()
+    io.outputSolution(parsed_solution, task_name[:2])
 
 
 def _showAbout():
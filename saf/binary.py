@@ -0,0 +1,292 @@
+# Solved-AF -- Copyright (C) 2020  David Simon Tetruashvili
+
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""This module provides solved-af with a compact binary format for
+    argumentation frameworks, which is loaded by memory-mapping it
+    rather than parsing it, e.g., as a sidecar cache of a TGF/APX file.
+
+    A file in the format consists of the header (see HEADER), followed
+    by the CSR arrays of 32-bit integers of ArrayGraphFramework (in the
+    byte order given by the header) and the argument names, UTF-8
+    encoded and separated by newlines:
+
+        attacking_ptr   int32[num_of_arguments + 1]
+        attacking       int32[num_of_attacks]
+        attacked_by_ptr int32[num_of_arguments + 1]
+        attacked_by     int32[num_of_attacks]
+        names           bytes[names_size]
+
+    The header holds the size, modification time and SHA-256 digest of
+    the file the framework was parsed from, so that a sidecar cache can
+    be checked for being up to date with it (see isUpToDate). The
+    digest is of the source file: the framework data of a binary file
+    is not hashed, and loading it only checks that its size matches
+    the header and that its CSR arrays span its attacks.
+
+    usage: python -m saf.binary -f INPUT_FILE -fo FORMAT [-o OUTPUT_FILE]
+"""
+
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from saf.framework import ArrayGraphFramework
+
+MAGIC = b'SAFAF\x00\x00\x00'
+VERSION = 1
+
+# magic, version, byte order, flags, number of arguments, number of
+# attacks, size of the names, source size, source mtime (ns), source
+# SHA-256 digest
+HEADER = struct.Struct('<8sHBBIIIQQ32s')
+
+_LITTLE_ENDIAN, _BIG_ENDIAN = 0, 1
+_NATIVE_ORDER = _LITTLE_ENDIAN if sys.byteorder == 'little' else _BIG_ENDIAN
+
+# Header flags
+VALIDATED = 1
+
+# The suffix of the sidecar cache of an input file
+SIDECAR_SUFFIX = '.safbin'
+
+
+def sourceDigest(file_path):
+    """Get the SHA-256 digest of the contents of a file."""
+
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def writeFramework(file_path, framework, source_path=None, validated=False):
+    """Write a framework to a file in the binary format. The file is
+        written to a temporary file first and then moved in place, so
+        that readers never map a partially written file.
+
+    Arguments:
+        file_path {str} -- path of the file to write
+        framework {saf.framework.FrameworkRepresentation} -- the
+            framework to write
+
+    Keyword Arguments:
+        source_path {str} -- path of the file the framework was parsed
+            from, to record in the header (default: {None})
+        validated {bool} -- whether the source file has been validated
+            (default: {False})
+    """
+
+    if not isinstance(framework, ArrayGraphFramework):
+        attacks = framework.getAttacks()
+        framework = ArrayGraphFramework.fromValueArrays(
+            framework.valuesToArguments(list(framework)),
+            array('i', (attack[0] for attack in attacks)),
+            array('i', (attack[1] for attack in attacks)))
+
+    attacking_ptr, attacking = framework.getAttackingArrays()
+    attacked_by_ptr, attacked_by = framework.getAttackedByArrays()
+    names = '\n'.join(framework.valuesToArguments(list(framework))) \
+        .encode('utf-8')
+
+    source_size = source_mtime = 0
+    digest = bytes(32)
+    if source_path is not None:
+        source_stat = os.stat(source_path)
+        source_size, source_mtime = source_stat.st_size, \
+            source_stat.st_mtime_ns
+        digest = sourceDigest(source_path)
+
+    header = HEADER.pack(MAGIC, VERSION, _NATIVE_ORDER,
+                         VALIDATED if validated else 0, len(framework),
+                         len(attacking), len(names), source_size,
+                         source_mtime, digest)
+
+    temp_path = F'{file_path}.{os.getpid()}.tmp'
+    try:
+        with open(temp_path, 'wb') as file:
+            file.write(header)
+            for int_array in (attacking_ptr, attacking, attacked_by_ptr,
+                              attacked_by):
+                file.write(array('i', int_array).tobytes())
+            file.write(names)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def readHeader(file_path):
+    """Read and check the header of a file in the binary format.
+
+    Returns:
+        Tuple -- the fields of the header (see HEADER)
+
+    Raises:
+        ValueError -- if the file is not in a supported version of the
+            binary format
+    """
+
+    with open(file_path, 'rb') as file:
+        header = file.read(HEADER.size)
+
+    return _unpackHeader(header)
+
+
+def _unpackHeader(header):
+    if len(header) < HEADER.size or not header.startswith(MAGIC):
+        raise ValueError('not a solved-af binary framework file')
+
+    fields = HEADER.unpack_from(header)
+    if fields[1] != VERSION:
+        raise ValueError(F'unsupported binary framework version {fields[1]}')
+    if fields[2] != _NATIVE_ORDER:
+        raise ValueError('binary framework of a different byte order')
+
+    return fields
+
+
+def loadFramework(file_path, representation=ArrayGraphFramework):
+    """Load a framework from a file in the binary format. The file is
+        memory-mapped, and an ArrayGraphFramework is built directly on
+        the mapped CSR arrays without copying them; other
+        representations are built from them.
+
+    Arguments:
+        file_path {str} -- path of the file to load
+
+    Keyword Arguments:
+        representation {type} -- the framework representation to
+            construct (default: {ArrayGraphFramework})
+
+    Returns:
+        saf.framework.FrameworkRepresentation -- the loaded framework
+
+    Raises:
+        ValueError -- if the file is not in a supported version of the
+            binary format, or is truncated or corrupt
+    """
+
+    with open(file_path, 'rb') as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    buffer = memoryview(mapped)
+    (_, _, _, _, num_of_args, num_of_attacks, names_size, _, _,
+     _) = _unpackHeader(bytes(buffer[:HEADER.size]))
+
+    lengths = (num_of_args + 1, num_of_attacks, num_of_args + 1,
+               num_of_attacks)
+    if HEADER.size + 4 * sum(lengths) + names_size != len(buffer):
+        raise ValueError('truncated or corrupt binary framework file')
+
+    offset = HEADER.size
+    int_arrays = []
+    for length in lengths:
+        int_arrays.append(buffer[offset:offset + 4 * length].cast('i'))
+        offset += 4 * length
+
+    for ptr in (int_arrays[0], int_arrays[2]):
+        if ptr[0] != 0 or ptr[-1] != num_of_attacks:
+            raise ValueError('corrupt binary framework file')
+    names = str(buffer[offset:], 'utf-8').split('\n') if num_of_args else []
+
+    attacking_arrays = tuple(int_arrays[:2])
+    attacked_by_arrays = tuple(int_arrays[2:])
+
+    if hasattr(representation, 'fromCSRArrays'):
+        return representation.fromCSRArrays(names, attacking_arrays,
+                                            attacked_by_arrays)
+
+    attacking_ptr, attacking = attacking_arrays
+    attackers = array('i')
+    for arg in range(1, num_of_args + 1):
+        attackers.extend(array('i', [arg]) *
+                         (attacking_ptr[arg] - attacking_ptr[arg - 1]))
+    return representation.fromValueArrays(names, attackers,
+                                          array('i', attacking))
+
+
+def sidecarPath(file_path):
+    return file_path + SIDECAR_SUFFIX
+
+
+def isUpToDate(binary_path, source_path, validated=False):
+    """Check if a binary framework file was written from the current
+        contents of a source file. The size and modification time of the
+        source are compared first, and its digest only if they differ.
+
+    Arguments:
+        binary_path {str} -- path of the binary framework file
+        source_path {str} -- path of the source file
+
+    Keyword Arguments:
+        validated {bool} -- whether the source file must have been
+            validated (default: {False})
+
+    Returns:
+        bool -- if the binary framework file is up to date
+    """
+
+    try:
+        (_, _, _, flags, _, _, _, source_size, source_mtime,
+         digest) = readHeader(binary_path)
+        source_stat = os.stat(source_path)
+    except (OSError, ValueError):
+        return False
+
+    if validated and not flags & VALIDATED:
+        return False
+    if (source_stat.st_size, source_stat.st_mtime_ns) == (source_size,
+                                                          source_mtime):
+        return True
+    return source_stat.st_size == source_size and \
+        sourceDigest(source_path) == digest
+
+
+def main():
+    # Imported here, as saf.io imports this module
+    import saf.io as io
+
+    parser = argparse.ArgumentParser(
+        description='Convert a framework file to the solved-af binary '
+                    'framework format.')
+    parser.add_argument('-f', '--inputFile', required=True,
+                        help='Path to input file encoding an framework')
+    parser.add_argument('-fo', '--fileFormat', required=True,
+                        choices=io.getFormats(text_only=True),
+                        help='Input file format')
+    parser.add_argument('-o', '--outputFile',
+                        help='Path to the binary file to write (default: '
+                             F'the input file path with {SIDECAR_SUFFIX} '
+                             'appended, i.e., its sidecar cache)')
+    parser.add_argument('-v', '--validate', action='store_true',
+                        help='Enable validation of the input file before '
+                             'parsing')
+    args = parser.parse_args()
+
+    framework = io.loadFramework(args.inputFile, format=args.fileFormat,
+                                 validate=args.validate,
+                                 representation=ArrayGraphFramework)
+    writeFramework(args.outputFile or sidecarPath(args.inputFile), framework,
+                   source_path=args.inputFile, validated=args.validate)
+
+
+if __name__ == "__main__":
+    main()
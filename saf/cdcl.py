@@ -0,0 +1,514 @@
+# Solved-AF -- Copyright (C) 2020  David Simon Tetruashvili
+
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""This module provides solved-af with an in-process, incremental
+    conflict-driven clause learning (CDCL) SAT solver.
+
+    The solver follows the design of MiniSat (Eén and Sörensson, 2003):
+    two watched literals for unit propagation, first-UIP clause
+    learning with non-chronological backtracking, activity-based
+    branching with phase saving, and Luby restarts. Clauses may be
+    added between calls and each call may be given assumptions, which
+    makes it well suited for enumerating models one after another.
+"""
+
+import heapq
+from typing import List, Optional
+
+# Internally a literal is coded as 2 * var for the positive and
+# 2 * var + 1 for the negative literal of the variable var, so that
+# negating a coded literal is flipping its lowest bit.
+_TRUE, _FALSE, _UNDEF = 1, -1, 0
+
+_VAR_DECAY = 0.95
+_RESTART_BASE = 100
+_RESCALE_LIMIT = 1e100
+# The number of conflicts, and of propagated literals, between two
+# checks for an interruption
+_INTERRUPT_INTERVAL = 128
+_INTERRUPT_PROPAGATIONS = 4096
+
+
+class _Interrupted(Exception):
+    """Raised by the propagation of the solver once it is interrupted."""
+
+
+def _toCode(lit: int) -> int:
+    return 2 * lit if lit > 0 else -2 * lit + 1
+
+
+def _luby(y: float, x: int) -> float:
+    """Compute the x-th element of the Luby sequence scaled by y
+        (see Luby et al., 1993).
+    """
+
+    size, seq = 1, 0
+    while size < x + 1:
+        seq += 1
+        size = 2 * size + 1
+
+    while size - 1 != x:
+        size = (size - 1) >> 1
+        seq -= 1
+        x = x % size
+
+    return y ** seq
+
+
+class CDCLSolver:
+    """An incremental CDCL SAT solver over DIMACS-style literals
+        (non-zero integers, negative for negated variables).
+    """
+
+    def __init__(self, num_of_vars=0):
+        super().__init__()
+        self._num_vars = 0
+        # Indexed by coded literal
+        self._values = [_UNDEF, _UNDEF]
+        self._watches = [[], []]
+        # Indexed by variable
+        self._levels = [0]
+        self._reasons = [None]
+        self._activity = [0.0]
+        self._phases = [False]
+        self._seen = [False]
+
+        self._trail = []
+        self._trail_lims = []
+        self._qhead = 0
+
+        self._clauses = []
+        self._learnts = []
+        self._max_learnts = 1000
+
+        self._order_heap = []
+        self._var_inc = 1.0
+
+        self._ok = True
+        self._model = None
+        # The interruption check of the ongoing call to solve
+        self._interrupt = None
+
+        self.conflicts = 0
+        self.decisions = 0
+        self.propagations = 0
+
+        self.ensureVars(num_of_vars)
+
+    def ensureVars(self, num_of_vars: int):
+        """Make sure that the solver knows of variables 1..num_of_vars.
+
+        Arguments:
+            num_of_vars {int} -- the number of variables to support
+        """
+
+        for var in range(self._num_vars + 1, num_of_vars + 1):
+            self._values += [_UNDEF, _UNDEF]
+            self._watches += [[], []]
+            self._levels.append(0)
+            self._reasons.append(None)
+            self._activity.append(0.0)
+            self._phases.append(False)
+            self._seen.append(False)
+            heapq.heappush(self._order_heap, (0.0, var))
+
+        self._num_vars = max(self._num_vars, num_of_vars)
+
+    def numOfVars(self) -> int:
+        return self._num_vars
+
+    def addClause(self, clause: List[int]) -> bool:
+        """Permanently add a clause to the solver.
+
+        Arguments:
+            clause {List[int]} -- the clause to add
+
+        Returns:
+            bool -- False if the solver is known to be unsatisfiable
+                after adding the clause
+        """
+
+        if not self._ok:
+            return False
+
+        self._cancelUntil(0)
+        self.ensureVars(max((abs(lit) for lit in clause), default=0))
+
+        values = self._values
+        codes = []
+        for code in {_toCode(lit) for lit in clause}:
+            if values[code] == _TRUE or (code ^ 1) in codes:
+                # Clause is satisfied at the top level or tautological
+                return True
+            if values[code] == _UNDEF:
+                codes.append(code)
+
+        if not codes:
+            self._ok = False
+        elif len(codes) == 1:
+            self._assign(codes[0], None)
+            self._ok = self._propagate() is None
+        else:
+            self._attach(codes)
+            self._clauses.append(codes)
+
+        return self._ok
+
+    def solve(self, assumptions: List[int] = (),
+              interrupt=None) -> Optional[bool]:
+        """Decide the satisfiability of the clauses added so far under
+            the given assumptions.
+
+        Keyword Arguments:
+            assumptions {List[int]} -- literals assumed to be true for
+                this call only (default: {()})
+            interrupt {Callable} -- called every so many conflicts and
+                propagated literals; the search is given up once it
+                returns a true value (default: {None})
+
+        Returns:
+            bool or None -- whether a model was found (see getModel);
+                None indicates that the search was interrupted
+        """
+
+        self._model = None
+        if not self._ok:
+            return False
+
+        self._cancelUntil(0)
+        self.ensureVars(max((abs(lit) for lit in assumptions), default=0))
+        assumption_codes = [_toCode(lit) for lit in assumptions]
+
+        restarts = 0
+        status = None
+        self._interrupt = interrupt
+        try:
+            while status is None:
+                if interrupt is not None and interrupt():
+                    self._cancelUntil(0)
+                    return None
+                conflict_budget = _luby(2, restarts) * _RESTART_BASE
+                status = self._search(conflict_budget, assumption_codes,
+                                      interrupt)
+                restarts += 1
+        except _Interrupted:
+            # The propagation left so far is resumed at the next call
+            self._cancelUntil(0)
+            return None
+        finally:
+            self._interrupt = None
+
+        if status:
+            values = self._values
+            self._model = [var if values[2 * var] == _TRUE else -var
+                           for var in range(1, self._num_vars + 1)]
+
+        self._cancelUntil(0)
+        return status
+
+    def getModel(self) -> Optional[List[int]]:
+        """Get the model found by the last call to solve.
+
+        Returns:
+            List[int] or None -- the full variable assignment; None if
+                no model was found
+        """
+
+        return self._model
+
+    #
+    # Search internals.
+    #
+
+    def _decisionLevel(self):
+        return len(self._trail_lims)
+
+    def _attach(self, codes):
+        self._watches[codes[0]].append(codes)
+        self._watches[codes[1]].append(codes)
+
+    def _assign(self, code, reason):
+        var = code >> 1
+        self._values[code] = _TRUE
+        self._values[code ^ 1] = _FALSE
+        self._levels[var] = len(self._trail_lims)
+        self._reasons[var] = reason
+        self._trail.append(code)
+
+    def _cancelUntil(self, level):
+        if len(self._trail_lims) <= level:
+            return
+
+        lim = self._trail_lims[level]
+        values, reasons = self._values, self._reasons
+        phases, activity = self._phases, self._activity
+        heap = self._order_heap
+
+        for code in self._trail[lim:]:
+            var = code >> 1
+            values[code] = values[code ^ 1] = _UNDEF
+            reasons[var] = None
+            phases[var] = not code & 1
+            heapq.heappush(heap, (-activity[var], var))
+
+        del self._trail[lim:]
+        del self._trail_lims[level:]
+        self._qhead = lim
+
+    def _propagate(self):
+        """Propagate all enqueued assignments and return a conflicting
+            clause if one arises.
+        """
+
+        values, watches, trail = self._values, self._watches, self._trail
+        interrupt = self._interrupt
+
+        while self._qhead < len(trail):
+            if interrupt is not None and \
+                    self.propagations % _INTERRUPT_PROPAGATIONS == 0 and \
+                    interrupt():
+                raise _Interrupted()
+
+            false_code = trail[self._qhead] ^ 1
+            self._qhead += 1
+            self.propagations += 1
+
+            watchers = watches[false_code]
+            i = j = 0
+            end = len(watchers)
+
+            while i < end:
+                clause = watchers[i]
+                i += 1
+
+                # Keep the falsified watch in the second position
+                if clause[0] == false_code:
+                    clause[0], clause[1] = clause[1], false_code
+
+                first = clause[0]
+                if values[first] == _TRUE:
+                    watchers[j] = clause
+                    j += 1
+                    continue
+
+                for k in range(2, len(clause)):
+                    code = clause[k]
+                    if values[code] != _FALSE:
+                        clause[1], clause[k] = code, false_code
+                        watches[code].append(clause)
+                        break
+                else:
+                    watchers[j] = clause
+                    j += 1
+
+                    if values[first] == _FALSE:
+                        # Conflict, keep the remaining watchers
+                        watchers[j:] = watchers[i:end]
+                        self._qhead = len(trail)
+                        return clause
+
+                    self._assign(first, clause)
+
+            del watchers[j:]
+
+        return None
+
+    def _bumpVar(self, var):
+        activity = self._activity
+        activity[var] += self._var_inc
+
+        if activity[var] > _RESCALE_LIMIT:
+            for v in range(1, self._num_vars + 1):
+                activity[v] /= _RESCALE_LIMIT
+            self._var_inc /= _RESCALE_LIMIT
+            self._order_heap = [(-activity[v], v)
+                                for v in range(1, self._num_vars + 1)
+                                if self._values[2 * v] == _UNDEF]
+            heapq.heapify(self._order_heap)
+        elif self._values[2 * var] == _UNDEF:
+            heapq.heappush(self._order_heap, (-activity[var], var))
+
+    def _analyze(self, conflict):
+        """Derive the first-UIP clause from a conflict and return it with
+            the level to backtrack to.
+        """
+
+        levels, reasons, seen, trail = (self._levels, self._reasons,
+                                        self._seen, self._trail)
+        current_level = self._decisionLevel()
+
+        learnt = [None]
+        path = 0
+        code = None
+        index = len(trail) - 1
+        clause = conflict
+
+        while True:
+            for lit in (clause if code is None else clause[1:]):
+                var = lit >> 1
+                if not seen[var] and levels[var] > 0:
+                    seen[var] = True
+                    self._bumpVar(var)
+                    if levels[var] >= current_level:
+                        path += 1
+                    else:
+                        learnt.append(lit)
+
+            while not seen[trail[index] >> 1]:
+                index -= 1
+            code = trail[index]
+            index -= 1
+            var = code >> 1
+            clause = reasons[var]
+            seen[var] = False
+            path -= 1
+
+            if path == 0:
+                break
+
+        learnt[0] = code ^ 1
+
+        # Drop literals implied by the other literals of the clause
+        minimised = [learnt[0]]
+        for lit in learnt[1:]:
+            reason = reasons[lit >> 1]
+            if reason is None or not all(seen[other >> 1] or
+                                         levels[other >> 1] == 0
+                                         for other in reason[1:]):
+                minimised.append(lit)
+
+        for lit in learnt[1:]:
+            seen[lit >> 1] = False
+
+        if len(minimised) == 1:
+            return minimised, 0
+
+        # Watch the literal of the highest level second, as it is
+        # the last to be unassigned.
+        max_index = max(range(1, len(minimised)),
+                        key=lambda i: levels[minimised[i] >> 1])
+        minimised[1], minimised[max_index] = (minimised[max_index],
+                                              minimised[1])
+
+        return minimised, levels[minimised[1] >> 1]
+
+    def _pickBranchCode(self):
+        heap, values = self._order_heap, self._values
+
+        while heap:
+            _, var = heapq.heappop(heap)
+            if values[2 * var] == _UNDEF:
+                return 2 * var if self._phases[var] else 2 * var + 1
+
+        return None
+
+    def _reduceLearnts(self):
+        """Forget the longer half of the learnt clauses which are not
+            currently the reason of an assignment.
+        """
+
+        reasons, values = self._reasons, self._values
+
+        def isLocked(clause):
+            return (reasons[clause[0] >> 1] is clause and
+                    values[clause[0]] == _TRUE)
+
+        self._learnts.sort(key=len)
+        half = len(self._learnts) // 2
+        kept = self._learnts[:half]
+        removed = set()
+        for clause in self._learnts[half:]:
+            if len(clause) > 2 and not isLocked(clause):
+                removed.add(id(clause))
+            else:
+                kept.append(clause)
+
+        self._learnts = kept
+        self._watches = [[clause for clause in watchers
+                          if id(clause) not in removed]
+                         for watchers in self._watches]
+        self._max_learnts = int(self._max_learnts * 1.1)
+
+    def _search(self, conflict_budget, assumptions, interrupt=None):
+        """Search for a model until the conflict budget runs out (or the
+            search is interrupted).
+
+        Returns:
+            bool or None -- the satisfiability status; None indicates
+                that the search should be restarted
+        """
+
+        conflicts = 0
+        values = self._values
+
+        while True:
+            conflict = self._propagate()
+
+            if conflict is not None:
+                conflicts += 1
+                self.conflicts += 1
+
+                if self._decisionLevel() == 0:
+                    self._ok = False
+                    return False
+
+                if interrupt is not None and \
+                        conflicts % _INTERRUPT_INTERVAL == 0 and interrupt():
+                    # Restart, for solve to give up
+                    self._cancelUntil(0)
+                    return None
+
+                learnt, backtrack_level = self._analyze(conflict)
+                self._cancelUntil(backtrack_level)
+
+                if len(learnt) == 1:
+                    self._assign(learnt[0], None)
+                else:
+                    self._attach(learnt)
+                    self._learnts.append(learnt)
+                    self._assign(learnt[0], learnt)
+
+                self._var_inc /= _VAR_DECAY
+                continue
+
+            if conflicts >= conflict_budget:
+                self._cancelUntil(0)
+                return None
+
+            if len(self._learnts) - len(self._trail) >= \
+                    self._max_learnts + len(self._clauses) // 3:
+                self._reduceLearnts()
+
+            next_code = None
+            while self._decisionLevel() < len(assumptions):
+                code = assumptions[self._decisionLevel()]
+                if values[code] == _TRUE:
+                    # Already holds, open a dummy level for it
+                    self._trail_lims.append(len(self._trail))
+                elif values[code] == _FALSE:
+                    # Unsatisfiable under the assumptions
+                    return False
+                else:
+                    next_code = code
+                    break
+
+            if next_code is None:
+                next_code = self._pickBranchCode()
+                if next_code is None:
+                    return True
+                self.decisions += 1
+
+            self._trail_lims.append(len(self._trail))
+            self._assign(next_code, None)
@@ -0,0 +1,523 @@
+# Solved-AF -- Copyright (C) 2020  David Simon Tetruashvili
+
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""This module provides solved-af with dynamic frameworks, which are
+    edited in place (by adding and removing arguments and attacks) and
+    re-solved after each edit without starting from scratch.
+
+    An edit only changes the attackers of a few arguments, and under a
+    semantics satisfying directionality (grounded, complete, preferred)
+    the labels of an argument only depend on its ancestors. So only the
+    arguments downstream of the edit, the affected arguments, may change
+    their labels:
+
+        - the grounded labelling and the SCCs of the framework are
+          updated on the affected arguments only;
+        - the decisions solved for unaffected arguments are kept, and a
+          decision is solved on the ancestors of its query argument
+          only;
+        - the extensions enumerated are kept in part: their parts
+          outside the affected arguments are still the extensions of
+          the unaffected part of the framework, so only the affected
+          arguments' SCCs are enumerated again (see
+          tasks.sccEnumeration), conditioned on each of those parts.
+
+    Stable semantics does not satisfy directionality, so its solutions
+    are solved again in full after any edit.
+
+    Usage:
+
+        af = DynamicFramework(['a', 'b'], [('a', 'b')])
+        dynamic.solveTask(af, 'EE-PR')
+        af.addArgument('c')
+        af.addAttack('c', 'a')
+        dynamic.solveTask(af, 'DC-PR', 'b')
+"""
+
+import saf.tasks as tasks
+from saf.framework import (ListGraphFramework, findStronglyConnectedComponents,
+                           getAncestors, restrictFramework)
+
+# Semantics under which the labels of an argument only depend on its
+# ancestors
+_DIRECTIONAL_SEMANTICS = {'GR', 'CO', 'PR'}
+
+# The methods enumerating a conditioned framework's extensions (see
+# tasks.sccEnumeration) under each semantics re-enumerated in part
+_localEnumerations = {
+    'CO': tasks.completeFullEnumeration,
+    'PR': tasks.preferredFullEnumeration
+}
+
+
+class _ExtensionsEntry:
+    """The extensions enumerated under a semantics (as sets of argument
+        names), along with the names of the arguments affected by the
+        edits since.
+    """
+
+    def __init__(self, extensions):
+        self.extensions = extensions
+        self.affected = set()
+
+
+class DynamicFramework(ListGraphFramework):
+    """Framework representation which can be edited in place. It
+        maintains its grounded labelling and SCCs across edits (once
+        first asked for them), and the solutions found for it by
+        solveTask.
+
+        The values of the arguments are kept contiguous: removing an
+        argument gives its value to the argument with the last value.
+    """
+
+    def __init__(self, arguments, attacks):
+        """Construct the framework from parsed and validated data.
+        Where arguments is a list of named/numbered arguments."""
+
+        # The maintained grounded labelling and SCCs; None until first
+        # asked for
+        self._grounded = None
+        self._sccs = None
+        # The solutions found by solveTask
+        self._extensions = {}
+        self._decisions = {}
+        self._stable_decisions = {}
+        super().__init__(list(arguments), attacks)
+
+    def _buildAttacks(self):
+        super()._buildAttacks()
+        # The attacks are only kept in the node list
+        self._atts = None
+
+    def getAttacks(self):
+        return [[attacker, arg] for arg in self
+                for attacker in self.getAttackersOf(arg)]
+
+    #
+    # Edits.
+    #
+
+    def _checkArgument(self, argument):
+        if not self.hasArgument(argument):
+            raise ValueError(F'Argument "{argument}" is not in the '
+                             'framework!')
+        return self.argumentToValue(argument)
+
+    def addArgument(self, argument):
+        """Add an unattacked and unattacking argument.
+
+        Raises:
+            ValueError -- if the argument is already in the framework
+        """
+
+        if self.hasArgument(argument):
+            raise ValueError(F'Argument "{argument}" is already in the '
+                             'framework!')
+
+        value = len(self) + 1
+        self._values_to_arguments.append(argument)
+        self._arguments_to_values[argument] = value
+        self._args.append(value)
+        self._node_list.append((set(), set()))
+        self.LENGTH = value
+
+        self._edited([value])
+
+    def removeArgument(self, argument):
+        """Remove an argument along with its attacks.
+
+        Raises:
+            ValueError -- if the argument is not in the framework
+        """
+
+        value = self._checkArgument(argument)
+        attacking, attacked_by = self._node_list[value - 1]
+        affected_names = {self.valueToArgument(attacked)
+                          for attacked in attacking if attacked != value}
+
+        for attacked in attacking:
+            self._node_list[attacked - 1][1].discard(value)
+        for attacker in attacked_by:
+            self._node_list[attacker - 1][0].discard(value)
+        if self._grounded is not None:
+            self._grounded[0].discard(value)
+            self._grounded[1].discard(value)
+        if self._sccs is not None:
+            self._sccs = [[arg for arg in scc if arg != value]
+                          for scc in self._sccs]
+
+        # The last argument takes the value of the removed one
+        last = len(self)
+        if last != value:
+            self._moveArgument(last, value)
+        self._node_list.pop()
+        self._values_to_arguments.pop()
+        self._args.pop()
+        del self._arguments_to_values[argument]
+        self.LENGTH = last - 1
+
+        self._edited([self.argumentToValue(name)
+                      for name in affected_names], {argument})
+
+    def _moveArgument(self, old_value, new_value):
+        """Give the argument with a value another (free) value."""
+
+        attacking, attacked_by = self._node_list[old_value - 1]
+        self_attacking = old_value in attacking
+        for attacked in attacking - {old_value}:
+            attackers = self._node_list[attacked - 1][1]
+            attackers.discard(old_value)
+            attackers.add(new_value)
+        for attacker in attacked_by - {old_value}:
+            attacked_args = self._node_list[attacker - 1][0]
+            attacked_args.discard(old_value)
+            attacked_args.add(new_value)
+        if self_attacking:
+            for neighbours in (attacking, attacked_by):
+                neighbours.discard(old_value)
+                neighbours.add(new_value)
+        self._node_list[new_value - 1] = (attacking, attacked_by)
+
+        argument = self._values_to_arguments[old_value - 1]
+        self._values_to_arguments[new_value - 1] = argument
+        self._arguments_to_values[argument] = new_value
+
+        if self._grounded is not None:
+            for labelled in self._grounded:
+                if old_value in labelled:
+                    labelled.discard(old_value)
+                    labelled.add(new_value)
+        if self._sccs is not None:
+            self._sccs = [[new_value if arg == old_value else arg
+                           for arg in scc] for scc in self._sccs]
+
+    def addAttack(self, attacker, attacked):
+        """Add an attack between two arguments of the framework.
+
+        Raises:
+            ValueError -- if either argument is not in the framework
+        """
+
+        attacker_value = self._checkArgument(attacker)
+        attacked_value = self._checkArgument(attacked)
+        if attacker_value in self.getAttackersOf(attacked_value):
+            return
+
+        self._node_list[attacker_value - 1][0].add(attacked_value)
+        self._node_list[attacked_value - 1][1].add(attacker_value)
+        self._edited([attacked_value])
+
+    def removeAttack(self, attacker, attacked):
+        """Remove an attack between two arguments of the framework.
+
+        Raises:
+            ValueError -- if either argument is not in the framework
+        """
+
+        attacker_value = self._checkArgument(attacker)
+        attacked_value = self._checkArgument(attacked)
+        if attacker_value not in self.getAttackersOf(attacked_value):
+            return
+
+        self._node_list[attacker_value - 1][0].discard(attacked_value)
+        self._node_list[attacked_value - 1][1].discard(attacker_value)
+        self._edited([attacked_value])
+
+    def _edited(self, changed, removed=()):
+        """Update the maintained structures after an edit.
+
+        Arguments:
+            changed {List[int]} -- the arguments whose attackers the
+                edit has changed
+
+        Keyword Arguments:
+            removed {Iterable[str]} -- the names of the arguments the
+                edit has removed (default: {()})
+        """
+
+        # The memoized results of the framework (e.g., its encodings)
+        # are those of the framework before the edit
+        self.release()
+
+        affected = self.getDescendants(changed)
+        if self._grounded is not None:
+            self._updateGroundedLabelling(affected)
+        if self._sccs is not None:
+            self._updateSCCs(affected)
+
+        affected_names = set(self.valuesToArguments(affected))
+        affected_names.update(removed)
+        for entry in self._extensions.values():
+            entry.affected |= affected_names
+        for name in affected_names:
+            self._decisions.pop(name, None)
+        self._stable_decisions.clear()
+
+    def getDescendants(self, argument_values):
+        """Get all arguments to which there is an attack path from any
+            of the given arguments (including the arguments themselves).
+
+        Returns:
+            Set[int] -- the descendants of the arguments
+        """
+
+        descendants = set(argument_values)
+        queue = list(descendants)
+
+        while queue:
+            for attacked in self.getAttackedBy(queue.pop()):
+                if attacked not in descendants:
+                    descendants.add(attacked)
+                    queue.append(attacked)
+
+        return descendants
+
+    #
+    # Maintained grounded labelling and SCCs.
+    #
+
+    def _updateGroundedLabelling(self, affected):
+        """Label the affected arguments (a set closed under attacks) as
+            the grounded labelling does, given the labels of the others
+            (see framework.groundedLabelling).
+        """
+
+        in_args, out_args = self._grounded
+        in_args.difference_update(affected)
+        out_args.difference_update(affected)
+
+        # The attackers which are not (yet) out-labeled; an undecided
+        # attacker outside of the affected arguments stays counted
+        unlabelled_attackers = {}
+        queue = []
+        out_now = []
+        for arg in affected:
+            count = 0
+            for attacker in self.getAttackersOf(arg):
+                if attacker in affected:
+                    count += 1
+                elif attacker in in_args:
+                    out_now.append(arg)
+                    break
+                elif attacker not in out_args:
+                    count += 1
+            else:
+                unlabelled_attackers[arg] = count
+                if count == 0:
+                    queue.append(arg)
+
+        def outLabel(arg):
+            out_args.add(arg)
+            for defended in self.getAttackedBy(arg):
+                if defended in unlabelled_attackers:
+                    unlabelled_attackers[defended] -= 1
+                    if unlabelled_attackers[defended] == 0:
+                        queue.append(defended)
+
+        for arg in out_now:
+            outLabel(arg)
+
+        while queue:
+            arg = queue.pop()
+            in_args.add(arg)
+            for attacked in self.getAttackedBy(arg):
+                if attacked not in out_args:
+                    outLabel(attacked)
+
+    def _updateSCCs(self, affected):
+        """Find the SCCs of the affected arguments (a set closed under
+            attacks, and so a union of SCCs) again, after those of the
+            others, which the edit has not changed.
+        """
+
+        restricted = restrictFramework(self, affected)
+        self._sccs = [scc for scc in self._sccs
+                      if scc and scc[0] not in affected] + \
+            [restricted.valuesToArguments(scc) for scc
+             in findStronglyConnectedComponents(restricted)]
+
+    def getGroundedLabelling(self):
+        """Get the grounded labelling of the framework (see
+            framework.groundedLabelling), which is maintained across
+            edits once computed.
+
+        Returns:
+            Tuple[Set[int], Set[int]] -- the in-labeled and the
+                out-labeled arguments
+        """
+
+        if self._grounded is None:
+            self._grounded = (set(), set())
+            self._updateGroundedLabelling(set(self))
+        return set(self._grounded[0]), set(self._grounded[1])
+
+    def getStronglyConnectedComponents(self):
+        """Get the SCCs of the framework in topological order (see
+            framework.stronglyConnectedComponents), which are maintained
+            across edits once computed.
+        """
+
+        if self._sccs is None:
+            self._sccs = findStronglyConnectedComponents(self)
+        return [list(scc) for scc in self._sccs]
+
+
+#
+# Re-solving.
+#
+
+
+def _groundedExtension(framework):
+    return frozenset(framework.valuesToArguments(
+        framework.getGroundedLabelling()[0]))
+
+
+def _reenumerate(framework, semantics, entry):
+    """Enumerate the extensions of a framework again, given those it had
+        before the edits which have affected some of its arguments.
+
+    Returns:
+        List[FrozenSet[str]] -- the extensions of the framework
+    """
+
+    affected = [framework.argumentToValue(name) for name in entry.affected
+                if framework.hasArgument(name)]
+    affected_set = set(affected)
+
+    # The parts of the extensions outside of the affected arguments are
+    # the extensions of the unaffected part
+    unaffected_parts = {extension - entry.affected
+                        for extension in entry.extensions}
+
+    restricted = restrictFramework(framework, affected)
+    sccs = [restricted.valuesToArguments(scc) for scc
+            in findStronglyConnectedComponents(restricted)]
+
+    # Only the labels of the unaffected attackers of affected arguments
+    # condition the enumeration
+    boundary = {attacker for arg in affected
+                for attacker in framework.getAttackersOf(arg)
+                if attacker not in affected_set}
+
+    extensions = []
+    for part in unaffected_parts:
+        part_values = set(framework.argumentsToValues(part))
+        in_boundary = boundary & part_values
+        out_boundary = {arg for arg in boundary
+                        if not part_values.isdisjoint(
+                            framework.getAttackersOf(arg))}
+        for extension in tasks.sccEnumeration(
+                framework, _localEnumerations[semantics], sccs,
+                (in_boundary, out_boundary)):
+            extensions.append(part.union(framework.valuesToArguments(
+                extension - in_boundary)))
+    return extensions
+
+
+def getExtensions(framework, semantics):
+    """Get all extensions of a dynamic framework under a semantics,
+        re-enumerating only those parts of them which the edits since
+        they were last enumerated have affected.
+
+    Arguments:
+        framework {DynamicFramework} -- the framework
+        semantics {str} -- the semantics identifier (e.g., PR)
+
+    Returns:
+        List[FrozenSet[str]] -- the extensions, as sets of argument
+            names
+    """
+
+    entry = framework._extensions.get(semantics)
+    if entry is not None and not entry.affected:
+        return entry.extensions
+
+    if semantics == 'GR':
+        extensions = [_groundedExtension(framework)]
+    elif entry is not None and semantics in _localEnumerations:
+        extensions = _reenumerate(framework, semantics, entry)
+    else:
+        extensions = [frozenset(extension) for extension in
+                      tasks.solveTask(framework, 'EE-' + semantics)]
+
+    framework._extensions[semantics] = _ExtensionsEntry(extensions)
+    return extensions
+
+
+def _decide(framework, task_name, argument):
+    task_type, semantics = task_name[:2], task_name[3:]
+
+    entry = framework._extensions.get(semantics)
+    if semantics == 'GR' or task_name == 'DS-CO':
+        # The grounded extension is the skeptically accepted arguments
+        # under complete semantics
+        return argument in _groundedExtension(framework)
+    if entry is not None and not entry.affected:
+        if task_type == 'DC':
+            return any(argument in ext for ext in entry.extensions)
+        return all(argument in ext for ext in entry.extensions)
+    if semantics not in _DIRECTIONAL_SEMANTICS:
+        return tasks.solveTask(framework, task_name, argument)
+
+    # The acceptance of the argument only depends on its ancestors
+    value = framework.argumentToValue(argument)
+    ancestors = restrictFramework(framework,
+                                  getAncestors(framework, [value]))
+    return tasks.solveTask(ancestors, task_name, value)
+
+
+def solveTask(framework, task_name, argument=None):
+    """Solve an AF problem task on a dynamic framework in terms of
+        argument names (as tasks.solveTask), reusing the solutions found
+        before the edits since where they are still valid.
+
+    Arguments:
+        framework {DynamicFramework} -- the framework
+        task_name {str} -- the AF problem task identifier (e.g., EE-CO)
+
+    Keyword Arguments:
+        argument {str} -- the name of the query argument of a decision
+            task; None indicates an enumeration task (default: {None})
+
+    Returns:
+        List[List[str]] or List[str] or bool or None -- the extensions,
+            the extension or the decision solving the task
+    """
+
+    # Fail on a task of the wrong type before any solving
+    tasks.getTaskMethod(task_name, is_enumeration=argument is None)
+    task_type, semantics = task_name[:2], task_name[3:]
+
+    if task_type == 'EE':
+        return [sorted(extension) for extension
+                in getExtensions(framework, semantics)]
+
+    if task_type == 'SE':
+        if semantics in ('GR', 'CO'):
+            # The grounded extension is a complete extension
+            return sorted(_groundedExtension(framework))
+        if semantics in framework._extensions:
+            extensions = getExtensions(framework, semantics)
+            return sorted(extensions[0]) if extensions else None
+        return tasks.solveTask(framework, task_name)
+
+    if semantics in _DIRECTIONAL_SEMANTICS:
+        decisions = framework._decisions.setdefault(argument, {})
+    else:
+        decisions = framework._stable_decisions.setdefault(argument, {})
+    if task_name not in decisions:
+        decisions[task_name] = _decide(framework, task_name, argument)
+    return decisions[task_name]
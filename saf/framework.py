@@ -18,8 +18,12 @@
 """
 
 import abc
-from typing import List, Set
+from array import array
+from collections import Counter
+from itertools import accumulate, chain
+from typing import List, Set, Tuple
 
+import saf.stats as stats
 import saf.utils as utils
 
 
@@ -38,6 +42,9 @@ class FrameworkRepresentation(metaclass=abc.ABCMeta):
     def argumentToValue(self, argument_name: str) -> int:
         return self._arguments_to_values[argument_name]
 
+    def hasArgument(self, argument_name: str) -> bool:
+        return argument_name in self._arguments_to_values
+
     def valueToArgument(self, argument_value: int) -> str:
         return self._values_to_arguments[argument_value - 1]
 
@@ -50,6 +57,38 @@ class FrameworkRepresentation(metaclass=abc.ABCMeta):
     def __iter__(self):
         return iter(self._args)
 
+    @classmethod
+    def fromValueArrays(cls, arguments, attackers, attacked):
+        """Construct the framework from the argument names and the
+            attacks given as two parallel arrays of argument values,
+            without mapping the attacks through the argument names.
+
+        Arguments:
+            arguments {List[str]} -- the argument names, in value order
+            attackers {array} -- the attacking argument of each attack
+            attacked {array} -- the attacked argument of each attack
+
+        Returns:
+            FrameworkRepresentation -- the constructed framework
+        """
+
+        framework = cls(arguments, ())
+        framework._atts = list(zip(attackers, attacked))
+        framework._buildAttacks()
+        return framework
+
+    def _buildAttacks(self):
+        """Build the representation of the attacks in self._atts."""
+        raise NotImplementedError
+
+    def release(self):
+        """Release the memoized results computed for the framework
+            (see utils.memoize), e.g., once it is no longer used or
+            before it is changed.
+        """
+
+        utils.releaseCacheScope(self)
+
     @classmethod
     def __subclasshook__(cls, subclass):
         return (hasattr(subclass, 'getAttackersOf') and
@@ -107,12 +146,13 @@ class ListGraphFramework(FrameworkRepresentation):
         arguments which it is attacking and is attacked by.
     """
 
-    # TODO Add SCC and layer split support in construction
-
     def __init__(self, arguments, attacks):
         """Construct the framework from parsed and validated data.
         Where arguments is a list of named/numbered arguments."""
         super().__init__(arguments, attacks)
+        self._buildAttacks()
+
+    def _buildAttacks(self):
         self._node_list = [(set(), set()) for _ in range(len(self._args))]
         for (attacker, attacked) in self._atts:
             self._node_list[attacker - 1][0].add(attacked)
@@ -189,6 +229,565 @@ class ListGraphFramework(FrameworkRepresentation):
         return self._atts
 
 
+def _compress(rows, columns, num_of_rows):
+    """Sort (row, column) value pairs into compressed sparse row arrays:
+        the columns of the row with value v are
+        indices[indptr[v - 1]:indptr[v]].
+    """
+
+    counts = Counter(rows)
+    indptr = array('i', accumulate(counts[row]
+                                   for row in range(num_of_rows + 1)))
+
+    # A stable sort keeps the columns of a row in input order
+    order = sorted(range(len(rows)), key=rows.__getitem__)
+    indices = array('i', map(columns.__getitem__, order))
+
+    return indptr, indices
+
+
+class ArrayGraphFramework(FrameworkRepresentation):
+    """Framework representation via keeping the attack relation as
+        compressed sparse row (CSR) arrays of 32-bit integers, once per
+        direction: for the arguments each argument is attacking and for
+        the arguments each argument is attacked by.
+
+        The arrays are standard library arrays, so that bulk consumers
+        may use them directly (e.g., through memoryview or
+        numpy.frombuffer, without copying).
+    """
+
+    def __init__(self, arguments, attacks):
+        """Construct the framework from parsed and validated data.
+        Where arguments is a list of named/numbered arguments."""
+        super().__init__(arguments, ())
+        to_value = self._arguments_to_values
+        attackers = array('i', (to_value[attack[0]] for attack in attacks))
+        attacked = array('i', (to_value[attack[1]] for attack in attacks))
+        self._buildArrays(attackers, attacked)
+
+    @classmethod
+    def fromValueArrays(cls, arguments, attackers, attacked):
+        framework = cls(arguments, ())
+        framework._buildArrays(array('i', attackers), array('i', attacked))
+        return framework
+
+    @classmethod
+    def fromCSRArrays(cls, arguments, attacking_arrays, attacked_by_arrays):
+        """Construct the framework directly on its CSR arrays (see
+            getAttackingArrays and getAttackedByArrays), without copying
+            them. Any buffers of 32-bit integers will do, e.g.,
+            memoryviews of a memory-mapped file.
+
+        Arguments:
+            arguments {List[str]} -- the argument names, in value order
+            attacking_arrays {Tuple[array, array]} -- the CSR arrays of
+                the arguments each argument is attacking
+            attacked_by_arrays {Tuple[array, array]} -- the CSR arrays
+                of the arguments each argument is attacked by
+
+        Returns:
+            ArrayGraphFramework -- the constructed framework
+        """
+
+        framework = cls.__new__(cls)
+        FrameworkRepresentation.__init__(framework, arguments, ())
+        framework.LENGTH = len(framework._args)
+        framework._attacking_ptr, framework._attacking = attacking_arrays
+        framework._attacked_by_ptr, framework._attacked_by = \
+            attacked_by_arrays
+        return framework
+
+    def _buildArrays(self, attackers, attacked):
+        self.LENGTH = len(self._args)
+        self._attacking_ptr, self._attacking = _compress(
+            attackers, attacked, self.LENGTH)
+        self._attacked_by_ptr, self._attacked_by = _compress(
+            attacked, attackers, self.LENGTH)
+
+    def __len__(self):
+        return self.LENGTH
+
+    def characteristic(self, argument_values):
+        """The charachteristic function of the AF defined as giving the
+            set of arguments in the AF which defend some other set of
+            arguments.
+
+        Arguments:
+            argument_values {Set[int]} -- the arguments whose defending
+                set to find
+
+        Returns:
+            Set[int] -- the defnding set of argument_values
+        """
+
+        is_attacked = bytearray(self.LENGTH + 1)
+        for arg in self.getAttackedBySet(argument_values):
+            is_attacked[arg] = 1
+
+        ptr, attacked_by = self._attacked_by_ptr, self._attacked_by
+        return {arg for arg in self
+                if all(is_attacked[attacker] for attacker
+                       in attacked_by[ptr[arg - 1]:ptr[arg]])}
+
+    def getAttackedBy(self, arg):
+        ptr = self._attacking_ptr
+        return self._attacking[ptr[arg - 1]:ptr[arg]]
+
+    def getAttackersOf(self, arg):
+        ptr = self._attacked_by_ptr
+        return self._attacked_by[ptr[arg - 1]:ptr[arg]]
+
+    def getAttackedBySet(self, arg_set):
+        return {attacked for arg in arg_set
+                for attacked in self.getAttackedBy(arg)}
+
+    def getAttackersOfSet(self, arg_set):
+        return {attacker for arg in arg_set
+                for attacker in self.getAttackersOf(arg)}
+
+    def getArguments(self):
+        return self._args
+
+    def getAttacks(self):
+        ptr, attacking = self._attacking_ptr, self._attacking
+        return [[arg, attacked] for arg in self
+                for attacked in attacking[ptr[arg - 1]:ptr[arg]]]
+
+    def getAttackingArrays(self) -> Tuple[array, array]:
+        """Get the CSR arrays (indptr, indices) of the arguments each
+            argument is attacking: those of the argument with value v
+            are indices[indptr[v - 1]:indptr[v]].
+        """
+        return self._attacking_ptr, self._attacking
+
+    def getAttackedByArrays(self) -> Tuple[array, array]:
+        """Get the CSR arrays (indptr, indices) of the arguments each
+            argument is attacked by: those of the argument with value v
+            are indices[indptr[v - 1]:indptr[v]].
+        """
+        return self._attacked_by_ptr, self._attacked_by
+
+    def getInDegrees(self) -> array:
+        """Get the number of attackers of each argument, in value
+            order."""
+        ptr = self._attacked_by_ptr
+        return array('i', (ptr[i + 1] - ptr[i] for i in range(self.LENGTH)))
+
+    def getOutDegrees(self) -> array:
+        """Get the number of arguments each argument attacks, in value
+            order."""
+        ptr = self._attacking_ptr
+        return array('i', (ptr[i + 1] - ptr[i] for i in range(self.LENGTH)))
+
+
+class BitsetFramework(FrameworkRepresentation):
+    """Framework representation via keeping for each argument bitmasks
+        (arbitrary precision integers) of the arguments which it is
+        attacking and is attacked by, where the argument with value v is
+        the bit v - 1. Set operations on arguments then become bitwise
+        operations on whole masks.
+    """
+
+    def __init__(self, arguments, attacks):
+        """Construct the framework from parsed and validated data.
+        Where arguments is a list of named/numbered arguments."""
+        super().__init__(arguments, attacks)
+        self._buildAttacks()
+
+    def _buildAttacks(self):
+        self.LENGTH = len(self._args)
+        self._all_mask = (1 << self.LENGTH) - 1
+        self._attacking_masks = [0] * self.LENGTH
+        self._attacked_by_masks = [0] * self.LENGTH
+        for (attacker, attacked) in self._atts:
+            self._attacking_masks[attacker - 1] |= 1 << (attacked - 1)
+            self._attacked_by_masks[attacked - 1] |= 1 << (attacker - 1)
+        # The masks of the per-argument accessors converted to lists of
+        # argument values, once asked for
+        self._attacking_lists = [None] * self.LENGTH
+        self._attacked_by_lists = [None] * self.LENGTH
+
+    def __len__(self):
+        return self.LENGTH
+
+    def characteristic(self, argument_values):
+        """The charachteristic function of the AF defined as giving the
+            set of arguments in the AF which defend some other set of
+            arguments.
+
+        Arguments:
+            argument_values {Set[int]} -- the arguments whose defending
+                set to find
+
+        Returns:
+            Set[int] -- the defnding set of argument_values
+        """
+
+        argument_mask = utils.valuesToMask(argument_values)
+        return set(utils.maskToValues(self.characteristicMask(argument_mask)))
+
+    def characteristicMask(self, argument_mask):
+        """The charachteristic function of the AF over argument
+            bitmasks (see utils.valuesToMask).
+
+        Arguments:
+            argument_mask {int} -- the arguments whose defending set to
+                find as a bitmask
+
+        Returns:
+            int -- the defending set of the arguments as a bitmask
+        """
+
+        # The arguments defended are those which no argument left
+        # unattacked by argument_mask attacks
+        unattacked_mask = self._all_mask & \
+            ~self.getAttackedByMask(argument_mask)
+        return self._all_mask & ~self.getAttackedByMask(unattacked_mask)
+
+    def groundedMasks(self):
+        """Compute the grounded labelling of the AF over bitmasks, as
+            the least fixpoint of the characteristic function reached
+            round by round from the unattacked arguments: each round
+            in-labels the arguments whose attackers are all out-labeled
+            and out-labels those they attack. Only the arguments
+            attacked by newly out-labeled ones are examined again.
+
+        Returns:
+            Tuple[int, int] -- the in-labeled and the out-labeled
+                arguments as bitmasks
+        """
+
+        attacked_by_masks = self._attacked_by_masks
+        in_mask = out_mask = 0
+        new_in_mask = utils.valuesToMask(
+            i for i, attackers in enumerate(attacked_by_masks, start=1)
+            if not attackers)
+
+        while new_in_mask:
+            in_mask |= new_in_mask
+            new_out_mask = self.getAttackedByMask(new_in_mask) & ~out_mask
+            out_mask |= new_out_mask
+
+            candidates = self.getAttackedByMask(new_out_mask) & \
+                ~(in_mask | out_mask)
+            new_in_mask = 0
+            for arg in utils.maskToValues(candidates):
+                attackers = attacked_by_masks[arg - 1]
+                if attackers & out_mask == attackers:
+                    new_in_mask |= 1 << (arg - 1)
+
+        return in_mask, out_mask
+
+    def getAttackedBy(self, arg):
+        attacked = self._attacking_lists[arg - 1]
+        if attacked is None:
+            attacked = self._attacking_lists[arg - 1] = \
+                utils.maskToValues(self._attacking_masks[arg - 1])
+        return attacked
+
+    def getAttackersOf(self, arg):
+        attackers = self._attacked_by_lists[arg - 1]
+        if attackers is None:
+            attackers = self._attacked_by_lists[arg - 1] = \
+                utils.maskToValues(self._attacked_by_masks[arg - 1])
+        return attackers
+
+    def getAttackedByMask(self, argument_mask):
+        """Get the bitmask of all arguments attacked by the arguments of
+            a bitmask."""
+        attacking_masks = self._attacking_masks
+        attacked_mask = 0
+        for arg in utils.maskToValues(argument_mask):
+            attacked_mask |= attacking_masks[arg - 1]
+        return attacked_mask
+
+    def getAttackersOfMask(self, argument_mask):
+        """Get the bitmask of all arguments attacking the arguments of
+            a bitmask."""
+        attacked_by_masks = self._attacked_by_masks
+        attackers_mask = 0
+        for arg in utils.maskToValues(argument_mask):
+            attackers_mask |= attacked_by_masks[arg - 1]
+        return attackers_mask
+
+    def getAttackedBySet(self, arg_set):
+        return set(utils.maskToValues(
+            self.getAttackedByMask(utils.valuesToMask(arg_set))))
+
+    def getAttackersOfSet(self, arg_set):
+        return set(utils.maskToValues(
+            self.getAttackersOfMask(utils.valuesToMask(arg_set))))
+
+    def getArguments(self):
+        return self._args
+
+    def getAttacks(self):
+        return self._atts
+
+
+_representations = {
+    # List supported framework representations here.
+    'list': ListGraphFramework,
+    'array': ArrayGraphFramework,
+    'bitset': BitsetFramework
+}
+
+
+def getRepresentations():
+    return list(_representations.keys())
+
+
+def getRepresentation(name='list'):
+    """Get the framework representation class with the given name.
+
+    Keyword Arguments:
+        name {str} -- name of the representation (default: {'list'})
+
+    Returns:
+        type -- the FrameworkRepresentation subclass
+    """
+
+    return _representations[name]
+
+
+def restrictFramework(framework, argument_values):
+    """Restrict a framework to some of its arguments and the attacks
+        between them.
+
+    Arguments:
+        framework {FrameworkRepresentation} -- the framework to restrict
+        argument_values {Iterable[int]} -- the arguments to keep
+
+    Returns:
+        FrameworkRepresentation -- the restricted framework of the same
+            representation, whose argument names are the values of the
+            arguments in the original framework
+    """
+
+    kept = set(argument_values)
+    arguments = [arg for arg in framework if arg in kept]
+    attacks = [(attacker, arg) for arg in arguments
+               for attacker in framework.getAttackersOf(arg)
+               if attacker in kept]
+
+    return type(framework)(arguments, attacks)
+
+
+def groundedLabelling(framework, stop_at=None):
+    """Compute the grounded labelling of a framework in time linear in
+        its number of arguments and attacks.
+
+        Every argument keeps a count of its attackers which are not
+        yet out-labeled. Arguments whose count drops to zero are put on
+        a queue to be in-labeled, and in-labelling an argument
+        out-labels all arguments it attacks, which in turn decrements
+        the counts of the arguments those attack. Arguments left
+        unlabelled at the end are undecided.
+
+    Arguments:
+        framework {FrameworkRepresentation} -- the framework to label
+
+    Keyword Arguments:
+        stop_at {int} -- an argument whose labelling ends the
+            computation early, leaving the labelling partial
+            (default: {None})
+
+    Returns:
+        Tuple[Set[int], Set[int]] -- the in-labeled and the out-labeled
+            arguments
+    """
+
+    if stop_at is None and hasattr(framework, 'getGroundedLabelling'):
+        # The framework maintains its grounded labelling itself
+        return framework.getGroundedLabelling()
+
+    if hasattr(framework, 'groundedMasks'):
+        # The framework computes it word-parallel (in full)
+        in_mask, out_mask = framework.groundedMasks()
+        return (set(utils.maskToValues(in_mask)),
+                set(utils.maskToValues(out_mask)))
+
+    if hasattr(framework, 'getInDegrees'):
+        unlabelled_attackers = [0] + list(framework.getInDegrees())
+    else:
+        unlabelled_attackers = [0] + [len(framework.getAttackersOf(arg))
+                                      for arg in framework]
+
+    in_args, out_args = set(), set()
+    queue = [arg for arg in framework if unlabelled_attackers[arg] == 0]
+
+    while queue:
+        arg = queue.pop()
+        in_args.add(arg)
+        if arg == stop_at:
+            break
+
+        for attacked in framework.getAttackedBy(arg):
+            if attacked in out_args:
+                continue
+            out_args.add(attacked)
+            if attacked == stop_at:
+                return in_args, out_args
+
+            for defended in framework.getAttackedBy(attacked):
+                unlabelled_attackers[defended] -= 1
+                if unlabelled_attackers[defended] == 0:
+                    queue.append(defended)
+
+    return in_args, out_args
+
+
+@utils.memoize(scoped=True)
+def stronglyConnectedComponents(framework):
+    """Decompose the attack graph of a framework into its strongly
+        connected components (SCCs), unless the framework maintains
+        them itself (see saf.dynamic). The SCCs are memoized for the
+        framework until it is released.
+
+    Arguments:
+        framework {FrameworkRepresentation} -- the framework to
+            decompose
+
+    Returns:
+        List[List[int]] -- the SCCs in topological order, i.e., every
+            attacker of an argument is in the argument's SCC or in an
+            earlier one
+    """
+
+    if hasattr(framework, 'getStronglyConnectedComponents'):
+        return framework.getStronglyConnectedComponents()
+    return findStronglyConnectedComponents(framework)
+
+
+def findStronglyConnectedComponents(framework):
+    """Decompose the attack graph of a framework into its SCCs via
+        Tarjan's algorithm (iteratively, so that long attack chains do
+        not exhaust the recursion limit), without memoization.
+
+    Returns:
+        List[List[int]] -- the SCCs in topological order
+    """
+
+    num_of_args = len(framework)
+    index = [-1] * (num_of_args + 1)
+    lowlink = [0] * (num_of_args + 1)
+    on_stack = [False] * (num_of_args + 1)
+    stack = []
+    sccs = []
+    counter = 0
+
+    for root in framework:
+        if index[root] != -1:
+            continue
+
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, iter(framework.getAttackedBy(root)))]
+
+        while work:
+            arg, attacked_args = work[-1]
+
+            for attacked in attacked_args:
+                if index[attacked] == -1:
+                    index[attacked] = lowlink[attacked] = counter
+                    counter += 1
+                    stack.append(attacked)
+                    on_stack[attacked] = True
+                    work.append(
+                        (attacked, iter(framework.getAttackedBy(attacked))))
+                    break
+                elif on_stack[attacked]:
+                    lowlink[arg] = min(lowlink[arg], index[attacked])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[arg])
+
+                if lowlink[arg] == index[arg]:
+                    scc = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        scc.append(member)
+                        if member == arg:
+                            break
+                    sccs.append(scc)
+
+    # Tarjan's algorithm finds the SCCs in reverse topological order
+    sccs.reverse()
+    return sccs
+
+
+@utils.memoize(scoped=True)
+def weaklyConnectedComponents(framework):
+    """Decompose the attack graph of a framework into its weakly
+        connected components, i.e., the parts of the framework between
+        which there are no attacks in either direction. The components
+        are memoized for the framework until it is released.
+
+    Arguments:
+        framework {FrameworkRepresentation} -- the framework to
+            decompose
+
+    Returns:
+        List[List[int]] -- the components, each in ascending order, and
+            ordered by their least argument
+    """
+
+    component_of = [0] * (len(framework) + 1)
+    components = []
+
+    for root in framework:
+        if component_of[root]:
+            continue
+
+        components.append([root])
+        component_of[root] = len(components)
+        queue = [root]
+        while queue:
+            arg = queue.pop()
+            for neighbour in chain(framework.getAttackedBy(arg),
+                                   framework.getAttackersOf(arg)):
+                if not component_of[neighbour]:
+                    component_of[neighbour] = len(components)
+                    components[-1].append(neighbour)
+                    queue.append(neighbour)
+
+    for component in components:
+        component.sort()
+    return components
+
+
+def getAncestors(framework, argument_values):
+    """Get all arguments from which there is an attack path to any of
+        the given arguments (including the arguments themselves).
+
+    Arguments:
+        framework {FrameworkRepresentation} -- the framework containing
+            the arguments
+        argument_values {Iterable[int]} -- the arguments to get the
+            ancestors of
+
+    Returns:
+        Set[int] -- the ancestors of the arguments
+    """
+
+    ancestors = set(argument_values)
+    queue = list(ancestors)
+
+    while queue:
+        for attacker in framework.getAttackersOf(queue.pop()):
+            if attacker not in ancestors:
+                ancestors.add(attacker)
+                queue.append(attacker)
+
+    return ancestors
+
+
 @utils.memoize
 def extensionToInt(extension):
     """Convert an extension into a binary value of arbitrary precision
@@ -202,12 +801,7 @@ def extensionToInt(extension):
         int -- the representation of the extension
     """
 
-    rep = 0
-
-    for arg in extension:
-        rep += 2**(arg-1)
-
-    return rep
+    return utils.valuesToMask(extension)
 
 
 def isIncluded(extension, other):
@@ -238,37 +832,239 @@ def isIncluded(extension, other):
 #             return ext
 
 
+class ExtensionIndex:
+    """Index of extensions supporting subset and superset queries
+        without comparing against every extension in it.
+
+        Each extension stored is given a slot, and for each argument the
+        index keeps a bitmask of the slots of the extensions containing
+        it (i.e., the transposed bitset representation of the
+        extensions). A superset query is then an intersection of the
+        masks of the query's arguments, and a subset query removes the
+        masks of the arguments not in the query; each a handful of
+        arbitrary precision integer operations instead of a loop over
+        the extensions. Slots are reused, keeping the masks as narrow as
+        the number of extensions in the index.
+    """
+
+    def __init__(self, extensions=()):
+        self._slots = {}
+        self._extensions = [None]
+        self._free_slots = []
+        self._occupied = 0
+        self._containing = {}
+        for ext in extensions:
+            self.add(ext)
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __iter__(self):
+        return iter(list(self._slots))
+
+    def __contains__(self, extension):
+        return extension in self._slots
+
+    def _extensionsOf(self, slots_mask):
+        return [self._extensions[slot]
+                for slot in utils.maskToValues(slots_mask)]
+
+    def add(self, extension):
+        """Add an extension to the index (if it is not in it already).
+
+        Arguments:
+            extension {FrozenSet[int]} -- the extension to add
+        """
+
+        if extension in self._slots:
+            return
+
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._extensions[slot] = extension
+        else:
+            slot = len(self._extensions)
+            self._extensions.append(extension)
+        self._slots[extension] = slot
+
+        bit = 1 << (slot - 1)
+        self._occupied |= bit
+        containing = self._containing
+        for arg in extension:
+            containing[arg] = containing.get(arg, 0) | bit
+
+    def discard(self, extension):
+        """Remove an extension from the index if it is in it.
+
+        Arguments:
+            extension {FrozenSet[int]} -- the extension to remove
+        """
+
+        slot = self._slots.pop(extension, None)
+        if slot is None:
+            return
+
+        self._extensions[slot] = None
+        self._free_slots.append(slot)
+
+        bit = 1 << (slot - 1)
+        self._occupied ^= bit
+        containing = self._containing
+        for arg in extension:
+            containing[arg] ^= bit
+
+    def _supersetsMask(self, extension):
+        slots_mask = self._occupied
+        containing = self._containing
+        for arg in extension:
+            slots_mask &= containing.get(arg, 0)
+            if not slots_mask:
+                break
+        return slots_mask
+
+    def _subsetsMask(self, extension):
+        slots_mask = self._occupied
+        for arg, containing in self._containing.items():
+            if arg not in extension:
+                slots_mask &= ~containing
+                if not slots_mask:
+                    break
+        return slots_mask
+
+    def hasSuperset(self, extension):
+        """Check if the index contains a (non-strict) superset of the
+            extension.
+
+        Arguments:
+            extension {FrozenSet[int]} -- the extension to check for
+
+        Returns:
+            bool -- if there is a superset of the extension
+        """
+
+        return self._supersetsMask(extension) != 0
+
+    def hasSubset(self, extension):
+        """Check if the index contains a (non-strict) subset of the
+            extension.
+
+        Arguments:
+            extension {FrozenSet[int]} -- the extension to check for
+
+        Returns:
+            bool -- if there is a subset of the extension
+        """
+
+        return self._subsetsMask(extension) != 0
+
+    def removeSupersets(self, extension):
+        """Remove all (non-strict) supersets of the extension from the
+            index.
+
+        Arguments:
+            extension {FrozenSet[int]} -- the extension to remove the
+                supersets of
+
+        Returns:
+            List[FrozenSet[int]] -- the removed extensions
+        """
+
+        removed = self._extensionsOf(self._supersetsMask(extension))
+        for ext in removed:
+            self.discard(ext)
+        return removed
+
+    def removeSubsets(self, extension):
+        """Remove all (non-strict) subsets of the extension from the
+            index.
+
+        Arguments:
+            extension {FrozenSet[int]} -- the extension to remove the
+                subsets of
+
+        Returns:
+            List[FrozenSet[int]] -- the removed extensions
+        """
+
+        removed = self._extensionsOf(self._subsetsMask(extension))
+        for ext in removed:
+            self.discard(ext)
+        return removed
+
+    def addMaximal(self, extension):
+        """Add an extension to an index of maximal extensions, unless it
+            is included in one of them, removing those it includes.
+
+        Arguments:
+            extension {FrozenSet[int]} -- the extension to add
+
+        Returns:
+            bool -- if the extension was added
+        """
+
+        if self.hasSuperset(extension):
+            return False
+        self.removeSubsets(extension)
+        self.add(extension)
+        return True
+
+    def addMinimal(self, extension):
+        """Add an extension to an index of minimal extensions, unless it
+            includes one of them, removing those it is included in.
+
+        Arguments:
+            extension {FrozenSet[int]} -- the extension to add
+
+        Returns:
+            bool -- if the extension was added
+        """
+
+        if self.hasSubset(extension):
+            return False
+        self.removeSupersets(extension)
+        self.add(extension)
+        return True
+
+
+@stats.timed('maximal')
 def getAllMaximal(extensions):
     """Filter all maximal (w.r.t. set inclusion) extension from an
-        iterable. Do this by keeping a reference to a currenly maximal
-        set of extension and either adding the next extension from the
+        iterable. Do this by keeping an index of the currenly maximal
+        extensions and either adding the next extension from the
         iterable to it or removing those found not to be maximal from it
         after considering the said next extension.
 
     Arguments:
-        extensions {List[List[int]]} -- list of extensions to find the
-            maximal from w.r.t. the list.
+        extensions {Iterable[FrozenSet[int]]} -- extensions to find the
+            maximal from w.r.t. the iterable.
 
     Returns:
-        Set[List[int]] -- the maximal extensions from the list
-            w.r.t. the list.
+        Set[FrozenSet[int]] -- the maximal extensions from the iterable
+            w.r.t. the iterable.
     """
-    currently_maximal = set()
 
+    currently_maximal = ExtensionIndex()
     for ext in extensions:
-        is_maximal = True
-        non_maximal = []
+        currently_maximal.addMaximal(ext)
 
-        for other in currently_maximal:
-            if isIncluded(ext, other):
-                is_maximal = False
-                break
-            elif isIncluded(other, ext):
-                non_maximal.append(other)
+    return set(currently_maximal)
+
+
+def getAllMinimal(extensions):
+    """Filter all minimal (w.r.t. set inclusion) extension from an
+        iterable, analogously to getAllMaximal.
+
+    Arguments:
+        extensions {Iterable[FrozenSet[int]]} -- extensions to find the
+            minimal from w.r.t. the iterable.
 
-        currently_maximal.difference_update(non_maximal)
+    Returns:
+        Set[FrozenSet[int]] -- the minimal extensions from the iterable
+            w.r.t. the iterable.
+    """
 
-        if is_maximal:
-            currently_maximal.add(ext)
+    currently_minimal = ExtensionIndex()
+    for ext in extensions:
+        currently_minimal.addMinimal(ext)
 
-    return currently_maximal
+    return set(currently_minimal)
@@ -21,7 +21,13 @@
 import argparse
 import re
 import sys
+from array import array
+from collections import Counter
+from itertools import chain
 
+import saf.binary as binary
+import saf.framework as framework
+import saf.stats as stats
 import saf.tasks as tasks
 
 
@@ -32,167 +38,228 @@ def _reportInvalidInputFileAndExit(message):
     sys.exit(1)
 
 
-def _validateAttack(attack, arguments, attacks, attack_str):
-    """Given an input attack and the contextual established components
-    of the argumentation fromework (arguments list and attacks list)
-    as well as the string encoding the attack notify and exit if the
-    attack is invalid.
-
-    Arguments:
-        attack {Tuple[str]} -- attack given as a tuple
-        arguments {List[str]} -- list of arguments currenly in the AF
-        attacks {List[Tuple[str]]} -- list of attacks currenty in the AF
-        attack_str {str} -- the input line verbatim describing
-            the attack
+class _Validator:
+    """Collects the errors found while validating an input file, so that
+    all of them are reported at once.
     """
 
-    if len(attack) != 2:
-        _reportInvalidInputFileAndExit(
-            F'Attack "{attack_str}" must contain exactly two arguments.')
-
-    elif attack[0] not in arguments or attack[1] not in arguments:
-        _reportInvalidInputFileAndExit(
-            F'Argument(s) in "{attack_str}" are not defined.')
+    # The number of offending names/lines listed per kind of error
+    MAX_LISTED = 10
+
+    def __init__(self):
+        self.errors = []
+
+    def check(self, offending, message):
+        """Record an error if there is any offending name or line.
+
+        Arguments:
+            offending {List[bytes]} -- the offending names or lines
+            message {str} -- description of the error
+
+        Returns:
+            bool -- if an error was recorded
+        """
+
+        if not offending:
+            return False
+
+        listed = ', '.join(F'"{item.decode(errors="replace").strip()}"'
+                           for item in offending[:self.MAX_LISTED])
+        if len(offending) > self.MAX_LISTED:
+            listed += F' and {len(offending) - self.MAX_LISTED} more'
+        self.errors.append(F'{message} ({len(offending)}): {listed}')
+        return True
+
+    def validateArguments(self, arguments):
+        """Check for argument names containing whitespace or a comma and
+        for arguments defined more than once.
+        """
+
+        # Only look for the offending names if there are any
+        joined = b'\n'.join(arguments)
+        if b',' in joined or len(joined.split()) != len(arguments):
+            self.check([name for name in arguments
+                        if b',' in name or len(name.split()) > 1],
+                       'Arguments contain whitespace or comma')
+
+        if len(set(arguments)) != len(arguments):
+            self.check([name for name, count in Counter(arguments).items()
+                        if count > 1],
+                       'Arguments are defined more than once')
+
+    def validateAttacks(self, attack_values, arguments):
+        """Check for attacks defined more than once, given as an array of
+        the attacking and attacked argument values of each attack in
+        turn (where 0 stands for an undefined argument).
+        """
+
+        if attack_values.itemsize == 4:
+            # Read each pair of 32-bit values as a single 64-bit key, so
+            # that the attacks are hashed without building tuples
+            keys = memoryview(attack_values).cast('B').cast('q')
+        else:
+            keys = list(zip(attack_values[0::2], attack_values[1::2]))
+        if len(set(keys)) == len(keys):
+            return
+
+        attacks = zip(attack_values[0::2], attack_values[1::2])
+        self.check([b'%s %s' % (arguments[attacker - 1],
+                                arguments[attacked_arg - 1])
+                    for (attacker, attacked_arg), count
+                    in Counter(attacks).items()
+                    if count > 1 and attacker and attacked_arg],
+                   'Attacks are defined more than once')
+
+    def reportAndExit(self):
+        """Report all errors found and exit, if there are any."""
+
+        if self.errors:
+            _reportInvalidInputFileAndExit(
+                ''.join(F'\n{error}' for error in self.errors))
 
-    elif attack in attacks:
-        _reportInvalidInputFileAndExit(
-            F'Attack "{attack_str}" is defiled more than once.')
 
+def _internAttacks(arguments, attack_tokens, validator=None):
+    """Map the flat sequence of attacking and attacked argument names
+        of the attacks to two parallel arrays of argument values.
+    """
 
-def _validateArgument(argument, arguments):
-    """Given an input argument name and the contextual list of
-    established argument notify and exit if the argument is invalid.
+    to_value = {name: value for value, name in enumerate(arguments, start=1)}
+    try:
+        attack_values = array('i', map(to_value.__getitem__, attack_tokens))
+    except KeyError as e:
+        if validator is None:
+            _reportInvalidInputFileAndExit(
+                F'Argument "{e.args[0].decode()}" of an attack is not '
+                'defined.')
 
-    Arguments:
-        argument {str} -- argument name to be checked for validity
-        arguments {List[str]} -- list of arguments currently in the AF
-    """
+        # Only look for all the undefined names once one is found
+        validator.check(list(dict.fromkeys(
+            name for name in attack_tokens if name not in to_value)),
+            'Arguments of attacks are not defined')
+        attack_values = array('i', (to_value.get(name, 0)
+                                    for name in attack_tokens))
 
-    if len(argument.split()) > 1 or argument.find(',') != -1:
-        _reportInvalidInputFileAndExit(
-            F'Argument "{argument}" contains whitespace or comma.')
+    if validator is not None:
+        validator.validateAttacks(attack_values, arguments)
+        validator.reportAndExit()
 
-    if argument in arguments:
-        _reportInvalidInputFileAndExit(
-            F'Argument "{argument}" is defiled more than once.')
+    return ([name.decode() for name in arguments],
+            attack_values[0::2], attack_values[1::2])
 
 
-def _parseTGF(file, validate=False):
-    """Given an input file-like object encoded in the Trivial Graph
-    Format parse it and return the AF it describes in term of its
-    components.
+def _parseTGF(data, validate=False):
+    """Given the contents of a Trivial Graph Format file as bytes, parse
+    it in bulk and return the AF it describes as the argument names and
+    the attacks as arrays of argument values.
 
     Arguments:
-        file {File} -- file-like object containing a TGF encoded AF
+        data {bytes} -- the contents of a TGF encoded AF
 
     Keyword Arguments:
-        validate {bool} -- whether to validate the contents of the file
-            (default: {False})
+        validate {bool} -- whether to validate the contents of the file,
+            reporting all errors found (default: {False})
 
     Returns:
-        Tuple[List[str],List[Tuple[str]]] -- tuple representation of the
-            encoded AF
+        Tuple[List[str],array,array] -- the argument names, in value
+            order, and the attacking and attacked argument of each
+            attack
     """
 
-    arguments = []
-    attacks = []
-
-    has_seen_pivot = False
-
-    for line in file:
-        line = line.strip()
-
-        if not line:
-            # Skip empty or whitespace lines
-            continue
-
-        if not has_seen_pivot and '#' in line:
-            # check for #-pivot line
-            has_seen_pivot = True
-            continue
-
-        if not has_seen_pivot:
-            # Read an argument line
-            argument_name = line.strip()
-
-            if validate:
-                _validateArgument(argument_name, arguments)
-
-            arguments.append(argument_name)
-
-        elif validate and '#' in line:
-            _reportInvalidInputFileAndExit(
-                'TGF file contains more than one "#".')
-
-        else:
-            # Read an attack line
-            attack = tuple(line.split())
-
-            if validate:
-                _validateAttack(attack, arguments, attacks, line)
-
-            attacks.append(tuple(attack))
-
-        if validate and not has_seen_pivot:
-            _reportInvalidInputFileAndExit(
-                'TGF file does not contain "#".')
+    validator = _Validator() if validate else None
+
+    pivot = _TGF_PIVOT_PATTERN.search(data)
+    if pivot is None:
+        arguments_part, attacks_part = data, b''
+        if validate:
+            validator.errors.append('TGF file does not contain "#".')
+    else:
+        arguments_part = data[:pivot.start()]
+        attacks_part = data[pivot.end():]
+
+    arguments = [line.strip() for line in arguments_part.splitlines()]
+    arguments = [name for name in arguments if name]
+
+    if validate:
+        validator.validateArguments(arguments)
+        if b'#' in attacks_part:
+            validator.check(_TGF_PIVOT_PATTERN.findall(attacks_part),
+                            'TGF file contains more than one "#"')
+
+        attack_lines = attacks_part.splitlines()
+        split_lines = list(map(bytes.split, attack_lines))
+        if set(map(len, split_lines)) - {0, 2}:
+            validator.check(
+                [line for line, tokens in zip(attack_lines, split_lines)
+                 if len(tokens) not in (0, 2) and b'#' not in line],
+                'Attacks do not contain exactly two arguments')
+            # The well-formed attacks are still checked further
+            split_lines = [tokens for tokens in split_lines
+                           if len(tokens) == 2]
+        attack_tokens = list(chain.from_iterable(split_lines))
+    else:
+        attack_tokens = attacks_part.split()
+
+    if len(attack_tokens) % 2:
+        _reportInvalidInputFileAndExit(
+            'Every attack must contain exactly two arguments.')
 
-    return arguments, attacks
+    return _internAttacks(arguments, attack_tokens, validator)
 
 
-def _parseAPX(file, validate=False):
-    """Given an input file-like object encoded in the Aspartix format
-    parse it and return the AF it describes in term of its components.
+def _parseAPX(data, validate=False):
+    """Given the contents of an Aspartix format file as bytes, parse it
+    in bulk and return the AF it describes as the argument names and the
+    attacks as arrays of argument values.
 
     Arguments:
-        file {File} -- file-like object containing a Aspartix encoded AF
+        data {bytes} -- the contents of an Aspartix encoded AF
 
     Keyword Arguments:
-        validate {bool} -- whether to validate the contents of the file
-            (default: {False})
+        validate {bool} -- whether to validate the contents of the file,
+            reporting all errors found (default: {False})
 
     Returns:
-        Tuple[List[str],List[Tuple[str]]] -- tuple representation of the
-            encoded AF]
+        Tuple[List[str],array,array] -- the argument names, in value
+            order, and the attacking and attacked argument of each
+            attack
     """
 
-    arguments = []
-    attacks = []
-    # https://git.io/Jv6wD - Credit to alviano/pyglaf implementation for
-    # the following regex pattern
-    # TODO Make this pattern match 'att' and 'arg' respectively
-    pattern = re.compile("(?P<type>\w+)\s*\((?P<args>[\w,\s]+)\)\.")
-
-    for line in file:
-        resolved_line = pattern.match(line)
+    validator = _Validator() if validate else None
 
-        if not resolved_line:
-            # Skip non apx lines
-            # ? Should this throw 'Invalid formatting' error?
-            continue
+    arguments = _APX_ARGUMENT_PATTERN.findall(data)
+    attack_tokens = [name for attack in _APX_ATTACK_PATTERN.findall(data)
+                     for name in attack]
 
-        line_type = resolved_line.group('type')
+    if validate:
+        validator.validateArguments(arguments)
+        # Only look for malformed lines if there are more lines starting
+        # as an argument or attack than there are arguments and attacks
+        num_of_lines = sum(data.count(b'\n' + line_type) +
+                           data.startswith(line_type)
+                           for line_type in (b'arg', b'att'))
+        if num_of_lines != len(arguments) + len(attack_tokens) // 2:
+            validator.check([line.group() for line in
+                             _APX_INVALID_LINE_PATTERN.finditer(data)],
+                            'Argument or attack lines are malformed')
 
-        if line_type == 'arg':
-            # Read argument line e.g. 'arg(...).'
-            argument_name = resolved_line.group('args')
+    return _internAttacks(arguments, attack_tokens, validator)
 
-            if validate:
-                _validateArgument(argument_name, arguments)
 
-            arguments.append(argument_name)
+# The first line containing '#' separates arguments from attacks in TGF
+_TGF_PIVOT_PATTERN = re.compile(rb'^[^\n]*#[^\n]*$', re.MULTILINE)
 
-        elif line_type == 'att':
-            # Read attack line e.g., 'att(...).'
-            attack_wws = resolved_line.group('args').split(',')
-            attack = [arg_name.strip() for arg_name in attack_wws]
-
-            if validate:
-                _validateAttack(attack, arguments, attacks, line.strip())
-
-            attacks.append(attack)
-
-    return arguments, attacks
+# Argument names are any run of bytes other than whitespace, commas
+# and parentheses.
+_APX_NAME = rb'([^\s,()]+)'
+_APX_ARGUMENT = rb'arg\s*\(\s*' + _APX_NAME + rb'\s*\)\.'
+_APX_ATTACK = (rb'att\s*\(\s*' + _APX_NAME + rb'\s*,\s*' + _APX_NAME +
+               rb'\s*\)\.')
+_APX_ARGUMENT_PATTERN = re.compile(rb'^' + _APX_ARGUMENT, re.MULTILINE)
+_APX_ATTACK_PATTERN = re.compile(rb'^' + _APX_ATTACK, re.MULTILINE)
+# Lines which begin as an argument or attack but are not one
+_APX_INVALID_LINE_PATTERN = re.compile(
+    rb'^(?=arg|att)(?!' + _APX_ARGUMENT + rb')(?!' + _APX_ATTACK +
+    rb')[^\n]*$', re.MULTILINE)
 
 
 _formats = {
@@ -202,13 +269,28 @@ _formats = {
 }
 
 
-def getFormats():
-    return list(_formats.keys())
+# The binary framework format (see saf.binary), which is memory-mapped
+# rather than parsed
+BINARY_FORMAT = 'bin'
 
 
-def parseInput(file_path, format='tgf', validate=False):
+def getFormats(text_only=False):
+    formats = list(_formats.keys())
+    if not text_only:
+        formats.append(BINARY_FORMAT)
+    return formats
+
+
+@stats.timed('parse')
+def parseInputArrays(file_path, format='tgf', validate=False):
     """Parse the input file at the given path under a given supported
-    encoding into a tuple AF representation.
+    encoding into the argument names and the attacks as two parallel
+    arrays of argument values (see FrameworkRepresentation
+    .fromValueArrays).
+
+    The file is read as bytes and tokenized in bulk, the names interned
+    to values as they are read. Validation takes linear time and reports
+    all errors found in the file before exiting.
 
     Arguments:
         file_path {str} -- path to the input file encoded in one of the
@@ -221,8 +303,9 @@ def parseInput(file_path, format='tgf', validate=False):
             for validity under the format (default: {False})
 
     Returns:
-        Tuple[List[str],List[Tuple[str]]] -- tuple representation of the
-            encoded AF]]
+        Tuple[List[str],array,array] -- the argument names, in value
+            order, and the attacking and attacked argument of each
+            attack
     """
 
     try:
@@ -233,13 +316,116 @@ def parseInput(file_path, format='tgf', validate=False):
         sys.stderr.flush()
         sys.exit(1)
     try:
-        with open(file_path, 'r') as file:
-            return parsingFunction(file, validate)
+        with open(file_path, 'rb') as file:
+            data = file.read()
     except OSError as e:
         sys.stderr.write(e.strerror)
         sys.stderr.flush()
         sys.exit(1)
 
+    return parsingFunction(data, validate)
+
+
+def parseInput(file_path, format='tgf', validate=False):
+    """Parse the input file at the given path under a given supported
+    encoding into a tuple AF representation.
+
+    Arguments:
+        file_path {str} -- path to the input file encoded in one of the
+            supported formats/encodings
+
+    Keyword Arguments:
+        format {str} -- name of the format/encoding of the file at
+            file_path (default: {'tgf'})
+        validate {bool} -- decide whether to check the file at file_path
+            for validity under the format (default: {False})
+
+    Returns:
+        Tuple[List[str],List[Tuple[str]]] -- tuple representation of the
+            encoded AF]]
+    """
+
+    arguments, attackers, attacked = parseInputArrays(file_path, format,
+                                                      validate)
+    return arguments, [(arguments[attacker - 1], arguments[attacked_arg - 1])
+                       for attacker, attacked_arg in zip(attackers, attacked)]
+
+
+@stats.timed('parse')
+def _loadBinary(file_path, representation):
+    try:
+        return binary.loadFramework(file_path, representation)
+    except ValueError as e:
+        _reportInvalidInputFileAndExit(F'\n{e}')
+    except OSError as e:
+        sys.stderr.write(e.strerror)
+        sys.stderr.flush()
+        sys.exit(1)
+
+
+def loadFramework(file_path, format='tgf', validate=False,
+                  representation=framework.ListGraphFramework, cache=False):
+    """Parse the input file at the given path under a given supported
+    encoding straight into a framework representation.
+
+    With cache, the framework is loaded from the binary sidecar cache of
+    the file (see saf.binary) if it is up to date, and otherwise parsed
+    and the sidecar cache (re)written for the next time.
+
+    Arguments:
+        file_path {str} -- path to the input file encoded in one of the
+            supported formats/encodings
+
+    Keyword Arguments:
+        format {str} -- name of the format/encoding of the file at
+            file_path (default: {'tgf'})
+        validate {bool} -- decide whether to check the file at file_path
+            for validity under the format (default: {False})
+        representation {type} -- the framework representation to
+            construct (default: {framework.ListGraphFramework})
+        cache {bool} -- whether to use the binary sidecar cache of the
+            file (default: {False})
+
+    Returns:
+        saf.framework.FrameworkRepresentation -- the encoded AF
+    """
+
+    if format == BINARY_FORMAT:
+        return _loadBinary(file_path, representation)
+
+    if not cache:
+        parsed = parseInputArrays(file_path, format, validate)
+        tasks.checkBudget()
+        with stats.phase('construct'):
+            return representation.fromValueArrays(*parsed)
+
+    sidecar_path = binary.sidecarPath(file_path)
+    if binary.isUpToDate(sidecar_path, file_path, validated=validate):
+        try:
+            with stats.phase('parse'):
+                return binary.loadFramework(sidecar_path, representation)
+        except (OSError, ValueError):
+            # Fall back to parsing and rewriting the cache
+            pass
+
+    parsed = parseInputArrays(file_path, format, validate)
+    tasks.checkBudget()
+    with stats.phase('construct'):
+        array_framework = framework.ArrayGraphFramework.fromValueArrays(
+            *parsed)
+    try:
+        binary.writeFramework(sidecar_path, array_framework,
+                              source_path=file_path, validated=validate)
+    except OSError:
+        # The cache is an optimisation, e.g. the directory may be
+        # read-only
+        pass
+
+    if representation is framework.ArrayGraphFramework:
+        return array_framework
+    with stats.phase('construct'):
+        return representation.fromValueArrays(*parsed)
+
 
 class _FormatsAction(argparse.Action):
     """Argparse action for listing supported formats."""
@@ -297,6 +483,16 @@ def _initialiseArgumentParser():
                           type=str,
                           metavar='<argumentname>',
                           help='Argument to check acceptance for')
+    optional.add_argument('--arguments',
+                          type=str,
+                          nargs='+',
+                          metavar='<argumentname>',
+                          help='Arguments to check acceptance for, all in \
+                              one run')
+    optional.add_argument('--all-arguments',
+                          action='store_true',
+                          help='Check acceptance for all arguments of the \
+                              framework')
     # Register the custom action to list supported formats
     parser.register('action', 'list_formats', _FormatsAction)
     optional.add_argument('--formats',
@@ -317,6 +513,81 @@ def _initialiseArgumentParser():
                           help='Enable validation of the input \
                               file before parsing')
 
+    optional.add_argument('--cache',
+                          action='store_true',
+                          help='Load the framework from, or save it to, \
+                              a binary sidecar cache next to the input \
+                              file')
+
+    optional.add_argument('-r',
+                          '--representation',
+                          type=str,
+                          default='list',
+                          choices=framework.getRepresentations(),
+                          help='Framework representation to solve with')
+
+    optional.add_argument('--preprocess',
+                          action='store_true',
+                          help='Leave the arguments decided by the \
+                              grounded labelling out of the SAT \
+                              encoding')
+
+    optional.add_argument('--scc',
+                          action='store_true',
+                          help='Solve the framework SCC by SCC in \
+                              topological order where the semantics \
+                              allows it')
+
+    optional.add_argument('--portfolio',
+                          nargs='?',
+                          const='',
+                          metavar='FILE',
+                          help='Race the solver configurations of a JSON \
+                              portfolio file (or the default portfolio) \
+                              on an SE/DC/DS task')
+    optional.add_argument('--portfolio-log',
+                          metavar='PATH',
+                          help='Append the winning configuration of each \
+                              portfolio race to PATH as a JSON line')
+
+    optional.add_argument('--timeout',
+                          type=float,
+                          metavar='SECONDS',
+                          help='Stop solving after SECONDS of wall-clock \
+                              time, outputting the solution found so far \
+                              and a status line')
+    optional.add_argument('--memory-limit',
+                          type=int,
+                          metavar='MB',
+                          help='Stop solving once MB of memory are used \
+                              (by this process or a SAT solver process), \
+                              outputting the solution found so far and a \
+                              status line')
+
+    optional.add_argument('--workers',
+                          type=int,
+                          metavar='N',
+                          help='Solve the weakly connected components of \
+                              the framework in parallel in N worker \
+                              processes (0: one per CPU core)')
+
+    optional.add_argument('--stats',
+                          nargs='?',
+                          const='-',
+                          metavar='FILE',
+                          help='Write the time spent in each solving \
+                              phase and counters of the work done as \
+                              JSON to FILE (or to stderr)')
+
+    optional.add_argument('-s',
+                          '--solver',
+                          type=str,
+                          default='external',
+                          choices=tasks.getSolverBackends(),
+                          help='SAT solver backend to solve with: the \
+                              external SAT_COMMAND or the in-process \
+                              CDCL solver')
+
     return parser
 
 
@@ -358,6 +629,25 @@ def outputDecision(accepted, suffix='\n'):
 outputDC = outputDS = outputDecision
 
 
+def outputDecisions(decisions, suffix='\n'):
+    """Given the solutions to a decision task for many query arguments,
+        output them one per line, each as the argument's name followed
+        by its ICCMA decision output, e.g., 'a YES'.
+
+    Arguments:
+        decisions {Iterable[Tuple[str, bool]]} -- the query arguments'
+            names along with their solutions
+
+    Keyword Arguments:
+        suffix {str} -- seperator to be printed after each solution
+            (default: {'\n'})
+    """
+
+    for argument, accepted in decisions:
+        sys.stdout.write(F'{argument} ')
+        outputDecision(accepted, suffix)
+
+
 def outputSE(ext, suffix='\n'):
     """Given a single enumeration task solution (extension), output it
         according to the ICCMA spesification.
@@ -379,13 +669,18 @@ def outputSE(ext, suffix='\n'):
 
 
 def outputEE(ext_list, sep=',', suffix='\n'):
-    """Given a full enumeration task solution (list of extensions),
+    """Given a full enumeration task solution (iterable of extensions),
         output it according to the ICCMA spesification.
 
+        The extensions are written, and stdout flushed, one at a time as
+        they are produced, so that an enumeration generator is never
+        held in memory in full and its first extensions are available
+        to the reader while the rest are still being searched for.
+
     Arguments:
-        ext_list {List[List[int]]} -- list of extensions which are the
+        ext_list {Iterable[List[str]]} -- extensions which are the
             solution to the full enumeration problem (arguments as
-            values)
+            names)
 
     Keyword Arguments:
         sep {str} -- separator to be printed between each partial solution
@@ -395,7 +690,21 @@ def outputEE(ext_list, sep=',', suffix='\n'):
     """
 
     sys.stdout.write('[')
-    sys.stdout.write(sep.join([formatOutput(ext) for ext in ext_list]))
+    ext_sep = ''
+    try:
+        for ext in ext_list:
+            sys.stdout.write(ext_sep + formatOutput(ext))
+            sys.stdout.flush()
+            ext_sep = sep
+    except tasks.BudgetExceeded:
+        # Close the extensions output within the budget, which the
+        # status line following them marks as partial. Any other
+        # failure leaves the output visibly truncated.
+        sys.stdout.write(']')
+        sys.stdout.write(suffix)
+        sys.stdout.flush()
+        raise
+
     sys.stdout.write(']')
     sys.stdout.write(suffix)
     sys.stdout.flush()
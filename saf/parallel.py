@@ -0,0 +1,290 @@
+# Solved-AF -- Copyright (C) 2020  David Simon Tetruashvili
+
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""This module provides solved-af with the solving of tasks on the weakly
+    connected components of a framework, in parallel in a pool of worker
+    processes.
+
+    There are no attacks between the components, so the extensions of
+    the framework (under any of the supported semantics) are exactly
+    the unions of one extension of each component. Each component is
+    thus encoded and solved on its own, and the solutions combined:
+    the extensions by their cross product (computed lazily), a single
+    extension by concatenation, and the acceptance of an argument by
+    its component alone (and, for semantics under which a framework may
+    have no extension, by every other component having one).
+"""
+
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, product
+
+import saf.stats as stats
+import saf.tasks as tasks
+from saf.framework import restrictFramework, weaklyConnectedComponents
+
+# Semantics under which every framework has an extension
+_UNIVERSAL_SEMANTICS = {'CO', 'GR', 'PR'}
+
+# The number of batches of components per worker, so that the workers
+# are kept busy when the components' solving times differ
+_BATCHES_PER_WORKER = 4
+
+
+def getWorkers(workers=None):
+    """Resolve a worker count; None or 0 indicates one worker per
+        CPU core.
+    """
+
+    return workers or os.cpu_count() or 1
+
+
+def _initialiseWorker(backend, preprocess, budget):
+    tasks.setSolverBackend(backend)
+    tasks.setPreprocessing(preprocess)
+    tasks.setBudget(budget)
+
+
+def _solveComponent(task_name, component, queries, decompose):
+    """Solve a task on a single component, in terms of the values of
+        the arguments in the whole framework.
+
+    Returns:
+        List[FrozenSet[int]] or FrozenSet[int] or None or
+        Tuple[Dict[int, bool], bool] -- the extensions (EE), the
+            extension (SE), or the decisions for the queries in the
+            component along with whether it has an extension (DC/DS)
+    """
+
+    task_type, semantics = task_name[:2], task_name[3:]
+
+    if task_type == 'EE':
+        enumerate_ = tasks.getTaskMethod(task_name, decompose=decompose)
+        return [frozenset(component.valuesToArguments(ext))
+                for ext in enumerate_(component)]
+
+    if task_type == 'SE' or semantics not in _UNIVERSAL_SEMANTICS:
+        single = tasks.getTaskMethod('SE-' + semantics, decompose=decompose)
+        extension = single(component)
+        if extension is not None:
+            extension = frozenset(component.valuesToArguments(extension))
+        if task_type == 'SE':
+            return extension
+        exists = extension is not None
+    else:
+        exists = True
+
+    decisions = {}
+    if queries and exists:
+        decisionsMethod = tasks.getDecisionsMethod(task_name,
+                                                   decompose=decompose)
+        component_decisions = decisionsMethod(
+            component, component.argumentsToValues(queries))
+        decisions = {component.valueToArgument(value): decision
+                     for value, decision in component_decisions.items()}
+    elif queries:
+        # Nothing is credulously and everything is skeptically accepted
+        decisions = {arg: task_type == 'DS' for arg in queries}
+
+    return decisions, exists
+
+
+def _solveBatch(task_name, batch, decompose):
+    return [_solveComponent(task_name, component, queries, decompose)
+            for component, queries in batch]
+
+
+def _batches(jobs, num_of_batches):
+    """Split the component jobs into batches of about equal size (in
+        arguments and attacks), largest components first.
+    """
+
+    def size(job):
+        return len(job[0]) + len(job[0].getAttacks())
+
+    batches = [[] for _ in range(min(num_of_batches, len(jobs)))]
+    loads = [(0, i) for i in range(len(batches))]
+    for index in sorted(range(len(jobs)), key=lambda i: -size(jobs[i])):
+        load, i = heapq.heappop(loads)
+        batches[i].append(index)
+        heapq.heappush(loads, (load + size(jobs[index]), i))
+    return [batch for batch in batches if batch]
+
+
+def _solveComponents(framework, task_name, queries, workers, decompose):
+    """Solve a task on every weakly connected component of a framework.
+
+    Arguments:
+        queries {Iterable[int]} -- the query arguments of a decision
+            task (as values)
+
+    Returns:
+        List -- the solution for each component (see _solveComponent),
+            in the order of weaklyConnectedComponents
+    """
+
+    components = weaklyConnectedComponents(framework)
+    component_of = {}
+    for i, component in enumerate(components):
+        component_of.update((arg, i) for arg in component)
+
+    component_queries = [[] for _ in components]
+    for arg in queries:
+        component_queries[component_of[arg]].append(arg)
+
+    # Under a semantics which always has an extension, a decision task
+    # needs none of the components without query arguments
+    needed = [i for i in range(len(components))
+              if component_queries[i] or task_name[:2] not in ('DC', 'DS')
+              or task_name[3:] not in _UNIVERSAL_SEMANTICS]
+    jobs = [(restrictFramework(framework, components[i]),
+             component_queries[i]) for i in needed]
+
+    workers = getWorkers(workers)
+    batches = _batches(jobs, workers * _BATCHES_PER_WORKER)
+    batch_jobs = [[jobs[index] for index in batch] for batch in batches]
+
+    if workers == 1 or len(batches) <= 1:
+        batch_results = [_solveBatch(task_name, batch, decompose)
+                         for batch in batch_jobs]
+    else:
+        with ProcessPoolExecutor(
+                max_workers=min(workers, len(batches)),
+                initializer=_initialiseWorker,
+                initargs=(tasks.getSolverBackend(),
+                          tasks.getPreprocessing(),
+                          tasks.getBudget())) as executor:
+            batch_results = list(executor.map(
+                _solveBatch, [task_name] * len(batches), batch_jobs,
+                [decompose] * len(batches)))
+
+    results = [({}, True)] * len(components)
+    for batch, solutions in zip(batches, batch_results):
+        for index, solution in zip(batch, solutions):
+            results[needed[index]] = solution
+    return results
+
+
+def _combineDecisions(task_name, results):
+    """Combine the per component decisions into the decision for each
+        query argument.
+
+    Returns:
+        Dict[int, bool] -- solution for each query argument
+    """
+
+    num_of_missing = sum(1 for _, exists in results if not exists)
+    decisions = {}
+    for component_decisions, exists in results:
+        # Whether every other component has an extension
+        others_exist = num_of_missing == (0 if exists else 1)
+        for arg, decision in component_decisions.items():
+            if task_name.startswith('DC'):
+                decisions[arg] = decision and others_exist
+            else:
+                decisions[arg] = decision or not others_exist
+    return decisions
+
+
+def solveTask(framework, task_name, argument=None, workers=None,
+              decompose=False):
+    """Solve an AF problem task on a framework in terms of argument
+        names (as tasks.solveTask), solving its weakly connected
+        components in parallel.
+
+    Arguments:
+        framework {saf.framework.FrameworkRepresentation} -- object
+            representing the argumentation framework
+        task_name {str} -- the AF problem task identifier (e.g., EE-CO)
+
+    Keyword Arguments:
+        argument {str} -- the name of the query argument of a decision
+            task; None indicates an enumeration task (default: {None})
+        workers {int} -- the number of worker processes; None or 0
+            indicates one per CPU core, and 1 solving the components
+            one by one in this process (default: {None})
+        decompose {bool} -- whether to prefer the method solving the
+            task SCC by SCC, where there is one (default: {False})
+
+    Returns:
+        Iterable[List[str]] or List[str] or bool or None -- the
+            extensions (lazily, for full enumeration), the extension or
+            the decision solving the task
+    """
+
+    # Fail on a task of the wrong type before any solving
+    tasks.getTaskMethod(task_name, is_enumeration=argument is None,
+                        decompose=decompose)
+
+    if len(weaklyConnectedComponents(framework)) <= 1:
+        return tasks.solveTask(framework, task_name, argument,
+                               decompose=decompose)
+
+    if argument is not None:
+        return solveDecisions(framework, task_name, [argument], workers,
+                              decompose)[0][1]
+
+    results = _solveComponents(framework, task_name, (), workers,
+                               decompose)
+
+    if task_name.startswith('SE'):
+        if any(extension is None for extension in results):
+            return None
+        stats.count('extensions')
+        return framework.valuesToArguments(chain.from_iterable(results))
+
+    # The cross product of the components' extensions is only built as
+    # the extensions are consumed
+    return (framework.valuesToArguments(chain.from_iterable(extensions))
+            for extensions in stats.countEach('extensions',
+                                              product(*results)))
+
+
+def solveDecisions(framework, task_name, arguments=None, workers=None,
+                   decompose=False):
+    """Solve a decision AF problem task on a framework for many query
+        arguments at once (as tasks.solveDecisions), solving the weakly
+        connected components holding them in parallel.
+
+    Keyword Arguments:
+        arguments {Iterable[str]} -- the names of the query arguments;
+            None indicates all arguments of the framework
+            (default: {None})
+        workers {int} -- the number of worker processes; None or 0
+            indicates one per CPU core (default: {None})
+        decompose {bool} -- whether to prefer the method solving the
+            task SCC by SCC, where there is one (default: {False})
+
+    Returns:
+        List[Tuple[str, bool]] -- the query arguments' names along with
+            their decisions, in the order given
+    """
+
+    tasks.getTaskMethod(task_name, is_enumeration=False, decompose=decompose)
+
+    if len(weaklyConnectedComponents(framework)) <= 1:
+        return tasks.solveDecisions(framework, task_name, arguments,
+                                    decompose=decompose)
+
+    argument_values = list(framework) if arguments is None \
+        else framework.argumentsToValues(arguments)
+
+    results = _solveComponents(framework, task_name,
+                               dict.fromkeys(argument_values), workers,
+                               decompose)
+    decisions = _combineDecisions(task_name, results)
+    return [(framework.valueToArgument(arg), decisions[arg])
+            for arg in argument_values]
@@ -0,0 +1,336 @@
+# Solved-AF -- Copyright (C) 2020  David Simon Tetruashvili
+
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""This module provides solved-af with a portfolio mode, which races
+    several solver configurations against each other on a single
+    enumeration (SE) or decision (DC/DS) task.
+
+    Each configuration, i.e., a SAT solver backend (an external solver
+    command with its flags, or the in-process CDCL solver) along with
+    the encoding options (grounded preprocessing and SCC-by-SCC
+    solving), is run in a worker process of its own. The first answer
+    is returned and the other workers are killed, along with any
+    external solver processes they have started. The winner of each
+    race can be appended as a JSON line to a log file, e.g.:
+
+        {"instance": "af.tgf", "task": "DC-PR", "argument": "a",
+         "winner": "cdcl-preprocess", "time": 0.0123,
+         "configurations": ["cdcl", "cdcl-preprocess", "glucose"]}
+
+    A portfolio is given as a JSON file holding a list of configurations
+    (see Configuration.fromDict), e.g.:
+
+        [{"name": "glucose", "solver": "external",
+          "command": ["glucose-syrup", "-model", "-verb=0"]},
+         {"name": "cdcl-preprocess", "solver": "cdcl", "preprocess": true}]
+"""
+
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import shutil
+import signal
+import sys
+import time
+from multiprocessing.connection import wait
+
+import saf.tasks as tasks
+
+
+class Configuration:
+    """A solver configuration of a portfolio."""
+
+    def __init__(self, name, solver='cdcl', command=None, preprocess=False,
+                 decompose=False):
+        """Constructor of the Configuration.
+
+        Arguments:
+            name {str} -- the name identifying the configuration in logs
+
+        Keyword Arguments:
+            solver {str} -- the SAT solver backend name (see
+                tasks.getSolverBackends()) (default: {'cdcl'})
+            command {List[str]} -- the solver command of the external
+                backend; None indicates tasks.SAT_COMMAND
+                (default: {None})
+            preprocess {bool} -- whether to only encode the residual of
+                the framework after grounded preprocessing
+                (default: {False})
+            decompose {bool} -- whether to solve the task SCC by SCC,
+                where there is a method for it (default: {False})
+        """
+
+        self.name = name
+        self.solver = solver
+        self.command = command
+        self.preprocess = preprocess
+        self.decompose = decompose
+
+    @classmethod
+    def fromDict(cls, configuration):
+        """Construct a configuration from a dictionary with the keys
+            "name", "solver", "command", "preprocess" and "scc", of
+            which only "name" is required.
+        """
+
+        return cls(configuration['name'],
+                   solver=configuration.get('solver', 'cdcl'),
+                   command=configuration.get('command'),
+                   preprocess=configuration.get('preprocess', False),
+                   decompose=configuration.get('scc', False))
+
+    def getBackend(self):
+        if self.solver == 'external':
+            return tasks.ExternalSolverBackend(self.command)
+        return tasks.getSolverBackend(self.solver)
+
+    def __repr__(self):
+        return F'Configuration({self.name!r})'
+
+
+def defaultPortfolio():
+    """Get the default portfolio: the CDCL backend and, if SAT_COMMAND
+        is in the PATH, the external backend, each with and without
+        grounded preprocessing.
+
+    Returns:
+        List[Configuration] -- the configurations of the portfolio
+    """
+
+    solvers = ['cdcl']
+    if shutil.which(tasks.SAT_COMMAND[0]):
+        solvers.append('external')
+
+    return [Configuration(solver + ('-preprocess' if preprocess else ''),
+                          solver=solver, preprocess=preprocess)
+            for solver in solvers for preprocess in (False, True)]
+
+
+def loadPortfolio(file_path):
+    """Load a portfolio from a JSON file holding a list of
+        configurations (see Configuration.fromDict).
+
+    Returns:
+        List[Configuration] -- the configurations of the portfolio
+    """
+
+    try:
+        with open(file_path) as file:
+            configurations = [Configuration.fromDict(configuration)
+                              for configuration in json.load(file)]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        sys.stderr.write(F'Invalid portfolio file "{file_path}": {e}')
+        sys.stderr.flush()
+        sys.exit(1)
+
+    if not configurations:
+        sys.stderr.write(F'Portfolio file "{file_path}" is empty!')
+        sys.stderr.flush()
+        sys.exit(1)
+
+    return configurations
+
+
+def _leadProcessGroup(pid):
+    """Make a worker process lead a process group of its own, so that
+        the external solver processes it starts are killed along with
+        it. This is done by both the worker and the parent process, as
+        either may run first.
+    """
+
+    if hasattr(os, 'setpgid'):
+        try:
+            os.setpgid(pid, pid)
+        except OSError:
+            pass
+
+
+def _runConfiguration(configuration, framework, task_name, argument,
+                      budget, connection):
+    """Solve a task under a configuration and send the solution (or the
+        error met) through a connection, in a worker process.
+    """
+
+    _leadProcessGroup(0)
+
+    # The solver functions report errors to stderr and exit; the errors
+    # are only reported if no configuration succeeds
+    errors = io.StringIO()
+    try:
+        with contextlib.redirect_stderr(errors):
+            tasks.setSolverBackend(configuration.getBackend())
+            tasks.setPreprocessing(configuration.preprocess)
+            tasks.setBudget(budget)
+            solution = tasks.solveTask(framework, task_name, argument,
+                                       decompose=configuration.decompose)
+        connection.send((True, solution))
+    except tasks.BudgetExceeded as e:
+        connection.send((False, e))
+    except SystemExit:
+        connection.send((False, errors.getvalue().strip() or
+                         'the configuration has failed'))
+    except Exception as e:
+        connection.send((False, F'{type(e).__name__}: {e}'))
+    finally:
+        connection.close()
+
+
+def _kill(process):
+    if not process.is_alive():
+        return
+
+    if hasattr(os, 'killpg'):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            process.kill()
+    else:
+        process.kill()
+
+
+def race(framework, task_name, argument=None, configurations=None):
+    """Race several configurations on a single enumeration or decision
+        task and return the first solution found.
+
+    Arguments:
+        framework {saf.framework.FrameworkRepresentation} -- object
+            representing the argumentation framework
+        task_name {str} -- the AF problem task identifier (e.g., DC-PR)
+
+    Keyword Arguments:
+        argument {str} -- the name of the query argument of a decision
+            task (default: {None})
+        configurations {List[Configuration]} -- the configurations to
+            race; None indicates the default portfolio (default: {None})
+
+    Returns:
+        Tuple -- the solution of the task (as by tasks.solveTask), the
+            winning configuration and the time it took to win
+
+    Raises:
+        RuntimeError -- if every configuration has failed
+        tasks.BudgetExceeded -- if the budget (see tasks.setBudget) is
+            exceeded before any configuration has succeeded
+    """
+
+    if configurations is None:
+        configurations = defaultPortfolio()
+
+    budget = tasks.getBudget()
+    start = time.perf_counter()
+    workers = {}
+    errors = []
+    try:
+        for configuration in configurations:
+            receiver, sender = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(
+                target=_runConfiguration,
+                args=(configuration, framework, task_name, argument,
+                      budget, sender),
+                daemon=True)
+            process.start()
+            _leadProcessGroup(process.pid)
+            sender.close()
+            workers[receiver] = (configuration, process)
+
+        while workers:
+            ready = wait(list(workers), timeout=None if budget is None
+                         else budget.remainingTime())
+            if not ready:
+                raise tasks.BudgetExceeded('time')
+
+            for receiver in ready:
+                configuration, process = workers.pop(receiver)
+                try:
+                    succeeded, solution = receiver.recv()
+                except EOFError:
+                    succeeded, solution = False, 'the worker has died'
+                receiver.close()
+                process.join()
+
+                if succeeded:
+                    return solution, configuration, \
+                        time.perf_counter() - start
+                errors.append((configuration, solution))
+    finally:
+        for receiver, (_, process) in workers.items():
+            _kill(process)
+            process.join()
+            receiver.close()
+
+    budget_errors = [error for _, error in errors
+                     if isinstance(error, tasks.BudgetExceeded)]
+    if budget_errors:
+        raise budget_errors[0]
+
+    raise RuntimeError('Every configuration of the portfolio has failed '
+                       '(' + '; '.join(F'{configuration.name}: {error}'
+                                       for configuration, error in errors)
+                       + ')')
+
+
+def solveTask(framework, task_name, argument=None, configurations=None,
+              log_path=None, instance=None):
+    """Solve a single enumeration or decision task by racing a
+        portfolio of configurations (see race), optionally logging the
+        winner.
+
+    Keyword Arguments:
+        argument {str} -- the name of the query argument of a decision
+            task (default: {None})
+        configurations {List[Configuration]} -- the configurations to
+            race; None indicates the default portfolio (default: {None})
+        log_path {str} -- path of the file to append the winner to as a
+            JSON line; None indicates no logging (default: {None})
+        instance {str} -- the instance name to log, e.g., the input
+            file path (default: {None})
+
+    Returns:
+        List[str] or bool or None -- the extension or the decision
+            solving the task
+    """
+
+    if task_name.startswith('EE'):
+        sys.stderr.write('The portfolio mode only supports single '
+                         'enumeration (SE) and decision (DC/DS) tasks!')
+        sys.stderr.flush()
+        sys.exit(1)
+
+    # Fail on a task of the wrong type before starting any worker
+    tasks.getTaskMethod(task_name, is_enumeration=argument is None)
+
+    if configurations is None:
+        configurations = defaultPortfolio()
+
+    try:
+        solution, winner, elapsed = race(framework, task_name, argument,
+                                         configurations)
+    except RuntimeError as e:
+        sys.stderr.write(str(e))
+        sys.stderr.flush()
+        sys.exit(1)
+
+    if log_path is not None:
+        record = {'instance': instance, 'task': task_name,
+                  'argument': argument, 'winner': winner.name,
+                  'time': round(elapsed, 6),
+                  'configurations': [configuration.name
+                                     for configuration in configurations]}
+        with open(log_path, 'a') as log:
+            log.write(json.dumps(record) + '\n')
+
+    return solution
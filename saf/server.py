@@ -0,0 +1,361 @@
+# Solved-AF -- Copyright (C) 2020  David Simon Tetruashvili
+
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""This module provides solved-af with a server mode, which answers
+    many task queries in one long-running process, keeping the parsed
+    frameworks (and their encodings) between queries.
+
+    usage: python -m saf.server [ --socket PATH ] [ --cache-size N ] [ -v ]
+                                [ -r {list, array, bitset} ]
+                                [ -s {external, cdcl} ] [ --scc ]
+                                [ --preprocess ]
+
+    Queries are read as JSON lines, from stdin or from the clients of a
+    Unix socket, e.g.:
+
+        {"id": 1, "file": "af.tgf", "format": "tgf", "task": "DC-PR",
+         "argument": "a"}
+
+    where "format" defaults to the file's extension, "argument" is only
+    given for decision tasks and "id" (optional) is echoed back. A
+    decision task may instead be given "arguments", a list of query
+    arguments or "all", to decide them all at once. Each query is
+    answered by a JSON line holding the output of the task (as by
+    saf.io.outputSolution or saf.io.outputDecisions) or the error it
+    caused:
+
+        {"id": 1, "output": "YES\\n"}
+        {"id": 2, "error": "..."}
+
+    A query may also give a "timeout" (in seconds) and a "memory_limit"
+    (in MB); its answer then holds the output found within them and its
+    "status" (see saf.tasks.budgetStatus). A query with "stats": true is
+    answered along with the "stats" of its solving (see saf.stats).
+
+    The types of the fields of a query are checked before it is solved
+    (see validateQuery), and a query which fails in any way is answered
+    by its error without stopping the server.
+"""
+
+import argparse
+import contextlib
+import io as _io
+import json
+import os
+import socketserver
+import sys
+
+import saf.io as io
+import saf.stats as stats
+import saf.tasks as tasks
+import saf.utils as utils
+from saf.framework import getRepresentation, getRepresentations
+
+# The number of frameworks kept by default
+DEFAULT_CACHE_SIZE = 16
+
+
+# The types of the fields of a query, of which "file" and "task" are
+# required (bool is excluded from the numbers, despite being an int)
+_QUERY_FIELD_TYPES = {
+    'file': (str,),
+    'task': (str,),
+    'format': (str, type(None)),
+    'argument': (str, type(None)),
+    'arguments': (list, str, type(None)),
+    'timeout': (int, float, type(None)),
+    'memory_limit': (int, float, type(None)),
+    'stats': (bool, type(None))
+}
+_REQUIRED_QUERY_FIELDS = ('file', 'task')
+
+
+def validateQuery(query):
+    """Check the types of the fields of a query, before any of them is
+        used.
+
+    Raises:
+        KeyError -- if a required field is missing
+        ValueError -- if a field is of the wrong type
+    """
+
+    for field in _REQUIRED_QUERY_FIELDS:
+        if field not in query:
+            raise KeyError(field)
+
+    for field, types in _QUERY_FIELD_TYPES.items():
+        value = query.get(field)
+        if not isinstance(value, types) or (
+                isinstance(value, bool) and bool not in types):
+            raise ValueError(F'"{field}" is of the wrong type '
+                             F'({type(value).__name__}).')
+
+    arguments = query.get('arguments')
+    if isinstance(arguments, str) and arguments != 'all' or \
+            isinstance(arguments, list) and \
+            not all(isinstance(argument, str) for argument in arguments):
+        raise ValueError('"arguments" must be a list of argument names '
+                         'or "all".')
+
+
+class SolverServer:
+    """Answers task queries, keeping the parsed frameworks in a bounded
+        LRU cache keyed by their file path, modification time, format
+        and validation, so that a changed file is parsed again. The
+        encodings of a framework are kept along with it (see
+        tasks.setEncodingCache) and released when it is evicted.
+    """
+
+    def __init__(self, representation='list', decompose=False,
+                 validate=False, cache_size=DEFAULT_CACHE_SIZE):
+        self._representation = getRepresentation(representation)
+        self._decompose = decompose
+        self._validate = validate
+        self._frameworks = utils.LRUCache(cache_size)
+        tasks.setEncodingCache(True)
+
+    def getFramework(self, file_path, format):
+        """Get the framework of a file, parsing it only if it is not in
+            the cache or has been modified since.
+        """
+
+        file_path = os.path.realpath(file_path)
+        key = (file_path, os.stat(file_path).st_mtime_ns, format,
+               self._validate)
+
+        af = self._frameworks.get(key)
+        if af is None:
+            af = io.loadFramework(file_path, format=format,
+                                  validate=self._validate,
+                                  representation=self._representation)
+            self._frameworks.put(key, af)
+        return af
+
+    def answer(self, query):
+        """Answer a single query.
+
+        Arguments:
+            query {Dict} -- the query (see the module's documentation)
+
+        Returns:
+            Dict -- the answer to the query
+        """
+
+        answer = {'id': query['id']} if 'id' in query else {}
+        output, errors = _io.StringIO(), _io.StringIO()
+
+        try:
+            validateQuery(query)
+        except KeyError as e:
+            answer['error'] = F'Query is missing {e}.'
+            return answer
+        except ValueError as e:
+            answer['error'] = F'Invalid query: {e}'
+            return answer
+
+        # The solver functions report errors to stderr and exit, as they
+        # would in a single query process
+        budgeted = 'timeout' in query or 'memory_limit' in query
+        if query.get('stats'):
+            stats.reset()
+            stats.enable()
+        try:
+            with contextlib.redirect_stdout(output), \
+                    contextlib.redirect_stderr(errors):
+                if budgeted:
+                    memory_limit = query.get('memory_limit')
+                    tasks.setBudget(tasks.Budget(
+                        query.get('timeout'), None if memory_limit is None
+                        else memory_limit * 2 ** 20))
+                try:
+                    self._solveQuery(query)
+                    status = tasks.budgetStatus(query['task'].upper())
+                except tasks.BudgetExceeded as e:
+                    status = tasks.budgetStatus(query['task'].upper(), e)
+        except SystemExit:
+            answer['error'] = errors.getvalue() or 'The query has failed.'
+            return answer
+        except (KeyError, TypeError, ValueError, OSError) as e:
+            if isinstance(e, KeyError):
+                e = F'Query is missing {e}.'
+            answer['error'] = str(e)
+            return answer
+        except Exception as e:
+            # A failing query must not take the server down
+            answer['error'] = F'{type(e).__name__}: {e}'
+            return answer
+        finally:
+            tasks.setBudget(None)
+            if stats.isEnabled():
+                answer['stats'] = stats.getStats()
+                stats.enable(False)
+
+        answer['output'] = output.getvalue()
+        if budgeted:
+            answer['status'] = status
+        return answer
+
+    def _solveQuery(self, query):
+        """Solve the task of a query and output its solution."""
+
+        file_path = query['file']
+        format = query.get('format') or \
+            os.path.splitext(file_path)[1].lstrip('.').lower()
+        task_name = query['task'].upper()
+        argument = query.get('argument')
+        arguments = query.get('arguments')
+        if task_name not in tasks.getTasks():
+            raise ValueError(F'Task {task_name} is not supported!')
+        if argument is not None and arguments is not None:
+            raise ValueError('Query must not have both "argument" '
+                             'and "arguments".')
+
+        af = self.getFramework(file_path, format)
+        tasks.checkBudget()
+        if arguments is not None:
+            if arguments == 'all':
+                arguments = None
+            for query_argument in arguments or []:
+                if not af.hasArgument(query_argument):
+                    raise ValueError(F'Argument "{query_argument}" is not '
+                                     'in the framework!')
+
+            decisions = tasks.solveDecisions(af, task_name, arguments,
+                                             decompose=self._decompose)
+            io.outputDecisions(decisions)
+        elif argument is not None and not af.hasArgument(argument):
+            raise ValueError(
+                F'Argument "{argument}" is not in the framework!')
+        else:
+            solution = tasks.solveTask(af, task_name, argument,
+                                       decompose=self._decompose)
+            io.outputSolution(solution, task_name[:2])
+
+    def answerLine(self, line):
+        """Answer a query given as a JSON line by a JSON line (without
+            the line ending); blank lines are not answered.
+        """
+
+        if not line.strip():
+            return None
+
+        try:
+            query = json.loads(line)
+            if not isinstance(query, dict):
+                raise ValueError('Query must be a JSON object.')
+        except ValueError as e:
+            return json.dumps({'error': F'Invalid query: {e}'})
+
+        return json.dumps(self.answer(query))
+
+    def serveStream(self, input_stream, output_stream):
+        """Answer the queries of an input stream of lines, one by one,
+            as they arrive.
+        """
+
+        for line in input_stream:
+            answer = self.answerLine(line)
+            if answer is not None:
+                output_stream.write(answer + '\n')
+                output_stream.flush()
+
+
+def _serveSocket(server, socket_path):
+    """Answer the queries of the clients of a Unix socket, one client
+        at a time.
+    """
+
+    if not hasattr(socketserver, 'UnixStreamServer'):
+        sys.stderr.write('Unix sockets are not supported on this platform.')
+        sys.stderr.flush()
+        sys.exit(1)
+
+    class QueryHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            server.serveStream(
+                _io.TextIOWrapper(self.rfile, encoding='utf-8'),
+                _io.TextIOWrapper(self.wfile, encoding='utf-8',
+                                  write_through=True))
+
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+
+    with socketserver.UnixStreamServer(socket_path, QueryHandler) as unix:
+        try:
+            unix.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.remove(socket_path)
+
+
+def _initialiseArgumentParser():
+    parser = argparse.ArgumentParser(
+        description='Answer solved-af task queries given as JSON lines.')
+    parser.add_argument('--socket',
+                        metavar='PATH',
+                        help='Serve the clients of a Unix socket at PATH \
+                            instead of stdin/stdout')
+    parser.add_argument('--cache-size',
+                        type=int,
+                        default=DEFAULT_CACHE_SIZE,
+                        help='Number of parsed frameworks to keep')
+    parser.add_argument('-v',
+                        '--validate',
+                        action='store_true',
+                        help='Enable validation of the input files \
+                            before parsing')
+    parser.add_argument('-r',
+                        '--representation',
+                        default='list',
+                        choices=getRepresentations(),
+                        help='Framework representation to solve with')
+    parser.add_argument('-s',
+                        '--solver',
+                        default='external',
+                        choices=tasks.getSolverBackends(),
+                        help='SAT solver backend to solve with')
+    parser.add_argument('--scc',
+                        action='store_true',
+                        help='Solve the frameworks SCC by SCC where the \
+                            semantics allows it')
+    parser.add_argument('--preprocess',
+                        action='store_true',
+                        help='Leave the arguments decided by the grounded \
+                            labelling out of the SAT encoding')
+    return parser
+
+
+def main():
+    args = _initialiseArgumentParser().parse_args()
+
+    tasks.setSolverBackend(args.solver)
+    tasks.setPreprocessing(args.preprocess)
+
+    server = SolverServer(args.representation, decompose=args.scc,
+                          validate=args.validate,
+                          cache_size=args.cache_size)
+
+    if args.socket is None:
+        try:
+            server.serveStream(sys.stdin, sys.stdout)
+        except KeyboardInterrupt:
+            pass
+    else:
+        _serveSocket(server, args.socket)
+
+
+if __name__ == "__main__":
+    main()
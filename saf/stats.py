@@ -0,0 +1,260 @@
+# Solved-AF -- Copyright (C) 2020  David Simon Tetruashvili
+
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""This module provides solved-af with instrumentation of its solving:
+    the wall-clock and CPU time spent in each phase and counters of
+    the work done, e.g.:
+
+        {"phases": {"parse": {"wall": 0.0012, "cpu": 0.0012, "calls": 1},
+                    "encode": {"wall": 0.0031, "cpu": 0.0031, "calls": 2},
+                    "solve": {"wall": 0.0425, "cpu": 0.0398, "calls": 7},
+                    ...},
+         "counters": {"solver_calls": 7, "clauses": 312, "variables": 90,
+                      "extensions": 4, ...},
+         "caches": {"saf.tasks.groundedReduction": {"hits": 3,
+                                                    "misses": 1}, ...}}
+
+    The phases are "parse" (reading the input file), "construct"
+    (building the framework representation), "encode" (the reduction to
+    SAT, e.g. DIMACSParser.parse), "solve" (the SAT solver, including
+    the external solver processes' CPU time), "extract" (reading the
+    assignment from the external solver's output) and "maximal"
+    (getAllMaximal). Phases may nest, so their times need not add up.
+    The CPU times include those of finished child processes.
+
+    The instrumentation is disabled by default, in which case each
+    instrumented point only costs a check of a flag. Once enabled (see
+    enable), embedding applications can read the stats (see getStats)
+    or be called back at the end of each phase (see addHook). Only the
+    current process is instrumented, not the worker processes of the
+    parallel and portfolio modes.
+"""
+
+import json
+import os
+import sys
+import time
+from functools import wraps
+
+import saf.utils as utils
+
+_enabled = False
+
+# The totals of each phase: [wall time, CPU time, number of times]
+_phases = {}
+
+_counters = {}
+
+# The hits and misses of each memoization cache when the stats were
+# last reset, to report the cache use since
+_cache_baseline = {}
+
+_hooks = []
+
+
+def _cpuTime():
+    times = os.times()
+    return times.user + times.system + \
+        times.children_user + times.children_system
+
+
+class _Phase:
+    """Context manager timing a phase while the stats are enabled."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self._wall = time.perf_counter()
+        self._cpu = _cpuTime()
+        return self
+
+    def __exit__(self, *_):
+        wall = time.perf_counter() - self._wall
+        cpu = _cpuTime() - self._cpu
+
+        totals = _phases.get(self.name)
+        if totals is None:
+            totals = _phases[self.name] = [0.0, 0.0, 0]
+        totals[0] += wall
+        totals[1] += cpu
+        totals[2] += 1
+
+        for hook in _hooks:
+            hook(self.name, wall, cpu)
+
+
+class _NoPhase:
+    """Context manager standing in for _Phase while the stats are
+        disabled.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        pass
+
+
+_NO_PHASE = _NoPhase()
+
+
+def enable(enabled=True):
+    """Enable (or disable) the instrumentation. The stats gathered so
+        far are kept; see reset.
+    """
+
+    global _enabled
+    _enabled = enabled
+
+
+def isEnabled():
+    return _enabled
+
+
+def reset():
+    """Forget the stats gathered so far."""
+
+    _phases.clear()
+    _counters.clear()
+    _cache_baseline.clear()
+    _cache_baseline.update(_cacheTotals())
+
+
+def phase(name):
+    """Get a context manager timing a phase of the solving, e.g.:
+
+        with stats.phase('encode'):
+            sat_input = reduction_parser.parse(framework)
+    """
+
+    if not _enabled:
+        return _NO_PHASE
+    return _Phase(name)
+
+
+def timed(name):
+    """Decorate a function so that each of its calls is timed as a
+        phase (see phase).
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def timed_func(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Phase(name):
+                return func(*args, **kwargs)
+        return timed_func
+
+    return decorator
+
+
+def count(name, by=1):
+    """Add to a counter, e.g., of the SAT solver calls."""
+
+    if _enabled:
+        _counters[name] = _counters.get(name, 0) + by
+
+
+def countEach(name, iterable):
+    """Count the items of an iterable as they are consumed.
+
+    Returns:
+        Iterable -- the items of the iterable
+    """
+
+    if not _enabled:
+        return iterable
+    return _countEach(name, iterable)
+
+
+def _countEach(name, iterable):
+    for item in iterable:
+        count(name)
+        yield item
+
+
+def addHook(hook):
+    """Add a hook called at the end of each phase (while the stats are
+        enabled) with the name of the phase and its wall-clock and CPU
+        times in seconds.
+
+    Arguments:
+        hook {Callable[[str, float, float], None]} -- the hook to call
+    """
+
+    _hooks.append(hook)
+
+
+def removeHook(hook):
+    _hooks.remove(hook)
+
+
+def _cacheTotals():
+    """Get the hits and misses of every memoization cache, summing those
+        of the scoped caches of a function.
+    """
+
+    totals = {name: [stats['hits'], stats['misses']]
+              for name, stats in utils.getCacheStats().items()}
+    for name, stats in utils.getScopedCacheStats().items():
+        name_totals = totals.setdefault(name, [0, 0])
+        name_totals[0] += stats['hits']
+        name_totals[1] += stats['misses']
+    return totals
+
+
+def getStats():
+    """Get the stats gathered since they were last reset.
+
+    Returns:
+        Dict -- the wall-clock and CPU time (in seconds) and number of
+            times of each phase, the counters, and the hits and misses
+            of each memoization cache which has been used
+    """
+
+    caches = {}
+    for name, (hits, misses) in _cacheTotals().items():
+        base_hits, base_misses = _cache_baseline.get(name, (0, 0))
+        # Scoped caches released since the reset no longer count, so
+        # the difference is bounded below
+        hits, misses = max(0, hits - base_hits), max(0, misses - base_misses)
+        if hits or misses:
+            caches[name] = {'hits': hits, 'misses': misses}
+
+    return {'phases': {name: {'wall': round(wall, 6), 'cpu': round(cpu, 6),
+                              'calls': calls}
+                       for name, (wall, cpu, calls) in _phases.items()},
+            'counters': dict(_counters),
+            'caches': caches}
+
+
+def writeStats(file_path=None):
+    """Write the stats as JSON to a file, or to stderr.
+
+    Keyword Arguments:
+        file_path {str} -- path of the file to write; None or '-'
+            indicates stderr (default: {None})
+    """
+
+    output = json.dumps(getStats())
+    if file_path is None or file_path == '-':
+        sys.stderr.write(output + '\n')
+        sys.stderr.flush()
+        return
+
+    with open(file_path, 'w') as file:
+        file.write(output + '\n')
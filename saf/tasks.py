@@ -17,44 +17,204 @@
     argumentation framework problems/tasks to solved-af.
 """
 
+import abc
 import errno
 import subprocess
 import sys
-
-from saf.framework import getAllMaximal
+import time
+from typing import List, Optional
+
+import saf.stats as stats
+import saf.utils as utils
+from saf.cdcl import CDCLSolver
+from saf.framework import (getAncestors, groundedLabelling, restrictFramework,
+                           stronglyConnectedComponents)
 from saf.theories import (DIMACSParser, completeLabelingParser,
                           stableLabellingParser)
 
+try:
+    import resource
+except ImportError:
+    # Not available on all platforms; memory is then left unlimited
+    resource = None
+
 # Set the external SAT solver command here as a list of individual
 # command arguments along with the expected return code indicating that
 # the external SAT solver deems the given theory UNSATISFIABLE.
 SAT_COMMAND = ['glucose-syrup', '-model', '-verb=0']
 UNSAT_RET_CODE = 20
+SAT_RET_CODE = 10
+
+# The status markers of a solution solved within a budget (see
+# solveTaskWithinBudget): complete, or cut short by the budget with the
+# part found so far, or without any of it.
+COMPLETE = 'complete'
+PARTIAL = 'partial'
+TIMEOUT = 'timeout'
+MEMOUT = 'memout'
+
+
+# The number of clauses loaded into the in-process solver between two
+# checks of the budget
+_BUDGET_CHECK_INTERVAL = 4096
+
+
+class BudgetExceeded(Exception):
+    """Raised by the SAT sessions once the time or memory budget of the
+        solving (see setBudget) is exceeded.
+    """
+
+    def __init__(self, resource):
+        """Constructor of the BudgetExceeded.
+
+        Arguments:
+            resource {str} -- the exceeded resource: 'time' or 'memory'
+        """
+
+        super().__init__(resource)
+        self.resource = resource
+
+    def __str__(self):
+        return F'The {self.resource} budget has been exceeded.'
+
+
+class Budget:
+    """A wall-clock time and memory budget, starting at its creation."""
+
+    def __init__(self, time_limit=None, memory_limit=None):
+        """Constructor of the Budget.
+
+        Keyword Arguments:
+            time_limit {float} -- the wall-clock time allowed, in
+                seconds; None indicates no limit (default: {None})
+            memory_limit {int} -- the memory allowed, in bytes, for this
+                process and for each external solver process; None
+                indicates no limit (default: {None})
+        """
+
+        self.time_limit = time_limit
+        self.memory_limit = memory_limit
+        self._deadline = None if time_limit is None \
+            else time.monotonic() + time_limit
+
+    def remainingTime(self):
+        """Get the time left in seconds; None indicates no limit."""
+
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - time.monotonic())
+
+    def exceeded(self):
+        """Get the exceeded resource, if any.
+
+        Returns:
+            str or None -- 'time' or 'memory'; None indicates that the
+                budget is not exceeded
+        """
+
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            return 'time'
+        if self.memory_limit is not None and \
+                _peakMemory() > self.memory_limit:
+            return 'memory'
+        return None
+
+    def check(self):
+        """Raise BudgetExceeded if the budget is exceeded."""
+
+        exceeded = self.exceeded()
+        if exceeded is not None:
+            raise BudgetExceeded(exceeded)
+
+
+def _peakMemory():
+    """Get the peak resident memory of this process in bytes (0 where it
+        cannot be measured).
+    """
+
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Given in kilobytes, except on macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _limitSolverMemory(memory_limit):
+    """Get the function limiting the address space of an external solver
+        process to the memory budget, run in it before the solver."""
+
+    if memory_limit is None or resource is None:
+        return None
+
+    def limit():
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+
+    return limit
+
 
+def runSATSolver(sat_input, command=None, assumptions=(), budget=None):
+    """Given a DIMACSInput (or DIMACS encoded input for your solver),
+        run the SAT solver from SAT_COMMAND on the input and return the
+        solver process object.
 
-def runSATSolver(encoded_sat_input):
-    """Given DIMACS encoded (or encoded for your solver) input, run the
-        SAT solver from SAT_COMMAND on the input and return the solver
-        process object.
+        A DIMACSInput is streamed to the solver's stdin from its byte
+        buffer, so the DIMACS string is never built in memory.
 
     Arguments:
-        encoded_sat_input {str} -- string into to the external
-            SAT solver
+        sat_input {DIMACSInput, str} -- input to the external SAT
+            solver
+
+    Keyword Arguments:
+        command {List[str]} -- the solver command to run instead of
+            SAT_COMMAND (default: {None})
+        assumptions {List[int]} -- literals to assume, as unit clauses,
+            for this run only (default: {()})
+        budget {Budget} -- the budget to run the solver within; the
+            solver is killed once its time runs out, and its memory is
+            limited to the budget's (default: {None})
 
     Returns:
         subprocess.CompletedProcess -- object representation of the
             external SAT solver process that has finished.
+
+    Raises:
+        BudgetExceeded -- if the solver has run out of time
     """
 
+    if command is None:
+        command = SAT_COMMAND
+
+    timeout = memory_limit = None
+    if budget is not None:
+        timeout, memory_limit = budget.remainingTime(), budget.memory_limit
+
     try:
-        solver = subprocess.run(SAT_COMMAND, stdout=subprocess.PIPE,
-                                input=encoded_sat_input, encoding='ascii')
-        return solver
+        with subprocess.Popen(
+                command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                preexec_fn=_limitSolverMemory(memory_limit)) as solver:
+            try:
+                if isinstance(sat_input, str):
+                    solver.stdin.write(sat_input.encode('ascii'))
+                else:
+                    sat_input.writeTo(solver.stdin, assumptions)
+            except BrokenPipeError:
+                # The solver has stopped reading (e.g., it has already
+                # found its answer); its output is still read below.
+                pass
+            try:
+                stdout, _ = solver.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                solver.kill()
+                solver.wait()
+                raise BudgetExceeded('time')
+
+        return subprocess.CompletedProcess(command, solver.returncode,
+                                           stdout.decode('ascii'))
 
     except OSError as e:
         # see if solver is installed
         if e.errno == errno.ENOENT:
-            solver_name = SAT_COMMAND[0]
+            solver_name = command[0]
             sys.stderr.write(
                 (
                     F'command not found: \'{solver_name}\'\n\n'
@@ -71,8 +231,8 @@ def runSATSolver(encoded_sat_input):
         # TODO Get the program name from setuptools
         # TODO instead of sys.argv[0]
         sys.stderr.write(
-            (F'{sys.argv[0]} encountered an internal error.'
-             F'The SAT solver command \'{" ".join(SAT_COMMAND)}\' '
+            (F'{sys.argv[0]} encountered an internal error. '
+             F'The SAT solver command \'{" ".join(command)}\' '
              F'has failed with return code {e.returncode}.')
         )
         sys.stderr.flush()
@@ -83,45 +243,451 @@ def negateClause(clause):
     return [-lab_var for lab_var in clause]
 
 
-def extractAssignment(raw_dimacs_output):
+def extractAssignment(raw_dimacs_output, command=None):
     """Extract a labelling variable assignment from the external SAT
         solver output.
 
     Arguments:
         raw_dimacs_output {str} -- DIAMCS encoded SAT solver output
 
+    Keyword Arguments:
+        command {List[str]} -- the SAT solver command which has output
+            it, to report an incomplete assignment; None indicates
+            SAT_COMMAND (default: {None})
+
     Returns:
         List[int] -- labelling variable assignment
     """
 
-    # TODO Find the line which starts with 'v' explicitly,
-    # TODO raise error if not found
-    assignment_line = raw_dimacs_output.split('\n')[-2]
-    # Get a list of strings from the assignment line exclusing the
-    # beginning 'v' and the concluding '0' converted to ints
-    return [int(lab_var) for lab_var in assignment_line.split()[1:-1]]
+    # Solvers may split the assignment over several 'v' lines, the last
+    # of which is concluded by a '0'
+    assignment = []
+    for line in raw_dimacs_output.splitlines():
+        if line.startswith('v'):
+            assignment += [int(lab_var) for lab_var in line.split()[1:]]
+
+    if not assignment or assignment[-1] != 0:
+        if command is None:
+            command = SAT_COMMAND
+        sys.stderr.write(
+            (F'{sys.argv[0]} encountered an internal error. '
+             F'The SAT solver command \'{" ".join(command)}\' '
+             'has not output a complete assignment.')
+        )
+        sys.stderr.flush()
+        sys.exit(1)
+
+    return assignment[:-1]
+
+
+class SATSession(metaclass=abc.ABCMeta):
+    """Abstract class defining a SAT solving session. A session is
+        opened on an encoded theory once and is then asked for models
+        any number of times, with clauses (e.g., blocking clauses) added
+        and assumptions given one at a time in between.
+    """
+
+    def __init__(self, sat_input):
+        """Constructor of the SATSession.
+
+        Arguments:
+            sat_input {saf.theories.DIMACSInput} -- the encoded theory
+                the session is opened on
+        """
+
+        super().__init__()
+        self._sat_input = sat_input
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    @abc.abstractmethod
+    def addClause(self, clause: List[int]):
+        """Permanently add a clause to the theory of the session."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def solve(self, assumptions: List[int] = ()) -> Optional[List[int]]:
+        """Find a model of the theory of the session under the given
+            assumptions (literals which are to hold for this call only).
+
+        Keyword Arguments:
+            assumptions {List[int]} -- literals assumed to be true
+                (default: {()})
+
+        Returns:
+            List[int] or None -- the variable assignment found;
+                None indicates the theory is unsatisfiable under the
+                assumptions
+        """
+        raise NotImplementedError
+
+    def newVariable(self) -> int:
+        """Introduce a fresh (auxiliary) variable to the theory of the
+            session.
+
+        Returns:
+            int -- the new variable
+        """
+
+        return self._sat_input.newVariable()
+
+    def close(self):
+        """Release any resources held by the session."""
+        pass
+
+
+class ExternalSATSession(SATSession):
+    """SAT session backed by an external SAT solver command.
+
+        The solver command reads a whole DIMACS input on each run and
+        has no incremental interface, so the session keeps the encoded
+        input and only ever appends the added clauses to it. Assumptions
+        are passed to the solver as unit clauses for the one call.
+    """
+
+    def __init__(self, sat_input, command=None):
+        super().__init__(sat_input)
+        self._command = command
+
+    def addClause(self, clause):
+        self._sat_input.addClause(clause)
+
+    def solve(self, assumptions=()):
+        budget = getBudget()
+        if budget is not None:
+            budget.check()
+
+        stats.count('solver_calls')
+        with stats.phase('solve'):
+            solver = runSATSolver(self._sat_input, self._command,
+                                  assumptions, budget)
+
+        if solver.returncode == UNSAT_RET_CODE:
+            return None
+
+        if budget is not None and budget.memory_limit is not None and \
+                solver.returncode not in (0, SAT_RET_CODE):
+            # The solver has failed within its memory limit
+            raise BudgetExceeded('memory')
+
+        with stats.phase('extract'):
+            return extractAssignment(solver.stdout, solver.args)
+
+
+class CDCLSATSession(SATSession):
+    """SAT session backed by the in-process CDCL solver. The solver
+        keeps its clauses, learnt clauses and branching heuristics
+        between calls.
+    """
+
+    def __init__(self, sat_input):
+        super().__init__(sat_input)
+        budget = getBudget()
+        with stats.phase('solve'):
+            self._solver = CDCLSolver(sat_input.getNumOfVars())
+            for i, clause in enumerate(sat_input.getClauses()):
+                if budget is not None and i % _BUDGET_CHECK_INTERVAL == 0:
+                    budget.check()
+                self._solver.addClause(clause)
+
+    def newVariable(self):
+        variable = super().newVariable()
+        self._solver.ensureVars(variable)
+        return variable
+
+    def addClause(self, clause):
+        self._solver.addClause(clause)
+
+    def solve(self, assumptions=()):
+        budget = getBudget()
+        stats.count('solver_calls')
+        with stats.phase('solve'):
+            if budget is None:
+                satisfiable = self._solver.solve(assumptions)
+            else:
+                budget.check()
+                satisfiable = self._solver.solve(assumptions,
+                                                 interrupt=budget.exceeded)
+                if satisfiable is None:
+                    budget.check()
+
+        if not satisfiable:
+            return None
+
+        return self._solver.getModel()
+
+
+class SolverBackend(metaclass=abc.ABCMeta):
+    """Abstract class defining a SAT solver backend, i.e., the means by
+        which the tasks open SAT sessions.
+    """
+
+    @abc.abstractmethod
+    def openSession(self, sat_input) -> SATSession:
+        """Open a SAT session on an encoded theory.
+
+        Arguments:
+            sat_input {saf.theories.DIMACSInput} -- the encoded theory
+
+        Returns:
+            SATSession -- the session opened on the theory
+        """
+        raise NotImplementedError
+
+
+class ExternalSolverBackend(SolverBackend):
+    """Backend running an external SAT solver process per call."""
+
+    def __init__(self, command=None):
+        """Constructor of the ExternalSolverBackend.
+
+        Keyword Arguments:
+            command {List[str]} -- the solver command to run; None
+                indicates SAT_COMMAND (default: {None})
+        """
+
+        super().__init__()
+        self._command = command
+
+    def openSession(self, sat_input):
+        return ExternalSATSession(sat_input, self._command)
+
+
+class CDCLSolverBackend(SolverBackend):
+    """Backend solving in-process with saf.cdcl.CDCLSolver, without any
+        process creation or DIMACS text encoding.
+    """
+
+    def openSession(self, sat_input):
+        return CDCLSATSession(sat_input)
+
+
+_solverBackends = {
+    # Here list all supported SAT solver backends by name.
+    'external': ExternalSolverBackend(),
+    'cdcl': CDCLSolverBackend()
+}
+
+_current_backend = _solverBackends['external']
+
+_preprocessing = False
+
+_budget = None
+
+# Whether encodings are memoized for their frameworks (see encode).
+_encoding_cache = False
+
+
+def getSolverBackends():
+    return list(_solverBackends.keys())
+
+
+def setSolverBackend(backend):
+    """Set the SAT solver backend used by the tasks by default.
+
+    Arguments:
+        backend {str or SolverBackend} -- a backend name from
+            getSolverBackends() or a backend object
+    """
+
+    global _current_backend
+    _current_backend = getSolverBackend(backend)
+
+
+def getSolverBackend(backend=None):
+    """Resolve a SAT solver backend.
+
+    Keyword Arguments:
+        backend {str or SolverBackend} -- a backend name, a backend
+            object or None for the current default (default: {None})
+
+    Returns:
+        SolverBackend -- the resolved backend
+    """
+
+    if backend is None:
+        return _current_backend
+
+    if isinstance(backend, SolverBackend):
+        return backend
+
+    try:
+        return _solverBackends[backend]
+    except KeyError:
+        sys.stderr.write(F'SAT solver backend "{backend}" is not supported!')
+        sys.stderr.write('Use one of: ' + ', '.join(getSolverBackends()))
+        sys.stderr.flush()
+        sys.exit(1)
 
 
-def excludeAssignment(solution, sat_input):
-    """Add an additional clause to the SAT solver DIMACS input which
-        will prevent an already found assignment to be generated again
-        in subsuquent SAT solver runs. The clause added is the negation
-        of the positive literals of the given assignment.
+def openSATSession(sat_input, backend=None):
+    """Open a SAT session on a encoded theory.
+
+    Arguments:
+        sat_input {saf.theories.DIMACSInput} -- the encoded theory
+
+    Keyword Arguments:
+        backend {str or SolverBackend} -- the backend to open the
+            session with; None indicates the current default
+            (default: {None})
+
+    Returns:
+        SATSession -- the session opened on the theory
+    """
+
+    return getSolverBackend(backend).openSession(sat_input)
+
+
+def excludeAssignment(solution, session):
+    """Add an additional clause to the SAT session which will prevent an
+        already found assignment to be generated again in subsuquent
+        calls to the solver. The clause added is the negation of the
+        positive literals of the given assignment.
 
     Arguments:
         solution {List[int]} -- a labelling variable assignment
-        sat_input {saf.theories.DIMACSInput} -- object representing
-            current SAT solver input
+        session {SATSession} -- the session in which the assignment
+            was found
     """
 
-    # TODO Extract methods from DIMACS parser
     positive_literals = DIMACSParser.extractPositiveLiterals(solution)
-    negation_clause = negateClause(positive_literals)
-    negation_dimacs = DIMACSParser.parseClause(negation_clause)
-    sat_input.addSingleClause(negation_dimacs)
+    session.addClause(negateClause(positive_literals))
+
+
+def setPreprocessing(enabled):
+    """Enable or disable the grounded preprocessing of frameworks before
+        they are encoded by the reduction parsers which allow for it
+        (see groundedReduction).
+
+    Arguments:
+        enabled {bool} -- whether to preprocess by default
+    """
+
+    global _preprocessing
+    _preprocessing = enabled
+
+
+def getPreprocessing():
+    return _preprocessing
+
+
+def setBudget(budget):
+    """Set the time and memory budget within which the SAT sessions
+        solve (see Budget); once it is exceeded, they raise
+        BudgetExceeded.
+
+    Arguments:
+        budget {Budget} -- the budget; None indicates no budget
+    """
+
+    global _budget
+    _budget = budget
+
+
+def getBudget():
+    return _budget
+
+
+def checkBudget():
+    """Raise BudgetExceeded if the budget of the solving (see setBudget)
+        is exceeded, e.g. between its phases. Without a budget, do
+        nothing.
+    """
+
+    if _budget is not None:
+        _budget.check()
+
+
+def setEncodingCache(enabled):
+    """Enable or disable keeping the SAT encoding of each framework by
+        each reduction parser for as long as the framework is kept (see
+        encode), e.g., for a process solving many tasks on the same
+        frameworks.
+
+    Arguments:
+        enabled {bool} -- whether to cache encodings
+    """
+
+    global _encoding_cache
+    _encoding_cache = enabled
 
 
-def singleEnumeration(framework, reduction_parser):
+@utils.memoize(scoped=True, maxsize=8)
+def _cachedEncoding(framework, reduction_parser):
+    return reduction_parser.parse(framework)
+
+
+def encode(framework, reduction_parser):
+    """Encode a framework with a reduction parser. If the encoding cache
+        is enabled (see setEncodingCache), the encoding is memoized for
+        the framework and a copy of it is returned, as sessions add
+        clauses and variables to their input.
+
+    Arguments:
+        framework {saf.framework.FrameworkRepresentation} -- object
+            representing the argumentation framework
+        reduction_parser {saf.theories.DIMACSParser} -- parser object
+            to construct the reduction of the framework to a SAT solver
+            problem input
+
+    Returns:
+        saf.theories.DIMACSInput -- the encoding of the framework
+    """
+
+    with stats.phase('encode'):
+        if not _encoding_cache:
+            sat_input = reduction_parser.parse(framework, check=checkBudget)
+        else:
+            sat_input = _cachedEncoding(framework, reduction_parser).copy()
+    checkBudget()
+
+    stats.count('encodings')
+    stats.count('variables', sat_input.getNumOfVars())
+    stats.count('clauses', sat_input.getNumOfClauses())
+    return sat_input
+
+
+def _usesPreprocessing(reduction_parser, preprocess):
+    if preprocess is None:
+        preprocess = _preprocessing
+    return preprocess and getattr(reduction_parser, 'grounded_reducible',
+                                  False)
+
+
+@utils.memoize(scoped=True)
+def groundedReduction(framework):
+    """Split a framework into its grounded extension and the residual
+        framework of the arguments which the grounded labelling leaves
+        undecided. For semantics whose extensions all extend the
+        grounded labelling (e.g., complete and stable), the extensions
+        of the framework are exactly the grounded extension joined with
+        an extension of the residual framework. The reduction is
+        memoized for the framework until it is released.
+
+    Arguments:
+        framework {saf.framework.FrameworkRepresentation} -- object
+            representing the argumentation framework
+
+    Returns:
+        Tuple[Set[int], saf.framework.FrameworkRepresentation] -- the
+            grounded extension and the residual framework, whose
+            argument names are the values of the arguments in the
+            original framework
+    """
+
+    in_args, out_args = groundedLabelling(framework)
+    residual = restrictFramework(
+        framework, (arg for arg in framework
+                    if arg not in in_args and arg not in out_args))
+    return in_args, residual
+
+
+def singleEnumeration(framework, reduction_parser, backend=None,
+                      preprocess=None):
     """Solve a single enumeration (SE) AF problem given a framework and
         a reduction parser to some argumentation semantics.
 
@@ -132,29 +698,51 @@ def singleEnumeration(framework, reduction_parser):
             to construct the reduction of the framework to a SAT solver
             problem input
 
+    Keyword Arguments:
+        backend {str or SolverBackend} -- the SAT solver backend to use;
+            None indicates the current default (default: {None})
+        preprocess {bool} -- whether to only encode the residual of the
+            framework after grounded preprocessing; None indicates the
+            current default (default: {None})
+
     Returns:
         List[int] or None -- the solution to the single enumeration
             problem; None indicates 'no solution;
     """
 
-    sat_input = reduction_parser.parse(framework)
+    if _usesPreprocessing(reduction_parser, preprocess):
+        in_args, residual = groundedReduction(framework)
+        if len(residual) == 0:
+            return frozenset(in_args)
 
-    solver = runSATSolver(sat_input.encode())
+        extension = singleEnumeration(residual, reduction_parser, backend,
+                                      preprocess=False)
+        if extension is None:
+            return None
+        return frozenset(in_args.union(residual.valuesToArguments(extension)))
 
-    if solver.returncode == UNSAT_RET_CODE:
-        return None
+    sat_input = encode(framework, reduction_parser)
 
-    assignment = extractAssignment(solver.stdout)
+    with openSATSession(sat_input, backend) as session:
+        assignment = session.solve()
+
+    if assignment is None:
+        return None
 
     extension = reduction_parser.extractExtention(assignment)
 
     return extension
 
 
-def fullEnumeration(framework, reduction_parser):
+def fullEnumeration(framework, reduction_parser, backend=None,
+                    preprocess=None):
     """Solve a full enumeration (EE) AF problem given a framework and
         a reduction parser to some argumentation semantics.
 
+        A single SAT session is kept open for the whole enumeration;
+        each extension found is blocked in it before asking for the
+        next one.
+
     Arguments:
         framework {saf.framework.FrameworkRepresentation} -- object
             representing the argumentation framework
@@ -162,23 +750,354 @@ def fullEnumeration(framework, reduction_parser):
             to construct the reduction of the framework to a SAT solver
             problem input
 
+    Keyword Arguments:
+        backend {str or SolverBackend} -- the SAT solver backend to use;
+            None indicates the current default (default: {None})
+        preprocess {bool} -- whether to only encode the residual of the
+            framework after grounded preprocessing; None indicates the
+            current default (default: {None})
+
     Returns:
         List[List[int]] -- the solution to the full enumeration problem
     """
 
-    sat_input = reduction_parser.parse(framework)
+    if _usesPreprocessing(reduction_parser, preprocess):
+        in_args, residual = groundedReduction(framework)
+        if len(residual) == 0:
+            yield frozenset(in_args)
+            return
 
-    while True:
-        solver = runSATSolver(sat_input.encode())
+        for extension in fullEnumeration(residual, reduction_parser,
+                                         backend, preprocess=False):
+            yield frozenset(
+                in_args.union(residual.valuesToArguments(extension)))
+        return
 
-        if solver.returncode == UNSAT_RET_CODE:
-            break
+    sat_input = encode(framework, reduction_parser)
+
+    with openSATSession(sat_input, backend) as session:
+        while True:
+            assignment = session.solve()
+
+            if assignment is None:
+                break
+
+            extension = reduction_parser.extractExtention(assignment)
+            excludeAssignment(assignment, session)
+
+            yield extension
+
+
+def maximalEnumeration(framework, reduction_parser, backend=None,
+                       preprocess=None, excluding=None):
+    """Enumerate the extensions of a framework under some semantics
+        which are maximal (w.r.t. set inclusion), in the manner of
+        PrefSAT (Cerutti et al., 2014).
+
+        Some extension not included in any of the maximal extensions
+        found so far is found first, and then grown into a maximal one
+        by repeatedly asking for an extension strictly including it.
+        Once maximal, it is yielded and all of its subsets are blocked.
+        The number of SAT calls thus scales with the number of maximal
+        extensions rather than with the number of all extensions.
+
+    Arguments:
+        framework {saf.framework.FrameworkRepresentation} -- object
+            representing the argumentation framework
+        reduction_parser {saf.theories.DIMACSParser} -- parser object
+            to construct the reduction of the framework to a SAT solver
+            problem input
+
+    Keyword Arguments:
+        backend {str or SolverBackend} -- the SAT solver backend to use;
+            None indicates the current default (default: {None})
+        preprocess {bool} -- whether to only encode the residual of the
+            framework after grounded preprocessing; None indicates the
+            current default (default: {None})
+        excluding {int} -- an argument which the extensions grown from
+            must not contain; the enumeration then ends once no such
+            extension is left, possibly before all maximal extensions
+            are found (default: {None})
+
+    Returns:
+        Generator[FrozenSet[int]] -- the maximal extensions
+    """
+
+    if _usesPreprocessing(reduction_parser, preprocess):
+        in_args, residual = groundedReduction(framework)
+        if excluding in in_args:
+            return
+        if excluding is not None:
+            excluding = residual.argumentToValue(excluding) \
+                if residual.hasArgument(excluding) else None
+        if len(residual) == 0:
+            yield frozenset(in_args)
+            return
+
+        for extension in maximalEnumeration(residual, reduction_parser,
+                                            backend, preprocess=False,
+                                            excluding=excluding):
+            yield frozenset(
+                in_args.union(residual.valuesToArguments(extension)))
+        return
+
+    sat_input = encode(framework, reduction_parser)
+    # Only the variables encoding the extension, not auxiliary ones
+    num_of_vars = sat_input.getNumOfVars()
+    inLiteral = reduction_parser.inLiteral
+
+    seed_assumptions = [] if excluding is None else [-inLiteral(excluding)]
+
+    with openSATSession(sat_input, backend) as session:
+        while True:
+            assignment = session.solve(seed_assumptions)
+
+            if assignment is None:
+                break
+
+            extension = reduction_parser.extractExtention(
+                assignment[:num_of_vars])
+
+            while True:
+                outside = [inLiteral(arg) for arg in framework
+                           if arg not in extension]
+                if not outside:
+                    break
+
+                # Ask for a strict superset; the clause is only active
+                # under its activation literal, which is retired after.
+                activation = session.newVariable()
+                session.addClause([-activation] + outside)
+                assignment = session.solve(
+                    [activation] + [inLiteral(arg) for arg in extension])
+                session.addClause([-activation])
+
+                if assignment is None:
+                    break
+
+                extension = reduction_parser.extractExtention(
+                    assignment[:num_of_vars])
+
+            yield extension
+
+            # Any further extension must not be a subset of this one
+            session.addClause(outside)
+
+
+def extensionExists(framework, reduction_parser, argument_value,
+                    accepted=True, backend=None, preprocess=None):
+    """Decide with a single SAT call whether the framework has an
+        extension which contains (or does not contain) an argument, by
+        assuming the argument's in-literal (or its negation) in the
+        reduction of the framework.
+
+    Arguments:
+        framework {saf.framework.FrameworkRepresentation} -- object
+            representing the argumentation framework
+        reduction_parser {saf.theories.DIMACSParser} -- parser object
+            to construct the reduction of the framework to a SAT solver
+            problem input
+        argument_value {int} -- the value of the query argument
+
+    Keyword Arguments:
+        accepted {bool} -- whether the extension sought is to contain
+            the argument (default: {True})
+        backend {str or SolverBackend} -- the SAT solver backend to use;
+            None indicates the current default (default: {None})
+        preprocess {bool} -- whether to only encode the residual of the
+            framework after grounded preprocessing; None indicates the
+            current default (default: {None})
+
+    Returns:
+        bool -- whether such an extension exists
+    """
+
+    query = argument_value
+
+    if _usesPreprocessing(reduction_parser, preprocess):
+        in_args, residual = groundedReduction(framework)
+        if not residual.hasArgument(argument_value):
+            # The grounded labelling decides the argument, so only the
+            # existence of any extension remains in question.
+            if (argument_value in in_args) != accepted:
+                return False
+            query = None
+        else:
+            query = residual.argumentToValue(argument_value)
+
+        framework = residual
+        if len(framework) == 0:
+            return True
+
+    assumptions = []
+    if query is not None:
+        in_literal = reduction_parser.inLiteral(query)
+        assumptions.append(in_literal if accepted else -in_literal)
+
+    sat_input = encode(framework, reduction_parser)
+
+    with openSATSession(sat_input, backend) as session:
+        return session.solve(assumptions) is not None
+
+
+def extensionsExist(framework, reduction_parser, argument_values,
+                    accepted=True, backend=None, preprocess=None):
+    """Decide for each of many arguments whether the framework has an
+        extension which contains (or does not contain) it, sharing one
+        encoding and SAT session between them.
+
+        Every extension found decides all the queries it answers (those
+        it contains, or those it lacks), so a SAT call is only made for
+        the arguments left undecided by the extensions found before. An
+        argument without such an extension is fixed as (not) contained
+        in the session for the calls which follow. Under preprocessing,
+        the arguments decided by the grounded labelling need no SAT
+        call at all.
+
+    Arguments:
+        framework {saf.framework.FrameworkRepresentation} -- object
+            representing the argumentation framework
+        reduction_parser {saf.theories.DIMACSParser} -- parser object
+            to construct the reduction of the framework to a SAT solver
+            problem input
+        argument_values {Iterable[int]} -- the values of the query
+            arguments
+
+    Keyword Arguments:
+        accepted {bool} -- whether the extensions sought are to contain
+            the arguments (default: {True})
+        backend {str or SolverBackend} -- the SAT solver backend to use;
+            None indicates the current default (default: {None})
+        preprocess {bool} -- whether to only encode the residual of the
+            framework after grounded preprocessing; None indicates the
+            current default (default: {None})
+
+    Returns:
+        Dict[int, bool] -- whether such an extension exists, for each
+            query argument
+    """
+
+    queries = list(dict.fromkeys(argument_values))
+
+    if _usesPreprocessing(reduction_parser, preprocess):
+        in_args, residual = groundedReduction(framework)
+        decisions, decided_args, residual_queries = {}, [], []
+        for arg in queries:
+            if residual.hasArgument(arg):
+                residual_queries.append(residual.argumentToValue(arg))
+            elif (arg in in_args) != accepted:
+                decisions[arg] = False
+            else:
+                # Only the existence of any extension is in question
+                decided_args.append(arg)
+
+        if len(residual) == 0:
+            exists, residual_decisions = True, {}
+        else:
+            exists, residual_decisions = _extensionsExist(
+                residual, reduction_parser, residual_queries, accepted,
+                backend)
 
-        assignment = extractAssignment(solver.stdout)
-        extension = reduction_parser.extractExtention(assignment)
-        excludeAssignment(assignment, sat_input)
+        decisions.update((arg, exists) for arg in decided_args)
+        decisions.update(
+            (residual.valueToArgument(value), decision)
+            for value, decision in residual_decisions.items())
+        return {arg: decisions[arg] for arg in queries}
 
-        yield extension
+    _, decisions = _extensionsExist(framework, reduction_parser, queries,
+                                    accepted, backend)
+    return decisions
+
+
+def _extensionsExist(framework, reduction_parser, queries, accepted,
+                     backend):
+    """Decide the queries of extensionsExist in a single SAT session.
+
+    Returns:
+        Tuple[bool, Dict[int, bool]] -- whether the framework has any
+            extension, and the decision for each query argument
+    """
+
+    sat_input = encode(framework, reduction_parser)
+    # Only the variables encoding the extension, not auxiliary ones
+    num_of_vars = sat_input.getNumOfVars()
+    inLiteral = reduction_parser.inLiteral
+
+    with openSATSession(sat_input, backend) as session:
+        assignment = session.solve()
+        if assignment is None:
+            return False, {arg: False for arg in queries}
+
+        decisions = {}
+        undecided = set(queries)
+
+        for arg in queries:
+            if assignment is not None:
+                extension = reduction_parser.extractExtention(
+                    assignment[:num_of_vars])
+                answered = undecided.intersection(extension) if accepted \
+                    else undecided.difference(extension)
+                decisions.update((answer, True) for answer in answered)
+                undecided.difference_update(answered)
+
+            if arg not in undecided:
+                assignment = None
+                continue
+
+            literal = inLiteral(arg) if accepted else -inLiteral(arg)
+            assignment = session.solve([literal])
+            undecided.discard(arg)
+            if assignment is None:
+                decisions[arg] = False
+                session.addClause([-literal])
+            else:
+                decisions[arg] = True
+
+    return True, {arg: decisions[arg] for arg in queries}
+
+
+def credulousSATDecision(framework, argument_value, reduction_parser):
+    """Solve a credulous decision (DC) AF problem given a framework, the
+        query argument's value, and a reduction parser to some
+        argumentation semantics with a single SAT call, i.e., by
+        deciding whether an extension contains the argument.
+
+    Arguments:
+         framework {saf.framework.FrameworkRepresentation} -- object
+            representing the argumentation framework
+        argument_value {int} -- the value of the query argument
+        reduction_parser {saf.theories.DIMACSParser} -- parser object
+            to construct the reduction of the framework to a SAT solver
+            problem input
+
+    Returns:
+        bool -- solution to the credulous decision problem
+    """
+
+    return extensionExists(framework, reduction_parser, argument_value,
+                           accepted=True)
+
+
+def skepticalSATDecision(framework, argument_value, reduction_parser):
+    """Solve a skeptical decision (DS) AF problem given a framework, the
+        query argument's value, and a reduction parser to some
+        argumentation semantics with a single SAT call, i.e., by
+        deciding whether no extension lacks the argument.
+
+    Arguments:
+         framework {saf.framework.FrameworkRepresentation} -- object
+            representing the argumentation framework
+        argument_value {int} -- the value of the query argument
+        reduction_parser {saf.theories.DIMACSParser} -- parser object
+            to construct the reduction of the framework to a SAT solver
+            problem input
+
+    Returns:
+        bool -- solution to the skeptical decision problem
+    """
+
+    return not extensionExists(framework, reduction_parser, argument_value,
+                               accepted=False)
 
 
 def credulousDecision(framework, argument_value, enumeration_function):
@@ -222,19 +1141,197 @@ def skepticalDecision(framework, argument_value, enumeration_function):
     return all(argument_value in extension
                for extension in enumeration_function(framework))
 
+#
+# SCC-by-SCC solving.
+#
+
+# Names of the gadget arguments standing in for the labels of upstream
+# attackers in the conditioned framework of an SCC.
+_IN_GADGET = '_in'
+_UND_GADGET = '_und'
+
+
+def _conditionedFramework(framework, scc, in_attacked, und_attacked):
+    """Build the framework of an SCC conditioned on the labels of the
+        arguments upstream of it.
+
+        Upstream out-labeled attackers are dropped. Attacks from
+        upstream in-labeled attackers are replaced by attacks from an
+        unattacked gadget argument (which is always in-labeled), and
+        those from upstream undecided attackers by attacks from a
+        self-attacking gadget argument (which is always undecided).
+
+    Arguments:
+        framework {saf.framework.FrameworkRepresentation} -- the whole
+            framework
+        scc {List[int]} -- the arguments of the SCC
+        in_attacked {FrozenSet[int]} -- arguments of the SCC attacked
+            by an upstream in-labeled argument
+        und_attacked {FrozenSet[int]} -- arguments of the SCC attacked
+            by an upstream undecided argument only
+
+    Returns:
+        saf.framework.FrameworkRepresentation -- the conditioned
+            framework, whose argument names are the values of the
+            arguments in the whole framework
+    """
+
+    scc_set = set(scc)
+    arguments = list(scc)
+    attacks = [(attacker, arg) for arg in scc
+               for attacker in framework.getAttackersOf(arg)
+               if attacker in scc_set]
+
+    if in_attacked:
+        arguments.append(_IN_GADGET)
+        attacks += [(_IN_GADGET, arg) for arg in in_attacked]
+    if und_attacked:
+        arguments.append(_UND_GADGET)
+        attacks.append((_UND_GADGET, _UND_GADGET))
+        attacks += [(_UND_GADGET, arg) for arg in und_attacked]
+
+    return type(framework)(arguments, attacks)
+
+
+def sccEnumeration(framework, local_enumeration, sccs=None, upstream=None):
+    """Enumerate the extensions of a framework SCC by SCC, in
+        topological order. The extensions of each SCC are found in the
+        framework of the SCC conditioned on the labels already fixed
+        upstream of it, so that each SAT call only ever sees a single
+        SCC. This is sound for semantics satisfying directionality
+        (complete, preferred) and for stable semantics.
+
+    Arguments:
+        framework {saf.framework.FrameworkRepresentation} -- object
+            representing the argumentation framework
+        local_enumeration {Callable} -- a method which fully enumerates
+            a (conditioned) framework's extensions under some semantics
+
+    Keyword Arguments:
+        sccs {List[List[int]]} -- the SCCs to enumerate over, in
+            topological order; None indicates all SCCs of the framework
+            (default: {None})
+        upstream {Tuple[Set[int], Set[int]]} -- the in-labeled and
+            out-labeled arguments fixed upstream of the given SCCs;
+            the other attackers of the SCCs outside of them are taken
+            as undecided; None indicates no labels fixed
+            (default: {None})
+
+    Returns:
+        Generator[FrozenSet[int]] -- the extensions of the framework
+            (restricted to the given SCCs, along with the in-labeled
+            arguments upstream)
+    """
+
+    if sccs is None:
+        sccs = stronglyConnectedComponents(framework)
+
+    if upstream is None:
+        in_args, out_args = set(), set()
+    else:
+        in_args, out_args = set(upstream[0]), set(upstream[1])
+
+    if not sccs:
+        yield frozenset(in_args)
+        return
+
+    # Conditioned SCCs are often alike across branches, so their local
+    # labellings are cached by their conditioning.
+    cache = {}
+
+    def localLabellings(i):
+        scc, scc_set = sccs[i], set(sccs[i])
+        in_attacked, und_attacked = set(), set()
+        for arg in scc:
+            for attacker in framework.getAttackersOf(arg):
+                if attacker in in_args:
+                    in_attacked.add(arg)
+                    break
+                elif attacker not in out_args and attacker not in scc_set:
+                    und_attacked.add(arg)
+        und_attacked -= in_attacked
+
+        key = (i, frozenset(in_attacked), frozenset(und_attacked))
+        if key in cache:
+            return cache[key]
+
+        conditioned = _conditionedFramework(framework, scc,
+                                            in_attacked, und_attacked)
+        grounded_in, grounded_out = groundedLabelling(conditioned)
+        if len(grounded_in) + len(grounded_out) \
+                - bool(in_attacked) == len(scc):
+            # The grounded labelling decides the whole SCC and so is its
+            # only labelling.
+            extensions = [grounded_in]
+        else:
+            extensions = local_enumeration(conditioned)
+
+        labellings = []
+        for extension in extensions:
+            local_in = frozenset(arg for arg in
+                                 conditioned.valuesToArguments(extension)
+                                 if arg not in (_IN_GADGET, _UND_GADGET))
+            local_out = frozenset(in_attacked).union(
+                *(framework.getAttackedBy(arg) for arg in local_in)
+            ).intersection(scc_set)
+            labellings.append((local_in, local_out))
+
+        cache[key] = labellings
+        return labellings
+
+    # Depth-first search over the choices of local labelling per SCC;
+    # a frame holds the remaining choices and the applied choice.
+    frames = [[iter(localLabellings(0)), None]]
+    while frames:
+        frame = frames[-1]
+        if frame[1] is not None:
+            in_args.difference_update(frame[1][0])
+            out_args.difference_update(frame[1][1])
+
+        frame[1] = next(frame[0], None)
+        if frame[1] is None:
+            frames.pop()
+            continue
+
+        in_args.update(frame[1][0])
+        out_args.update(frame[1][1])
+
+        if len(frames) == len(sccs):
+            yield frozenset(in_args)
+        else:
+            frames.append([iter(localLabellings(len(frames))), None])
+
+
+def sccDecisionComponents(framework, argument_value):
+    """Get the SCCs which decide the acceptance of an argument under a
+        semantics satisfying directionality, namely those of the
+        argument and of its ancestors.
+
+    Returns:
+        List[List[int]] -- the deciding SCCs in topological order
+    """
+
+    ancestors = getAncestors(framework, [argument_value])
+    return [scc for scc in stronglyConnectedComponents(framework)
+            if scc[0] in ancestors]
+
+
 #
 # Concrete task implementations.
 #
 
 
 def groundedSingleEnumeration(framework):
-    """Generate the grounded extension of the framework via the
+    """Generate the grounded extension of the framework, i.e., the least
         fixed-point of the framework's characteristic function F:
 
                     Ext_GR = U_{i=1..inf} F^i({})
 
         See (Dung,1995): https://doi.org/10.1016/0004-3702(94)00041-X
 
+        It is computed as the in-labeled arguments of the grounded
+        labelling, in time linear in the size of the framework.
+
     Arguments:
         framework {saf.framework.FrameworkRepresentation} -- object
             representing the argumentation framework]
@@ -243,27 +1340,14 @@ def groundedSingleEnumeration(framework):
         List[int] -- the grounded extension of the framework
     """
 
-    # ? Would filtering complete extensions be quicker?
-
-    grounded_extension = set()
-    curr_characteristic = set()
-
-    while True:
-        next_characteristic = framework.characteristic(curr_characteristic)
-        grounded_extension |= next_characteristic
-
-        if next_characteristic == curr_characteristic:
-            # iterate untill convergance
-            break
-
-        curr_characteristic = next_characteristic
-
+    grounded_extension, _ = groundedLabelling(framework)
     return grounded_extension
 
 
 def groundedCredulousDecision(framework, argument_value):
     """Solve the credulous decision problem under grounded semantics
-    given a framework and the query argument's value.
+    given a framework and the query argument's value. The grounded
+    labelling stops as soon as the query argument is labeled.
 
     Arguments:
         framework {saf.framework.FrameworkRepresentation} -- object
@@ -274,11 +1358,8 @@ def groundedCredulousDecision(framework, argument_value):
         bool -- solution to the credulous decision problem
     """
 
-    # ! groundedCredulousDecision could be optimised further if the
-    # ! extension would be constructed iteratively and the check would
-    # ! be made at each iteration against the new additions.
-
-    return argument_value in groundedSingleEnumeration(framework)
+    in_args, _ = groundedLabelling(framework, stop_at=argument_value)
+    return argument_value in in_args
 
 
 def completeFullEnumeration(framework):
@@ -302,26 +1383,27 @@ def completeCredulousDecision(framework, argument_value):
         given a framework and the query argument's value.
     """
 
-    return credulousDecision(framework, argument_value,
-                             completeFullEnumeration)
+    return credulousSATDecision(framework, argument_value,
+                                completeLabelingParser)
 
 
 def completeSkepticalDecision(framework, argument_value):
     """Solve the skeptical decision problem under complete semantics
-        given a framework and the query argument's value.
+        given a framework and the query argument's value. The grounded
+        extension is the least complete extension, so an argument is
+        skeptically accepted iff it is in the grounded extension.
     """
 
-    return skepticalDecision(framework, argument_value,
-                             completeFullEnumeration)
+    return groundedCredulousDecision(framework, argument_value)
 
 
 def preferredFullEnumeration(framework):
-    """Solve the full enumeration problem under grounded semantics
-        given a framework. Do this via filtering complete extensions.
+    """Solve the full enumeration problem under preferred semantics
+        given a framework. Do this via growing complete extensions into
+        maximal ones.
     """
 
-    complete_extensions = completeFullEnumeration(framework)
-    return getAllMaximal(complete_extensions)
+    return maximalEnumeration(framework, completeLabelingParser)
 
 
 def preferredSingleEnumeration(framework):
@@ -329,31 +1411,34 @@ def preferredSingleEnumeration(framework):
         given a framework.
     """
 
-    try:
-        return preferredFullEnumeration(framework).pop()
-    except KeyError:
-        # A Preferred extension is unversally defined for any framework.
-        # Nevertheless, this except block is added for implementational
-        # safety.
-        return None
+    # A Preferred extension is unversally defined for any framework.
+    # Nevertheless, None is defaulted to for implementational safety.
+    return next(preferredFullEnumeration(framework), None)
 
 
 def preferredCredulousDecision(framework, argument_value):
     """Solve the credulous decision problem under preferred semantics
-        given a framework and the query argument's value.
+        given a framework and the query argument's value. Every complete
+        extension is included in a preferred one, so this is the same
+        as credulous acceptance under complete semantics.
     """
 
-    return credulousDecision(framework, argument_value,
-                             preferredFullEnumeration)
+    return credulousSATDecision(framework, argument_value,
+                                completeLabelingParser)
 
 
 def preferredSkepticalDecision(framework, argument_value):
     """Solve the skeptical decision problem under preferred semantics
-        given a framework and the query argument's value.
+        given a framework and the query argument's value. Only preferred
+        extensions grown from complete extensions lacking the argument
+        are considered, since any preferred extension lacking it is
+        one of those.
     """
 
-    return skepticalDecision(framework, argument_value,
-                             preferredFullEnumeration)
+    return all(argument_value in extension
+               for extension in maximalEnumeration(
+                   framework, completeLabelingParser,
+                   excluding=argument_value))
 
 
 def stableFullEnumeration(framework):
@@ -376,8 +1461,8 @@ def stableCredulousDecision(framework, argument_value):
         given a framework and the query argument's value.
     """
 
-    return credulousDecision(framework, argument_value,
-                             stableFullEnumeration)
+    return credulousSATDecision(framework, argument_value,
+                                stableLabellingParser)
 
 
 def stableSkepticalDecision(framework, argument_value):
@@ -385,8 +1470,223 @@ def stableSkepticalDecision(framework, argument_value):
         given a framework and the query argument's value.
     """
 
+    return skepticalSATDecision(framework, argument_value,
+                                stableLabellingParser)
+
+
+def groundedCredulousDecisions(framework, argument_values):
+    """Solve the credulous decision problem under grounded semantics
+        given a framework and the query arguments' values, with a single
+        grounded labelling.
+
+    Returns:
+        Dict[int, bool] -- solution for each query argument
+    """
+
+    in_args, _ = groundedLabelling(framework)
+    return {arg: arg in in_args for arg in argument_values}
+
+
+def completeCredulousDecisions(framework, argument_values):
+    """Solve the credulous decision problem under complete semantics
+        given a framework and the query arguments' values.
+    """
+
+    return extensionsExist(framework, completeLabelingParser,
+                           argument_values, accepted=True)
+
+
+def completeSkepticalDecisions(framework, argument_values):
+    """Solve the skeptical decision problem under complete semantics
+        given a framework and the query arguments' values, i.e., by
+        membership in the grounded extension.
+    """
+
+    return groundedCredulousDecisions(framework, argument_values)
+
+
+def preferredCredulousDecisions(framework, argument_values):
+    """Solve the credulous decision problem under preferred semantics
+        given a framework and the query arguments' values, as credulous
+        acceptance under complete semantics.
+    """
+
+    return completeCredulousDecisions(framework, argument_values)
+
+
+def preferredSkepticalDecisions(framework, argument_values):
+    """Solve the skeptical decision problem under preferred semantics
+        given a framework and the query arguments' values.
+
+        The grounded extension is included in every preferred one, and
+        an argument in no complete extension is in no preferred one, so
+        only the credulously accepted arguments outside the grounded
+        extension are searched for a preferred extension lacking them.
+        Each preferred extension found rejects every such argument it
+        lacks, not only the one it was searched for.
+
+    Returns:
+        Dict[int, bool] -- solution for each query argument
+    """
+
+    queries = list(dict.fromkeys(argument_values))
+    in_args, _ = groundedLabelling(framework)
+
+    decisions = {arg: True for arg in queries if arg in in_args}
+    candidates = [arg for arg in queries if arg not in in_args]
+    credulous = preferredCredulousDecisions(framework, candidates)
+    decisions.update((arg, False) for arg in candidates
+                     if not credulous[arg])
+
+    undecided = {arg for arg in candidates if credulous[arg]}
+    for arg in candidates:
+        if arg not in undecided:
+            continue
+
+        decisions[arg] = True
+        for extension in maximalEnumeration(framework,
+                                            completeLabelingParser,
+                                            excluding=arg):
+            rejected = undecided.difference(extension)
+            decisions.update((rejected_arg, False)
+                             for rejected_arg in rejected)
+            undecided.difference_update(rejected)
+            if arg not in undecided:
+                break
+        undecided.discard(arg)
+
+    return {arg: decisions[arg] for arg in queries}
+
+
+def stableCredulousDecisions(framework, argument_values):
+    """Solve the credulous decision problem under stable semantics
+        given a framework and the query arguments' values.
+    """
+
+    return extensionsExist(framework, stableLabellingParser,
+                           argument_values, accepted=True)
+
+
+def stableSkepticalDecisions(framework, argument_values):
+    """Solve the skeptical decision problem under stable semantics
+        given a framework and the query arguments' values.
+    """
+
+    return {arg: not exists for arg, exists in extensionsExist(
+        framework, stableLabellingParser, argument_values,
+        accepted=False).items()}
+
+
+def sccCompleteFullEnumeration(framework):
+    """Solve the full enumeration problem under complete semantics
+        given a framework, SCC by SCC.
+    """
+
+    return sccEnumeration(framework, completeFullEnumeration)
+
+
+def sccCompleteSingleEnumeration(framework):
+    """Solve the single enumeration problem under complete semantics
+        given a framework, SCC by SCC.
+    """
+
+    return next(sccCompleteFullEnumeration(framework), None)
+
+
+def sccCompleteCredulousDecision(framework, argument_value):
+    """Solve the credulous decision problem under complete semantics
+        given a framework and the query argument's value, considering
+        only the SCCs upstream of the query argument.
+    """
+
+    sccs = sccDecisionComponents(framework, argument_value)
+    return any(argument_value in extension for extension
+               in sccEnumeration(framework, completeFullEnumeration, sccs))
+
+
+def sccCompleteSkepticalDecision(framework, argument_value):
+    """Solve the skeptical decision problem under complete semantics
+        given a framework and the query argument's value, considering
+        only the SCCs upstream of the query argument.
+    """
+
+    sccs = sccDecisionComponents(framework, argument_value)
+    return all(argument_value in extension for extension
+               in sccEnumeration(framework, completeFullEnumeration, sccs))
+
+
+def sccPreferredFullEnumeration(framework):
+    """Solve the full enumeration problem under preferred semantics
+        given a framework, SCC by SCC.
+    """
+
+    return sccEnumeration(framework, preferredFullEnumeration)
+
+
+def sccPreferredSingleEnumeration(framework):
+    """Solve the single enumeration problem under preferred semantics
+        given a framework, SCC by SCC.
+    """
+
+    return next(sccPreferredFullEnumeration(framework), None)
+
+
+def sccPreferredCredulousDecision(framework, argument_value):
+    """Solve the credulous decision problem under preferred semantics
+        given a framework and the query argument's value, considering
+        only the SCCs upstream of the query argument.
+    """
+
+    sccs = sccDecisionComponents(framework, argument_value)
+    return any(argument_value in extension for extension
+               in sccEnumeration(framework, preferredFullEnumeration, sccs))
+
+
+def sccPreferredSkepticalDecision(framework, argument_value):
+    """Solve the skeptical decision problem under preferred semantics
+        given a framework and the query argument's value, considering
+        only the SCCs upstream of the query argument.
+    """
+
+    sccs = sccDecisionComponents(framework, argument_value)
+    return all(argument_value in extension for extension
+               in sccEnumeration(framework, preferredFullEnumeration, sccs))
+
+
+def sccStableFullEnumeration(framework):
+    """Solve the full enumeration problem under stable semantics
+        given a framework, SCC by SCC.
+    """
+
+    return sccEnumeration(framework, stableFullEnumeration)
+
+
+def sccStableSingleEnumeration(framework):
+    """Solve the single enumeration problem under stable semantics
+        given a framework, SCC by SCC.
+    """
+
+    return next(sccStableFullEnumeration(framework), None)
+
+
+def sccStableCredulousDecision(framework, argument_value):
+    """Solve the credulous decision problem under stable semantics
+        given a framework and the query argument's value, SCC by SCC.
+        Stable semantics does not satisfy directionality, so all SCCs
+        are considered.
+    """
+
+    return credulousDecision(framework, argument_value,
+                             sccStableFullEnumeration)
+
+
+def sccStableSkepticalDecision(framework, argument_value):
+    """Solve the skeptical decision problem under stable semantics
+        given a framework and the query argument's value, SCC by SCC.
+    """
+
     return skepticalDecision(framework, argument_value,
-                             stableFullEnumeration)
+                             sccStableFullEnumeration)
 
 
 _enumerationTasksFunctions = {
@@ -430,12 +1730,228 @@ _decisionTaskFunctions = {
 }
 
 
+_multiDecisionTaskFunctions = {
+    # Here list the decision tasks along with the method which is used
+    # to solve said task for many query arguments at once.
+    'DC-CO': completeCredulousDecisions,
+    'DS-CO': completeSkepticalDecisions,
+    'DC-GR': groundedCredulousDecisions,
+    'DC-PR': preferredCredulousDecisions,
+    'DS-PR': preferredSkepticalDecisions,
+    'DC-ST': stableCredulousDecisions,
+    'DS-ST': stableSkepticalDecisions
+}
+
+
+_sccTaskFunctions = {
+    # Here list the tasks which can be solved SCC by SCC along with the
+    # method which is used to solve said task that way.
+    'EE-CO': sccCompleteFullEnumeration,
+    'SE-CO': sccCompleteSingleEnumeration,
+    'DC-CO': sccCompleteCredulousDecision,
+    'DS-CO': sccCompleteSkepticalDecision,
+    'EE-PR': sccPreferredFullEnumeration,
+    'SE-PR': sccPreferredSingleEnumeration,
+    'DC-PR': sccPreferredCredulousDecision,
+    'DS-PR': sccPreferredSkepticalDecision,
+    'EE-ST': sccStableFullEnumeration,
+    'SE-ST': sccStableSingleEnumeration,
+    'DC-ST': sccStableCredulousDecision,
+    'DS-ST': sccStableSkepticalDecision
+}
+
+
 def getTasks():
     return list(_enumerationTasksFunctions.keys()) \
         + list(_decisionTaskFunctions.keys())
 
 
-def getTaskMethod(task_name, is_enumeration=True):
+def solveTask(framework, task_name, argument=None, decompose=False):
+    """Solve an AF problem task on a framework in terms of argument
+        names, i.e., into a solution for saf.io.outputSolution.
+
+    Arguments:
+        framework {saf.framework.FrameworkRepresentation} -- object
+            representing the argumentation framework
+        task_name {str} -- the AF problem task identifier (e.g., EE-CO)
+
+    Keyword Arguments:
+        argument {str} -- the name of the query argument of a decision
+            task; None indicates an enumeration task (default: {None})
+        decompose {bool} -- whether to prefer the method solving the
+            task SCC by SCC, where there is one (default: {False})
+
+    Returns:
+        Iterable[List[str]] or List[str] or bool or None -- the
+            extensions (lazily, for full enumeration), the extension or
+            the decision solving the task
+    """
+
+    task_type = task_name[:2]
+    checkBudget()
+
+    if argument is None:
+        # Assuming an enumeration problem
+        taskMethod = getTaskMethod(task_name, is_enumeration=True,
+                                   decompose=decompose)
+        solution = taskMethod(framework)
+        if task_type != 'EE':
+            checkBudget()
+        if task_type == 'SE' and solution is not None:
+            stats.count('extensions')
+            return framework.valuesToArguments(solution)
+        elif task_type == 'EE':
+            # Extensions are translated as they are found
+            return (framework.valuesToArguments(ext)
+                    for ext in stats.countEach('extensions', solution))
+        return None
+
+    # Assuming a decision problem
+    taskMethod = getTaskMethod(task_name, is_enumeration=False,
+                               decompose=decompose)
+    decision = taskMethod(framework, framework.argumentToValue(argument))
+    checkBudget()
+    return decision
+
+
+def budgetStatus(task_name, exceeded=None):
+    """Get the status marker of the solution to a task, given the
+        BudgetExceeded (if any) which has interrupted its solving.
+        Without one, the solution is only complete if the budget set
+        (see setBudget), if any, is not exceeded yet.
+    """
+
+    if exceeded is not None:
+        resource = exceeded.resource
+    else:
+        # A solution found past the deadline is not complete within
+        # the budget either
+        resource = None if _budget is None else _budget.exceeded()
+        if resource is None:
+            return COMPLETE
+    if task_name.startswith('EE'):
+        # The extensions enumerated so far are still a solution in part
+        return PARTIAL
+    return TIMEOUT if resource == 'time' else MEMOUT
+
+
+def solveTaskWithinBudget(framework, task_name, argument=None,
+                          decompose=False, time_limit=None,
+                          memory_limit=None):
+    """Solve an AF problem task on a framework in terms of argument
+        names (as solveTask) within a wall-clock time and memory budget.
+        Once the budget is exceeded, the solving is interrupted and the
+        part of the solution found so far is returned along with a
+        status marker: COMPLETE, PARTIAL (the extensions enumerated so
+        far), or TIMEOUT or MEMOUT (no solution).
+
+        To stream the extensions of a full enumeration instead, set the
+        budget (see setBudget) and iterate over the solution of
+        solveTask until it raises BudgetExceeded.
+
+    Arguments:
+        framework {saf.framework.FrameworkRepresentation} -- object
+            representing the argumentation framework
+        task_name {str} -- the AF problem task identifier (e.g., EE-CO)
+
+    Keyword Arguments:
+        argument {str} -- the name of the query argument of a decision
+            task; None indicates an enumeration task (default: {None})
+        decompose {bool} -- whether to prefer the method solving the
+            task SCC by SCC, where there is one (default: {False})
+        time_limit {float} -- the wall-clock time allowed, in seconds;
+            None indicates no limit (default: {None})
+        memory_limit {int} -- the memory allowed, in bytes; None
+            indicates no limit (default: {None})
+
+    Returns:
+        Tuple[List[List[str]] or List[str] or bool or None, str] -- the
+            (partial) solution to the task and its status marker
+    """
+
+    previous_budget = getBudget()
+    setBudget(Budget(time_limit, memory_limit))
+    extensions = []
+    try:
+        solution = solveTask(framework, task_name, argument,
+                             decompose=decompose)
+        if task_name.startswith('EE'):
+            extensions.extend(solution)
+            solution = extensions
+        checkBudget()
+        return solution, COMPLETE
+    except BudgetExceeded as e:
+        solution = extensions if task_name.startswith('EE') else None
+        return solution, budgetStatus(task_name, e)
+    finally:
+        setBudget(previous_budget)
+
+
+def solveDecisions(framework, task_name, arguments=None, decompose=False):
+    """Solve a decision AF problem task on a framework for many query
+        arguments at once, in terms of argument names, i.e., into a
+        solution for saf.io.outputDecisions.
+
+    Arguments:
+        framework {saf.framework.FrameworkRepresentation} -- object
+            representing the argumentation framework
+        task_name {str} -- the AF problem task identifier (e.g., DC-CO)
+
+    Keyword Arguments:
+        arguments {Iterable[str]} -- the names of the query arguments;
+            None indicates all arguments of the framework
+            (default: {None})
+        decompose {bool} -- whether to prefer the method solving the
+            task SCC by SCC, where there is one (default: {False})
+
+    Returns:
+        List[Tuple[str, bool]] -- the query arguments' names along with
+            their decisions, in the order given
+    """
+
+    argument_values = list(framework) if arguments is None \
+        else framework.argumentsToValues(arguments)
+
+    checkBudget()
+    decisionsMethod = getDecisionsMethod(task_name, decompose=decompose)
+    decisions = decisionsMethod(framework, argument_values)
+    checkBudget()
+    return [(framework.valueToArgument(arg), decisions[arg])
+            for arg in argument_values]
+
+
+def getDecisionsMethod(task_name, decompose=False):
+    """Return the method which solves the given decision AF problem task
+        for many query arguments at once. Where there is none (or the
+        task is to be solved SCC by SCC), the method solving it for a
+        single query argument is called for each of them.
+
+    Arguments:
+        task_name {str} -- the AF problem task identifier (e.g., DC-CO)
+
+    Keyword Arguments:
+        decompose {bool} -- whether to prefer the method solving the
+            task SCC by SCC, where there is one (default: {False})
+
+    Returns:
+        Callable -- the method which, given a framework and the query
+            arguments' values, returns the decision for each of them
+    """
+
+    task_method = getTaskMethod(task_name, is_enumeration=False,
+                                decompose=decompose)
+    if task_name in _multiDecisionTaskFunctions and \
+            not (decompose and task_name in _sccTaskFunctions):
+        return _multiDecisionTaskFunctions[task_name]
+
+    def decisionsMethod(framework, argument_values):
+        return {arg: task_method(framework, arg)
+                for arg in dict.fromkeys(argument_values)}
+
+    return decisionsMethod
+
+
+def getTaskMethod(task_name, is_enumeration=True, decompose=False):
     """Return the method which solves the given AF problem task.
 
     Arguments:
@@ -444,6 +1960,8 @@ def getTaskMethod(task_name, is_enumeration=True):
     Keyword Arguments:
         is_enumeration {bool} -- Explicit flag separation the
             enumeration and desicion tasks  (default: {True})
+        decompose {bool} -- whether to prefer the method solving the
+            task SCC by SCC, where there is one (default: {False})
 
     Returns:
         Callable -- the method which solves the given task
@@ -452,6 +1970,8 @@ def getTaskMethod(task_name, is_enumeration=True):
         task_method = _enumerationTasksFunctions[task_name] \
             if is_enumeration else \
             _decisionTaskFunctions[task_name]
+        if decompose:
+            task_method = _sccTaskFunctions.get(task_name, task_method)
         return task_method
     except KeyError:
         error_msg = (
@@ -19,8 +19,13 @@
 """
 
 import abc
+import io
+from array import array
+from collections import deque
 from enum import IntEnum
-from typing import Callable, FrozenSet, Generator, List, NewType
+from itertools import chain, repeat
+from operator import add, sub
+from typing import Callable, FrozenSet, Generator, List, NewType, Tuple
 
 import saf.utils as utils
 from saf.framework import FrameworkRepresentation as Framework
@@ -103,6 +108,9 @@ undLab = undLabelVariable
 TheoryTemplate = NewType(
     'TheoryTemplate', Callable[[int, Framework], List[List[int]]])
 TheoryRepresentation = NewType('TheoryRepresentation', List[List[int]])
+BulkTheoryTemplate = NewType(
+    'BulkTheoryTemplate',
+    Callable[[Framework, Tuple[array, array]], Tuple[array, int]])
 
 
 class CNFTheory:
@@ -110,10 +118,14 @@ class CNFTheory:
         as a list of disjunctive clauses which themselves are lists.
     """
 
-    def __init__(self, template: TheoryTemplate):
+    def __init__(self, template: TheoryTemplate,
+                 bulk_template: BulkTheoryTemplate = None):
         super().__init__()
         # The template holds a means to generate clauses of the theory
         self._template = template
+        # The bulk template, if any, generates the clauses of the theory
+        # for all arguments at once (see generateLiterals)
+        self._bulk_template = bulk_template
 
     @classmethod
     def fromTemplateList(cls, templates: List[TheoryTemplate]) -> Generator:
@@ -173,6 +185,43 @@ class CNFTheory:
             ret_cnf += self.generate(arg_val, framework)
         return ret_cnf
 
+    def generateLiterals(self, framework: Framework,
+                         attacker_arrays: Tuple[array, array] = None
+                         ) -> Tuple[array, int]:
+        """Generate the clauses of the theory for all the arguments of
+        a framework into a flat buffer of literals, each clause
+        concluded by a 0. The bulk template is used if there is one,
+        and the template is called for each argument otherwise.
+
+        Arguments:
+            framework {Framework} -- framework to generate the clauses
+                for
+
+        Keyword Arguments:
+            attacker_arrays {Tuple[array, array]} -- the CSR arrays of
+                the attackers of the framework's arguments (see
+                attackerArrays); None indicates computing them
+                (default: {None})
+
+        Returns:
+            Tuple[array, int] -- the literals of the clauses generated
+                and their number
+        """
+
+        if self._bulk_template is not None:
+            if attacker_arrays is None:
+                attacker_arrays = attackerArrays(framework)
+            return self._bulk_template(framework, attacker_arrays)
+
+        literals = array('i')
+        num_of_clauses = 0
+        for arg_val in framework.getArguments():
+            for clause in self.generate(arg_val, framework):
+                literals.extend(clause)
+                literals.append(0)
+                num_of_clauses += 1
+        return literals, num_of_clauses
+
 
 class TheoryParser(metaclass=abc.ABCMeta):
     """Abstract class defining the base of a reduction parser from AF to
@@ -237,31 +286,164 @@ class DIMACSHeader:
     def __str__(self):
         return F"p cnf {self._vars} {self._clauses}\n"
 
-    def incrementClauses(self):
-        self._clauses += 1
+    def incrementClauses(self, by=1):
+        self._clauses += by
 
     def setClauses(self, num_of_clauses):
         self._clauses = num_of_clauses
 
 
+def _renderLiterals(literals) -> bytes:
+    """Render a flat, zero-separated buffer of clause literals as DIMACS
+        clause lines (each line begins with a space, which DIMACS
+        parsers skip).
+    """
+
+    # The only token ' 0' can be the start of is the separator 0
+    text = ' ' + ' '.join(map(str, literals))
+    return text.replace(' 0', ' 0\n').encode('ascii')
+
+
 class DIMACSInput:
     """Object modeling a DIMACS formated file/string. It consists of
         a DIMACSHeader and its content.
+
+        The clauses are kept in a flat array of 32-bit literals, each
+        clause concluded by a 0, so that in-process solvers can be given
+        them directly. Their DIMACS text is rendered into a growable
+        byte buffer only when the input is first written, and then only
+        for the clauses added since, so that the text is never rebuilt.
     """
 
-    def __init__(self, num_of_vars=0, num_of_clauses=0, content=''):
-        self._header = DIMACSHeader(num_of_vars, num_of_clauses)
-        self._content = content
+    def __init__(self, num_of_vars=0, clauses=()):
+        self._header = DIMACSHeader(num_of_vars, 0)
+        self._literals = array('i')
+        self._text = bytearray()
+        self._rendered = 0
+        self.addClauses(clauses)
 
     def __str__(self):
-        return str(self._header) + self._content
+        self._render()
+        return str(self._header) + self._text.decode('ascii')
+
+    def _render(self):
+        if self._rendered < len(self._literals):
+            self._text += _renderLiterals(self._literals[self._rendered:])
+            self._rendered = len(self._literals)
+
+    def copy(self):
+        """Get an independent copy of the input, including its rendered
+            DIMACS text."""
+
+        other = DIMACSInput(self.getNumOfVars())
+        other._header.setClauses(self.getNumOfClauses())
+        other._literals = array('i', self._literals)
+        other._text = bytearray(self._text)
+        other._rendered = self._rendered
+        return other
+
+    def getNumOfVars(self) -> int:
+        return self._header._vars
+
+    def getNumOfClauses(self) -> int:
+        return self._header._clauses
+
+    def getLiterals(self) -> array:
+        """Get the flat, zero-separated buffer of the clause literals."""
+        return self._literals
+
+    def getClauses(self) -> Generator:
+        """Iterate over the clauses of the input as lists of literals."""
+        clause = []
+        for lab_var in self._literals:
+            if lab_var:
+                clause.append(lab_var)
+            else:
+                yield clause
+                clause = []
+
+    def newVariable(self) -> int:
+        """Introduce a fresh (auxiliary) variable to the input.
 
-    def addSingleClause(self, dimacs_clause: str):
-        self._content += dimacs_clause
+        Returns:
+            int -- the new variable
+        """
+
+        self._header._vars += 1
+        return self._header._vars
+
+    def addClause(self, clause: List[int]):
+        self._literals.extend(clause)
+        self._literals.append(0)
         self._header.incrementClauses()
 
-    def encode(self):
-        return str(self)
+    def addClauses(self, clauses: List[List[int]]):
+        literals = self._literals
+        num_of_clauses = 0
+        for clause in clauses:
+            literals.extend(clause)
+            literals.append(0)
+            num_of_clauses += 1
+        self._header.incrementClauses(num_of_clauses)
+
+    def addLiterals(self, literals: array, num_of_clauses: int):
+        """Add clauses given as a flat buffer of literals, each clause
+            concluded by a 0 (e.g., by CNFTheory.generateLiterals).
+
+        Arguments:
+            literals {array} -- the literals of the clauses
+            num_of_clauses {int} -- the number of clauses in literals
+        """
+
+        self._literals.extend(literals)
+        self._header.incrementClauses(num_of_clauses)
+
+    def addSingleClause(self, dimacs_clause: str):
+        # Drop the concluding '0' of the DIMACS clause
+        self.addClause([int(lab_var)
+                        for lab_var in dimacs_clause.split()[:-1]])
+
+    def writeTo(self, stream, assumptions: List[int] = ()):
+        """Write the DIMACS encoding of the input to a binary stream
+            (e.g., the stdin of a SAT solver process). Any assumptions
+            given are added as unit clauses without being added to the
+            input itself.
+
+        Arguments:
+            stream {BinaryIO} -- the stream to write to
+
+        Keyword Arguments:
+            assumptions {List[int]} -- literals to temporarily assume
+                (default: {()})
+        """
+
+        self._render()
+        header = DIMACSHeader(self._header._vars,
+                              self._header._clauses + len(assumptions))
+        stream.write(str(header).encode('ascii'))
+        stream.write(self._text)
+        if assumptions:
+            stream.write(_renderLiterals(
+                [lit for assumption in assumptions for lit in (assumption,
+                                                               0)]))
+
+    def encode(self, assumptions: List[int] = ()):
+        """Encode the input into a DIMACS string. Any assumptions given
+            are added to the encoding as unit clauses without being
+            added to the input itself. Prefer writeTo for streaming the
+            input to a solver without building the string.
+
+        Keyword Arguments:
+            assumptions {List[int]} -- literals to temporarily assume
+                (default: {()})
+
+        Returns:
+            str -- the DIMACS encoding of the input
+        """
+
+        stream = io.BytesIO()
+        self.writeTo(stream, assumptions)
+        return stream.getvalue().decode('ascii')
 
 
 class DIMACSParser(TheoryParser):
@@ -270,9 +452,26 @@ class DIMACSParser(TheoryParser):
         framework into a set of SAT theories.
     """
 
-    def __init__(self, *theories: CNFTheory, vars_per_argument=len(Label)):
+    def __init__(self, *theories: CNFTheory, vars_per_argument=len(Label),
+                 grounded_reducible=False):
+        """Constructor of the DIMACSParser.
+
+        Arguments:
+            theories {CNFTheory} -- the theories this parser will use
+                for reductions to SAT
+
+        Keyword Arguments:
+            vars_per_argument {int} -- the number of SAT variables
+                describing each argument (default: {len(Label)})
+            grounded_reducible {bool} -- whether every extension of the
+                encoded semantics extends the grounded labelling, so
+                that the arguments it decides may be left out of the
+                encoding (default: {False})
+        """
+
         super().__init__(*theories)
         self.vars_per_argument = vars_per_argument
+        self.grounded_reducible = grounded_reducible
 
     @classmethod
     def parseCNFTheory(cls, theory: CNFTheory):
@@ -283,22 +482,26 @@ class DIMACSParser(TheoryParser):
     def parseClause(clause: List[int]):
         return ' '.join(str(lab_var) for lab_var in clause) + ' 0'
 
-    def parse(self, framework: Framework) -> DIMACSInput:
-        # generate all theories in raw form,
-        # count the number of clauses generated...
+    def parse(self, framework: Framework,
+              check: Callable[[], None] = None) -> DIMACSInput:
+        # generate each theory for all arguments at once straight into
+        # the input's literal buffer, the DIMACS text is rendered by the
+        # DIMACSInput only if it is needed. check (e.g., of the budget
+        # of the solving) is called between the theories, and may raise
+        # to give up the encoding.
 
-        raw_clauses = []
         # For each argument there is a bool variable for each label
         # describing it.
         num_of_vars = len(framework) * self.vars_per_argument
-        argument_values = framework.getArguments()
+        sat_input = DIMACSInput(num_of_vars)
+        attacker_arrays = attackerArrays(framework)
         for theory in self._theories:
-            raw_clauses += theory.generateAll(argument_values, framework)
-
-        num_of_clauses = len(raw_clauses)
-        dimacs_content = self.parseCNFTheory(raw_clauses)
+            if check is not None:
+                check()
+            sat_input.addLiterals(*theory.generateLiterals(framework,
+                                                           attacker_arrays))
 
-        return DIMACSInput(num_of_vars, num_of_clauses, dimacs_content)
+        return sat_input
 
     def extractExtention(self, assignment: List[int]) -> FrozenSet[int]:
         # FIXME need a better way to check for being an in-label var.
@@ -314,11 +517,136 @@ class DIMACSParser(TheoryParser):
         else:
             return frozenset(self.extractPositiveLiterals(assignment))
 
+    def inLiteral(self, argument_value: int) -> int:
+        """Get the SAT literal which holds iff the argument is in the
+            extension encoded.
+
+        Arguments:
+            argument_value {int} -- the argument to get the literal for
+
+        Returns:
+            int -- the in-literal of the argument
+        """
+
+        if self.vars_per_argument > 1:
+            return _calculateLabelVar(argument_value,
+                                      self.vars_per_argument, Label.In)
+        return argument_value
+
     @staticmethod
     def extractPositiveLiterals(assignment: List[int]) -> List[int]:
         return [lab_var for lab_var in assignment if lab_var > 0]
 
 
+#
+# Bulk generation of the theories from the attack relation as arrays.
+
+# Each bulk template takes in the framework {f} and the CSR arrays of the
+# attackers of its arguments {attacker_arrays}, and returns the flat,
+# zero-separated literals of the theory for all arguments (in the order
+# the template would generate them, argument by argument) along with
+# the number of clauses. The literals are computed by whole-array
+# operations (slice assignment, map and itertools) rather than by a
+# call of the template per argument.
+#
+
+def attackerArrays(framework: Framework) -> Tuple[array, array]:
+    """Get the compressed sparse row (CSR) arrays (indptr, indices) of
+        the attackers of each argument of a framework: those of the
+        argument with value v are indices[indptr[v - 1]:indptr[v]], in
+        the order of framework.getAttackersOf(v).
+    """
+
+    if hasattr(framework, 'getAttackedByArrays'):
+        return framework.getAttackedByArrays()
+
+    indptr = array('i', [0])
+    attackers = array('i')
+    for arg_val in framework.getArguments():
+        attackers.extend(framework.getAttackersOf(arg_val))
+        indptr.append(len(attackers))
+    return indptr, attackers
+
+
+def _labelLiterals(num_of_arguments, vars_per_argument, label=Label.In,
+                   negated=False):
+    """Get the literal of a label variable of each argument (as by
+        _calculateLabelVar), as a sequence indexed by argument value
+        (whose index 0 is unused).
+    """
+
+    start = label - vars_per_argument
+    literals = range(start, vars_per_argument * num_of_arguments + start + 1,
+                     vars_per_argument)
+    if negated:
+        literals = range(-literals.start, -literals.stop, -vars_per_argument)
+    return literals
+
+
+def _attackColumns(attacker_arrays, target_literals, attacker_literals):
+    """Get, for each attack in CSR order, the literal of the attacked
+        argument and that of the attacker.
+
+    Returns:
+        Tuple[array, array] -- the attacked and the attackers' literals
+    """
+
+    indptr, attackers = attacker_arrays
+    num_of_attackers = map(sub, indptr[1:], indptr[:-1])
+    targets = array('i', chain.from_iterable(
+        map(repeat, target_literals[1:], num_of_attackers)))
+    return targets, _mapLiterals(attackers, attacker_literals)
+
+
+def _mapLiterals(argument_values, literals):
+    """Map argument values to their literals (a sequence indexed by
+        argument value), looking them up in a list as that is faster
+        than in a range.
+    """
+
+    return array('i', map(list(literals).__getitem__, argument_values))
+
+
+def _binaryClauses(first_literals, second_literals):
+    """Interleave two columns of literals into binary clauses."""
+
+    literals = array('i', [0]) * (3 * len(first_literals))
+    literals[0::3] = first_literals
+    literals[1::3] = second_literals
+    return literals, len(first_literals)
+
+
+def _attackersClauses(attacker_arrays, attacker_literals, own_literals):
+    """Build, for each argument, the clause of the literals of its
+        attackers followed by its own literal. The clause of the
+        argument with value i + 1 starts at offset indptr[i] + 2 * i:
+        the attackers' literals are copied into place in one join of
+        their groups, leaving room for the own literal and the 0 ending
+        each clause, and the own literals are then set at their
+        offsets.
+    """
+
+    indptr, attackers = attacker_arrays
+    num_of_arguments = len(indptr) - 1
+    literals = array('i')
+    if not num_of_arguments:
+        return literals, 0
+
+    itemsize = literals.itemsize
+    mapped = _mapLiterals(attackers, attacker_literals).tobytes()
+    groups = map(mapped.__getitem__,
+                 map(slice, map(itemsize.__mul__, indptr[:-1]),
+                     map(itemsize.__mul__, indptr[1:])))
+    ends = bytes(2 * itemsize)
+    literals.frombytes(ends.join(groups) + ends)
+
+    own_offsets = map(add, indptr[1:], range(0, 2 * num_of_arguments, 2))
+    # Consume the assignments without keeping their results
+    deque(map(literals.__setitem__, own_offsets, own_literals[1:]),
+          maxlen=0)
+    return literals, num_of_arguments
+
+
 #
 # Theory model functions for encoding a full AF for the complete
 # extensions.
@@ -371,7 +699,7 @@ def complete_in_theory_2(a, f):
         framework it is contained in.
 
         This template captures the legality in one direction, namely
-        'if the argument is in-labeled if arguments it attacks are
+        'if the argument is in-labeled, then all of its attackers are
         out-labeled.'
 
         NB this function is meant to be used as a template for a
@@ -383,8 +711,8 @@ def complete_in_theory_2(a, f):
 
     """
 
-    return [[-inLab(a), outLab(attacked)]
-            for attacked in f.getAttackedBy(a)]
+    return [[-inLab(a), outLab(attacker)]
+            for attacker in f.getAttackersOf(a)]
 
 
 def complete_out_theory_1(a, f):
@@ -430,16 +758,81 @@ def complete_out_theory_2(a, f):
             + [-outLab(a)]]
 
 
+#
+# Bulk counterparts of the complete theory templates.
+#
+
+def _completeLabelLiterals(f, label, negated=False):
+    return _labelLiterals(len(f), len(Label), label, negated)
+
+
+def bulk_uniqueness_theory(f, _):
+    """Generate uniqueness_theory for all arguments at once."""
+
+    num_of_arguments = len(f)
+    ins, outs, unds = (array('i', _completeLabelLiterals(f, label)[1:])
+                       for label in Label)
+    not_ins, not_outs, not_unds = (
+        array('i', _completeLabelLiterals(f, label, negated=True)[1:])
+        for label in Label)
+
+    # The 4 clauses of each argument take 13 literals (with the 0s)
+    literals = array('i', [0]) * (13 * num_of_arguments)
+    for offset, column in enumerate((ins, outs, unds, None,
+                                     not_ins, not_outs, None,
+                                     not_ins, not_unds, None,
+                                     not_outs, not_unds)):
+        if column is not None:
+            literals[offset::13] = column
+    return literals, 4 * num_of_arguments
+
+
+def bulk_complete_in_theory_1(f, attacker_arrays):
+    """Generate complete_in_theory_1 for all arguments at once."""
+
+    return _attackersClauses(
+        attacker_arrays, _completeLabelLiterals(f, Label.Out, negated=True),
+        _completeLabelLiterals(f, Label.In))
+
+
+def bulk_complete_in_theory_2(f, attacker_arrays):
+    """Generate complete_in_theory_2 for all arguments at once."""
+
+    targets, attackers = _attackColumns(
+        attacker_arrays, _completeLabelLiterals(f, Label.In, negated=True),
+        _completeLabelLiterals(f, Label.Out))
+    return _binaryClauses(targets, attackers)
+
+
+def bulk_complete_out_theory_1(f, attacker_arrays):
+    """Generate complete_out_theory_1 for all arguments at once."""
+
+    targets, attackers = _attackColumns(
+        attacker_arrays, _completeLabelLiterals(f, Label.Out),
+        _completeLabelLiterals(f, Label.In, negated=True))
+    return _binaryClauses(attackers, targets)
+
+
+def bulk_complete_out_theory_2(f, attacker_arrays):
+    """Generate complete_out_theory_2 for all arguments at once."""
+
+    return _attackersClauses(
+        attacker_arrays, _completeLabelLiterals(f, Label.In),
+        _completeLabelLiterals(f, Label.Out, negated=True))
+
+
 # A parser instance for encoding complete semantics
 
 
-complete_theories = CNFTheory.fromTemplates(uniqueness_theory,
-                                            complete_in_theory_1,
-                                            complete_in_theory_2,
-                                            complete_out_theory_1,
-                                            complete_out_theory_2)
+complete_theories = [
+    CNFTheory(uniqueness_theory, bulk_uniqueness_theory),
+    CNFTheory(complete_in_theory_1, bulk_complete_in_theory_1),
+    CNFTheory(complete_in_theory_2, bulk_complete_in_theory_2),
+    CNFTheory(complete_out_theory_1, bulk_complete_out_theory_1),
+    CNFTheory(complete_out_theory_2, bulk_complete_out_theory_2)]
 
-completeLabelingParser = DIMACSParser(*complete_theories)
+completeLabelingParser = DIMACSParser(*complete_theories,
+                                      grounded_reducible=True)
 
 #
 # Theory model functions for encoding a full AF for the stable
@@ -485,9 +878,35 @@ def stable_out_theory(a, f):
             for attacker in f.getAttackersOf(a)]
 
 
+#
+# Bulk counterparts of the stable theory templates, in which the
+# variable of an argument is its value.
+#
+
+def _stableLiterals(f, negated=False):
+    return _labelLiterals(len(f), 1, Label.In, negated)
+
+
+def bulk_stable_in_theory(f, attacker_arrays):
+    """Generate stable_in_theory for all arguments at once."""
+
+    return _attackersClauses(attacker_arrays, _stableLiterals(f),
+                             _stableLiterals(f))
+
+
+def bulk_stable_out_theory(f, attacker_arrays):
+    """Generate stable_out_theory for all arguments at once."""
+
+    negated = _stableLiterals(f, negated=True)
+    targets, attackers = _attackColumns(attacker_arrays, negated, negated)
+    return _binaryClauses(attackers, targets)
+
+
 # A parser instance for encoding stable semantics
 
 
-stable_theories = CNFTheory.fromTemplates(stable_in_theory, stable_out_theory)
+stable_theories = [CNFTheory(stable_in_theory, bulk_stable_in_theory),
+                   CNFTheory(stable_out_theory, bulk_stable_out_theory)]
 
-stableLabellingParser = DIMACSParser(*stable_theories, vars_per_argument=1)
+stableLabellingParser = DIMACSParser(*stable_theories, vars_per_argument=1,
+                                     grounded_reducible=True)
@@ -15,6 +15,11 @@
 
 """This method provides some misc. untilities to solved-af."""
 
+import sys
+import weakref
+from collections import OrderedDict
+from functools import partial, wraps
+
 
 def flatten(list_to_flatten):
     # Credit to https://stackoverflow.com/a/952952/5065263
@@ -26,16 +31,248 @@ def flattenSet(set_to_flatten):
     return {item for sublist in set_to_flatten for item in sublist}
 
 
-def memoize(func):
-    # Credit to https://dbader.org/blog/python-memoization
-    cache = {}
+def valuesToMask(values):
+    """Convert a collection of argument values into an arbitrary
+        precision integer bitmask in which value v is bit v - 1.
+    """
+
+    mask = 0
+    for value in values:
+        mask |= 1 << (value - 1)
+    return mask
+
+
+def maskToValues(mask):
+    """Convert a bitmask made by valuesToMask back into the list of
+        argument values it represents (in ascending order).
+    """
+
+    # Scan the binary digits from the lowest bit, in time linear in the
+    # length of the mask rather than in its number of bits times that
+    bits = bin(mask)[:1:-1]
+    values = []
+    value = bits.find('1')
+    while value != -1:
+        values.append(value + 1)
+        value = bits.find('1', value + 1)
+    return values
+
+
+# The number of entries a memoization cache holds by default.
+DEFAULT_CACHE_SIZE = 4096
+
+# Caches of the (unscoped) memoized functions, by function name.
+_caches = {}
+
+# The cache scopes of objects (e.g., frameworks), by owner.
+_scopes = weakref.WeakKeyDictionary()
+
+
+class LRUCache:
+    """A cache bounded by its number of entries and/or their size in
+        bytes, evicting the least recently used entries first. It counts
+        its hits, misses and evictions.
+
+        The size of an entry is the shallow size (sys.getsizeof) of its
+        key and value, so a byte bound is an approximation.
+    """
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE, maxbytes=None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @staticmethod
+    def _sizeOf(key, value):
+        return sys.getsizeof(key) + sys.getsizeof(value)
+
+    def get(self, key, default=None):
+        """Get the value cached for a key, marking it as the most
+            recently used, or default if there is none.
+        """
 
-    def memoized_func(*args):
         try:
-            return cache[args]
+            value = self._entries[key]
         except KeyError:
-            result = func(*args)
-            cache[args] = result
+            self.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Cache the value of a key, evicting the least recently used
+            entries if the cache overflows its bounds.
+        """
+
+        if key in self._entries:
+            self._bytes -= self._sizeOf(key, self._entries.pop(key))
+
+        self._bytes += self._sizeOf(key, value)
+        self._entries[key] = value
+
+        while self._entries and (
+                (self.maxsize is not None and
+                 len(self._entries) > self.maxsize) or
+                (self.maxbytes is not None and self._bytes > self.maxbytes)):
+            old_key, old_value = self._entries.popitem(last=False)
+            self._bytes -= self._sizeOf(old_key, old_value)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self):
+        """Get the counters and current size of the cache.
+
+        Returns:
+            Dict[str, int] -- the hits, misses, evictions, number of
+                entries and (approximate) bytes of the cache
+        """
+
+        return {'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'entries': len(self._entries),
+                'bytes': self._bytes}
+
+
+class CacheScope:
+    """The memoization caches of an owner object (e.g., a framework),
+        one per memoized function, which are dropped with the owner.
+    """
+
+    def __init__(self):
+        self._caches = {}
+
+    def getCache(self, name, maxsize=DEFAULT_CACHE_SIZE, maxbytes=None):
+        cache = self._caches.get(name)
+        if cache is None:
+            cache = self._caches[name] = LRUCache(maxsize, maxbytes)
+        return cache
+
+    def clear(self):
+        for cache in self._caches.values():
+            cache.clear()
+        self._caches.clear()
+
+    def stats(self):
+        return {name: cache.stats() for name, cache in self._caches.items()}
+
+
+def getCacheScope(owner):
+    """Get the cache scope of an object, creating it if needed. The
+        scope is released once the object is garbage collected, which
+        requires that no value cached in it refers back to the object.
+    """
+
+    scope = _scopes.get(owner)
+    if scope is None:
+        scope = _scopes[owner] = CacheScope()
+    return scope
+
+
+def releaseCacheScope(owner):
+    """Clear and drop the cache scope of an object (if it has one)."""
+
+    scope = _scopes.pop(owner, None)
+    if scope is not None:
+        scope.clear()
+
+
+def getCacheStats():
+    """Get the counters of the caches of all memoized functions which
+        are not scoped.
+
+    Returns:
+        Dict[str, Dict[str, int]] -- the stats of each cache by the name
+            of its function
+    """
+
+    return {name: cache.stats() for name, cache in _caches.items()}
+
+
+def getScopedCacheStats():
+    """Get the counters of the caches of all scoped memoized functions,
+        summed over the cache scopes alive.
+
+    Returns:
+        Dict[str, Dict[str, int]] -- the stats of each function's caches
+            by the name of the function
+    """
+
+    totals = {}
+    for scope in list(_scopes.values()):
+        for name, stats in scope.stats().items():
+            function_totals = totals.setdefault(name, dict.fromkeys(stats, 0))
+            for key, value in stats.items():
+                function_totals[key] += value
+    return totals
+
+
+def clearCaches():
+    """Clear the caches of all memoized functions which are not scoped
+        and all cache scopes.
+    """
+
+    for cache in _caches.values():
+        cache.clear()
+    for scope in list(_scopes.values()):
+        scope.clear()
+    _scopes.clear()
+
+
+def memoize(func=None, *, maxsize=DEFAULT_CACHE_SIZE, maxbytes=None,
+            scoped=False):
+    """Memoize a function in a bounded LRU cache. Use as a bare
+        decorator or with keyword arguments.
+
+    Keyword Arguments:
+        maxsize {int} -- the maximal number of entries of the cache;
+            None indicates no bound (default: {DEFAULT_CACHE_SIZE})
+        maxbytes {int} -- the maximal (approximate) size in bytes of
+            the cache; None indicates no bound (default: {None})
+        scoped {bool} -- whether to cache in the scope of the first
+            argument (e.g., a framework), so that its entries are
+            released with it, rather than in one cache of the function
+            (default: {False})
+    """
+
+    if func is None:
+        return partial(memoize, maxsize=maxsize, maxbytes=maxbytes,
+                       scoped=scoped)
+
+    name = F'{func.__module__}.{func.__qualname__}'
+    missing = object()
+
+    if scoped:
+        def memoized_func(owner, *args):
+            cache = getCacheScope(owner).getCache(name, maxsize, maxbytes)
+            result = cache.get(args, missing)
+            if result is missing:
+                result = func(owner, *args)
+                cache.put(args, result)
             return result
+    else:
+        cache = _caches[name] = LRUCache(maxsize, maxbytes)
+
+        def memoized_func(*args):
+            result = cache.get(args, missing)
+            if result is missing:
+                result = func(*args)
+                cache.put(args, result)
+            return result
+
+        memoized_func.cache = cache
 
-    return memoized_func
+    return wraps(func)(memoized_func)
@@ -0,0 +1,64 @@
+# Solved-AF -- Copyright (C) 2020  David Simon Tetruashvili
+
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""A brute-force SAT solver for small CNFs, used by the tests as an
+    oracle and, run as a script, as a stand-in for the external SAT
+    solver command where glucose-syrup is not installed. As a script it
+    reads DIMACS from stdin and answers as glucose-syrup -model does.
+"""
+
+import itertools
+import sys
+
+
+def bruteForceModels(num_of_vars, clauses):
+    """Iterate over all models of a CNF, as lists of literals."""
+
+    for values in itertools.product((False, True), repeat=num_of_vars):
+        if all(any(values[abs(lit) - 1] == (lit > 0) for lit in clause)
+               for clause in clauses):
+            yield [var if values[var - 1] else -var
+                   for var in range(1, num_of_vars + 1)]
+
+
+def parseDIMACS(text):
+    """Parse a DIMACS CNF into its number of variables and clauses."""
+
+    tokens = text.split()
+    header = tokens.index('p')
+    num_of_vars = int(tokens[header + 2])
+    clauses, clause = [], []
+    for lit in map(int, tokens[header + 4:]):
+        if lit:
+            clause.append(lit)
+        else:
+            clauses.append(clause)
+            clause = []
+    return num_of_vars, clauses
+
+
+def main():
+    num_of_vars, clauses = parseDIMACS(sys.stdin.read())
+    model = next(bruteForceModels(num_of_vars, clauses), None)
+    if model is None:
+        print('s UNSATISFIABLE')
+        sys.exit(20)
+    print('s SATISFIABLE')
+    print('v ' + ' '.join(map(str, model)) + ' 0')
+    sys.exit(10)
+
+
+if __name__ == "__main__":
+    main()
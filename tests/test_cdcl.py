@@ -0,0 +1,241 @@
+# Solved-AF -- Copyright (C) 2020  David Simon Tetruashvili
+
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests of the in-process CDCL solver (saf.cdcl) against brute force,
+    and of the agreement of the cdcl and external backends on every
+    task.
+"""
+
+import contextlib
+import io
+import os
+import random
+import shutil
+import sys
+import unittest
+
+import saf.tasks as tasks
+from saf.cdcl import CDCLSolver
+from saf.framework import ListGraphFramework
+
+sys.path.insert(0, os.path.dirname(__file__))
+from bruteforce_solver import bruteForceModels  # noqa: E402
+
+SEEDS = 200
+
+
+def randomCNF(rng, num_of_vars, num_of_clauses, max_width=3):
+    return [[rng.choice((-1, 1)) * rng.randint(1, num_of_vars)
+             for _ in range(rng.randint(1, max_width))]
+            for _ in range(num_of_clauses)]
+
+
+def isModel(model, clauses):
+    assigned = set(model)
+    return all(any(lit in assigned for lit in clause) for clause in clauses)
+
+
+def solverOf(num_of_vars, clauses):
+    solver = CDCLSolver(num_of_vars)
+    for clause in clauses:
+        solver.addClause(clause)
+    return solver
+
+
+class CDCLSolverTest(unittest.TestCase):
+
+    def testSatisfiabilityAgainstBruteForce(self):
+        for seed in range(SEEDS):
+            rng = random.Random(seed)
+            num_of_vars = rng.randint(1, 10)
+            clauses = randomCNF(rng, num_of_vars,
+                                rng.randint(1, 5 * num_of_vars))
+            solver = solverOf(num_of_vars, clauses)
+
+            expected = next(bruteForceModels(num_of_vars, clauses),
+                            None) is not None
+            self.assertEqual(solver.solve(), expected, seed)
+            if expected:
+                self.assertTrue(isModel(solver.getModel(), clauses), seed)
+            else:
+                self.assertIsNone(solver.getModel())
+
+    def testEmptyClauseIsUnsatisfiable(self):
+        solver = CDCLSolver(2)
+        solver.addClause([1, 2])
+        self.assertFalse(solver.addClause([]))
+        self.assertFalse(solver.solve())
+
+    def testIncrementalClausesEnumerateAllModels(self):
+        for seed in range(SEEDS // 4):
+            rng = random.Random(seed)
+            num_of_vars = rng.randint(1, 7)
+            clauses = randomCNF(rng, num_of_vars,
+                                rng.randint(1, 3 * num_of_vars))
+            solver = solverOf(num_of_vars, clauses)
+
+            # Block each model found until there are none left
+            models = set()
+            while solver.solve():
+                model = solver.getModel()
+                self.assertTrue(isModel(model, clauses), seed)
+                models.add(tuple(model))
+                blocking = [-lit for lit in model]
+                clauses.append(blocking)
+                solver.addClause(blocking)
+
+            expected = {tuple(model) for model in bruteForceModels(
+                num_of_vars, clauses[:len(clauses) - len(models)])}
+            self.assertEqual(models, expected, seed)
+
+    def testClausesOverNewVariables(self):
+        solver = CDCLSolver(1)
+        solver.addClause([1])
+        self.assertTrue(solver.solve())
+        solver.addClause([-1, 3])
+        solver.addClause([-3, -2])
+        self.assertTrue(solver.solve())
+        self.assertEqual(solver.getModel(), [1, -2, 3])
+
+    def testAssumptions(self):
+        for seed in range(SEEDS):
+            rng = random.Random(seed)
+            num_of_vars = rng.randint(1, 9)
+            clauses = randomCNF(rng, num_of_vars,
+                                rng.randint(1, 4 * num_of_vars))
+            solver = solverOf(num_of_vars, clauses)
+            satisfiable = solver.solve()
+
+            for _ in range(5):
+                assumptions = [rng.choice((-1, 1)) * var for var in
+                               rng.sample(range(1, num_of_vars + 1),
+                                          rng.randint(1, num_of_vars))]
+                constrained = clauses + [[lit] for lit in assumptions]
+                expected = next(bruteForceModels(num_of_vars, constrained),
+                                None) is not None
+
+                self.assertEqual(solver.solve(assumptions), expected, seed)
+                if expected:
+                    self.assertTrue(
+                        isModel(solver.getModel(), constrained), seed)
+
+            # The assumptions only hold for their own call
+            self.assertEqual(solver.solve(), satisfiable, seed)
+
+    def testInterruptedSearchResumes(self):
+        for seed in range(SEEDS // 4):
+            rng = random.Random(seed)
+            clauses = randomCNF(rng, 30, 128, max_width=3)
+            solver = solverOf(30, clauses)
+            expected = solverOf(30, clauses).solve()
+
+            # Unless the clauses are refuted as they are added
+            self.assertIn(solver.solve(interrupt=lambda: True),
+                          (None, expected), seed)
+            self.assertEqual(solver.solve(), expected, seed)
+            if expected:
+                self.assertTrue(isModel(solver.getModel(), clauses), seed)
+
+
+def randomFramework(rng, num_of_arguments, attack_probability=0.3):
+    arguments = [F'a{i}' for i in range(num_of_arguments)]
+    attacks = [(attacker, attacked) for attacker in arguments
+               for attacked in arguments
+               if rng.random() < attack_probability]
+    return ListGraphFramework(arguments, attacks)
+
+
+class BackendAgreementTest(unittest.TestCase):
+    """Solve every task with the cdcl and the external backend. The
+        external backend runs glucose-syrup where it is installed and
+        the brute-force solver otherwise.
+    """
+
+    def setUp(self):
+        self._previous_backend = tasks.getSolverBackend()
+        if shutil.which(tasks.SAT_COMMAND[0]):
+            command = None
+        else:
+            command = [sys.executable, os.path.join(
+                os.path.dirname(__file__), 'bruteforce_solver.py')]
+        self.external = tasks.ExternalSolverBackend(command)
+
+    def tearDown(self):
+        tasks.setSolverBackend(self._previous_backend)
+
+    def solve(self, backend, framework, task_name, argument=None):
+        tasks.setSolverBackend(backend)
+        framework.release()
+        solution = tasks.solveTask(framework, task_name, argument)
+        if task_name.startswith('EE'):
+            return {frozenset(extension) for extension in solution}
+        if task_name.startswith('SE') and solution is not None:
+            return frozenset(solution)
+        return solution
+
+    def testTaskTable(self):
+        for seed in range(6):
+            rng = random.Random(seed)
+            framework = randomFramework(rng, rng.randint(1, 4))
+            arguments = framework.valuesToArguments(list(framework))
+
+            extensions = {}
+            for task_name in tasks.getTasks():
+                if task_name.startswith('EE'):
+                    extensions[task_name[3:]] = solution = self.solve(
+                        'cdcl', framework, task_name)
+                    self.assertEqual(
+                        self.solve(self.external, framework, task_name),
+                        solution, (seed, task_name))
+
+            for task_name in tasks.getTasks():
+                task_type, name = task_name[:2], task_name[3:]
+                if task_type == 'SE':
+                    solutions = [self.solve(backend, framework, task_name)
+                                 for backend in ('cdcl', self.external)]
+                    for solution in solutions:
+                        if name not in extensions:
+                            # The unique extension, e.g., the grounded one
+                            self.assertEqual(solution, solutions[0],
+                                             (seed, task_name))
+                        elif extensions[name]:
+                            self.assertIn(solution, extensions[name],
+                                          (seed, task_name))
+                        else:
+                            self.assertIsNone(solution, (seed, task_name))
+                elif task_type != 'EE':
+                    for argument in arguments:
+                        self.assertEqual(
+                            self.solve(self.external, framework, task_name,
+                                       argument),
+                            self.solve('cdcl', framework, task_name,
+                                       argument),
+                            (seed, task_name, argument))
+    def testIncompleteAssignmentNamesTheCommandRun(self):
+        # A solver claiming a model without outputting one
+        command = [sys.executable, '-c', 'print("s SATISFIABLE"); exit(10)']
+        tasks.setSolverBackend(tasks.ExternalSolverBackend(command))
+        framework = ListGraphFramework(['a'], [])
+
+        errors = io.StringIO()
+        with contextlib.redirect_stderr(errors), \
+                self.assertRaises(SystemExit):
+            tasks.solveTask(framework, 'SE-PR')
+        self.assertIn('internal error. The SAT solver command '
+                      F"'{' '.join(command)}'", errors.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
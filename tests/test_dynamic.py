@@ -0,0 +1,153 @@
+# Solved-AF -- Copyright (C) 2020  David Simon Tetruashvili
+
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests of the dynamic frameworks (saf.dynamic): after every edit, the
+    solutions reused across edits must be those of the framework solved
+    from scratch.
+"""
+
+import random
+import unittest
+
+import saf.dynamic as dynamic
+import saf.tasks as tasks
+from saf.dynamic import DynamicFramework
+from saf.framework import ListGraphFramework
+
+SEEDS = 40
+EDITS = 25
+
+
+def namedAttacks(framework):
+    return [framework.valuesToArguments(attack)
+            for attack in framework.getAttacks()]
+
+
+def randomEdit(rng, framework, names):
+    """Make a random edit of a framework, and describe it."""
+
+    arguments = framework.valuesToArguments(list(framework))
+    edit = rng.random()
+    if edit < 0.2 or not arguments:
+        argument = F'n{next(names)}'
+        framework.addArgument(argument)
+        return ('add argument', argument)
+    if edit < 0.35:
+        # Half of the time, the argument with the last value
+        argument = arguments[-1] if rng.random() < 0.5 else \
+            rng.choice(arguments)
+        framework.removeArgument(argument)
+        return ('remove argument', argument)
+    if edit < 0.75:
+        # Self-attacks included
+        attack = (rng.choice(arguments), rng.choice(arguments))
+        framework.addAttack(*attack)
+        return ('add attack', attack)
+
+    attacks = namedAttacks(framework)
+    if not attacks:
+        return ('none',)
+    attack = rng.choice(attacks)
+    framework.removeAttack(*attack)
+    return ('remove attack', tuple(attack))
+
+
+class DynamicFrameworkTest(unittest.TestCase):
+
+    def setUp(self):
+        self._previous_backend = tasks.getSolverBackend()
+        tasks.setSolverBackend('cdcl')
+
+    def tearDown(self):
+        tasks.setSolverBackend(self._previous_backend)
+
+    def assertSolvedAsFromScratch(self, framework, context):
+        arguments = framework.valuesToArguments(list(framework))
+        fresh = ListGraphFramework(list(arguments), namedAttacks(framework))
+
+        extensions = {}
+        for task_name in tasks.getTasks():
+            if task_name.startswith('EE'):
+                solution = {frozenset(extension) for extension
+                            in dynamic.solveTask(framework, task_name)}
+                extensions[task_name[3:]] = solution
+                self.assertEqual(
+                    solution,
+                    {frozenset(extension) for extension
+                     in tasks.solveTask(fresh, task_name)},
+                    (context, task_name))
+
+        for task_name in tasks.getTasks():
+            task_type, semantics = task_name[:2], task_name[3:]
+            if task_type == 'SE':
+                solution = dynamic.solveTask(framework, task_name)
+                expected = tasks.solveTask(fresh, task_name)
+                if semantics not in extensions:
+                    # The unique extension, e.g., the grounded one
+                    self.assertEqual(sorted(solution), sorted(expected),
+                                     (context, task_name))
+                elif expected is None:
+                    self.assertIsNone(solution, (context, task_name))
+                else:
+                    self.assertIn(frozenset(solution), extensions[semantics],
+                                  (context, task_name))
+            elif task_type != 'EE':
+                for argument in arguments:
+                    self.assertEqual(
+                        dynamic.solveTask(framework, task_name, argument),
+                        tasks.solveTask(fresh, task_name, argument),
+                        (context, task_name, argument))
+
+    def testRandomEditsAgainstFromScratch(self):
+        for seed in range(SEEDS):
+            rng = random.Random(seed)
+            names = iter(range(EDITS))
+            arguments = [F'a{i}' for i in range(rng.randint(1, 5))]
+            attacks = [(attacker, attacked) for attacker in arguments
+                       for attacked in arguments if rng.random() < 0.25]
+            framework = DynamicFramework(arguments, attacks)
+            self.assertSolvedAsFromScratch(framework, (seed, 'initial'))
+
+            for _ in range(EDITS):
+                edit = randomEdit(rng, framework, names)
+                self.assertSolvedAsFromScratch(framework, (seed, edit))
+
+    def testSelfAttackAndRemovingTheLastArgument(self):
+        framework = DynamicFramework(['a', 'b', 'c'],
+                                     [('a', 'b'), ('b', 'c')])
+        self.assertSolvedAsFromScratch(framework, 'initial')
+
+        framework.addAttack('a', 'a')
+        self.assertSolvedAsFromScratch(framework, 'self-attack')
+
+        # The last-valued argument, so none is moved
+        framework.removeArgument('c')
+        self.assertSolvedAsFromScratch(framework, 'remove c')
+
+        framework.addArgument('d')
+        framework.addAttack('d', 'd')
+        framework.addAttack('d', 'b')
+        self.assertSolvedAsFromScratch(framework, 'self-attacking d')
+
+        # The last-valued argument is moved to the removed one's value
+        framework.removeArgument('a')
+        self.assertSolvedAsFromScratch(framework, 'remove a')
+
+        framework.removeAttack('d', 'd')
+        self.assertSolvedAsFromScratch(framework, 'remove d attacks d')
+
+
+if __name__ == "__main__":
+    unittest.main()